@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Pre-aggregated data build for the LeetGPU stats dashboard.
+
+stats.html used to fetch the whole results file and recompute wins, completion
+counts and averages in the browser on every load. This script does that work
+once and writes:
+
+    dashboard_data/summary.json              challenge list, per framework/GPU
+                                             wins, valid counts and averages
+    dashboard_data/challenges/<name>.json    one challenge's framework x GPU matrix
+
+The dashboard loads the summary on first paint and fetches a challenge file only
+when that challenge is selected. It falls back to the full results file when
+dashboard_data/ is missing.
+
+Usage:
+    python build_dashboard_data.py all_challenges_results_<timestamp>.json [output_dir]
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+from compact_results import load_results
+from tensor_analytics import ResultsTensor
+
+DEFAULT_OUTPUT_DIR = "dashboard_data"
+FORMAT = "leetgpu-dashboard-v1"
+
+
+def display_title(title, name):
+    """Second line of the scraped title (the first one is the difficulty)"""
+    if not title:
+        return name
+    parts = title.split("\n")
+    return parts[1] if len(parts) > 1 else parts[0]
+
+
+def _nested(tensor, values):
+    """framework -> gpu -> value, with None for NaN"""
+    return {
+        fw: {
+            gpu: None if np.isnan(values[f, g]) else values[f, g].item()
+            for g, gpu in enumerate(tensor.gpus)
+        }
+        for f, fw in enumerate(tensor.frameworks)
+    }
+
+
+def build_summary(tensor):
+    """Same aggregates processComprehensiveData() computed in the browser"""
+    return {
+        "wins": _nested(tensor, tensor.win_counts()),
+        "successCounts": _nested(tensor, tensor.success_counts()),
+        "avgTimes": _nested(tensor, tensor.mean_times()),
+    }
+
+
+def build_challenge_matrix(tensor, c):
+    """fastest_ms[framework][gpu] rows for one challenge, None where missing"""
+    return [
+        [None if np.isnan(v) else v.item() for v in row] for row in tensor.times[c]
+    ]
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def build(source, output_dir=DEFAULT_OUTPUT_DIR):
+    """Write summary.json and one file per challenge; returns the summary"""
+    data = load_results(source)
+    tensor = ResultsTensor.from_results(data["results"])
+    titles = {c["name"]: c["title"] for c in data.get("challenges", [])}
+
+    challenge_dir = os.path.join(output_dir, "challenges")
+    os.makedirs(challenge_dir, exist_ok=True)
+
+    challenges = []
+    for c, name in enumerate(tensor.challenges):
+        title = display_title(titles.get(name) or tensor.titles.get(name), name)
+        challenges.append({"name": name, "title": title})
+        write_json(
+            os.path.join(challenge_dir, f"{name}.json"),
+            {
+                "name": name,
+                "title": title,
+                "fastest_ms": build_challenge_matrix(tensor, c),
+            },
+        )
+
+    summary = {
+        "format": FORMAT,
+        "collection_timestamp": data.get("collection_timestamp"),
+        "frameworks": tensor.frameworks,
+        "gpus": tensor.gpus,
+        "total_results": len(data["results"]),
+        "successful_results": int(tensor.valid.sum()),
+        "challenges": challenges,
+        **build_summary(tensor),
+    }
+    write_json(os.path.join(output_dir, "summary.json"), summary)
+    return summary
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python build_dashboard_data.py <results.json> [output_dir]")
+        sys.exit(1)
+
+    source = sys.argv[1]
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUTPUT_DIR
+
+    summary = build(source, output_dir)
+    summary_size = os.path.getsize(os.path.join(output_dir, "summary.json"))
+    print(f"📦 {len(summary['challenges'])} challenge files -> {output_dir}/challenges/")
+    print(f"📊 summary.json: {summary_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Normalized, compact storage format for LeetGPU results.
+
+The full results JSON repeats the whole challenge statement, URL and an ISO
+timestamp on every row. The compact format writes the challenges, frameworks and
+GPUs once and stores the results as integer-keyed columns:
+
+    {
+      "format": "leetgpu-compact-v1",
+      "collection_timestamp": "...",
+      "time_base": "<ISO timestamp of the earliest result>",
+      "challenges": [{"name", "url", "title"}, ...],
+      "frameworks": [...], "gpus": [...], "units": [...],
+      "columns": {
+        "challenge": [...],    index into challenges
+        "framework": [...],    index into frameworks
+        "gpu": [...],          index into gpus
+        "combination": [...],  combination_number
+        "ms": [...],           fastest_ms at float32 precision, null if missing
+        "unit": [...],         index into units of the original fastest_time
+        "timings": [...],      total_timings_found
+        "flags": [...],        bit 0 framework_selected, bit 1 gpu_selected
+        "time_us": [...]       microseconds after time_base
+      }
+    }
+
+Per-cell fields that only some runs produce are stored as optional columns,
+present only when at least one result has the field, null where a row lacks it:
+
+        "entries": [...]             leaderboard_entries, unchanged
+        "median_ms": [...]           median_ms
+        "top10_spread_ms": [...]     top10_spread_ms
+        "webdriver_commands": [...]  webdriver_commands
+
+load_results() reads either format and returns the usual dict shape.
+
+Usage:
+    python compact_results.py all_challenges_results_<timestamp>.json
+"""
+
+import json
+import os
+import struct
+import sys
+from datetime import datetime, timedelta
+
+from network_capture import UNIT_TO_MS
+
+FORMAT = "leetgpu-compact-v1"
+
+FLAG_FRAMEWORK_SELECTED = 1
+FLAG_GPU_SELECTED = 2
+
+# Optional column -> result key
+OPTIONAL_COLUMNS = {
+    "entries": "leaderboard_entries",
+    "median_ms": "median_ms",
+    "top10_spread_ms": "top10_spread_ms",
+    "webdriver_commands": "webdriver_commands",
+}
+
+
+def round_float32(value):
+    """Round to float32 precision and back to the shortest decimal"""
+    return float("%.7g" % struct.unpack("f", struct.pack("f", value))[0])
+
+
+def _index(table, lookup, value):
+    if value not in lookup:
+        lookup[value] = len(table)
+        table.append(value)
+    return lookup[value]
+
+
+def compact_path(json_file):
+    """Compact file name that sits next to a full results JSON"""
+    return os.path.splitext(json_file)[0] + ".compact.json"
+
+
+def to_compact(challenges, results, collection_timestamp=None, frameworks=(), gpus=()):
+    """Build the compact representation of a results set"""
+    challenge_table = [
+        {"name": c["name"], "url": c["url"], "title": c["title"]} for c in challenges
+    ]
+    challenge_ids = {c["name"]: i for i, c in enumerate(challenge_table)}
+    framework_table, framework_ids = list(frameworks), {f: i for i, f in enumerate(frameworks)}
+    gpu_table, gpu_ids = list(gpus), {g: i for i, g in enumerate(gpus)}
+    unit_table, unit_ids = [], {}
+
+    stamps = [datetime.fromisoformat(r["timestamp"]) for r in results]
+    time_base = min(stamps) if stamps else datetime.now()
+
+    columns = {
+        "challenge": [],
+        "framework": [],
+        "gpu": [],
+        "combination": [],
+        "ms": [],
+        "unit": [],
+        "timings": [],
+        "flags": [],
+        "time_us": [],
+    }
+    for column, key in OPTIONAL_COLUMNS.items():
+        if any(key in r for r in results):
+            columns[column] = [r.get(key) for r in results]
+
+    for result, stamp in zip(results, stamps):
+        name = result["challenge_name"]
+        if name not in challenge_ids:
+            # Results for a challenge missing from the table keep their own details
+            challenge_ids[name] = len(challenge_table)
+            challenge_table.append(
+                {"name": name, "url": result["challenge_url"], "title": result["challenge_title"]}
+            )
+
+        unit = result["fastest_time"].split()[-1] if result["fastest_time"] else None
+        columns["challenge"].append(challenge_ids[name])
+        columns["framework"].append(_index(framework_table, framework_ids, result["framework"]))
+        columns["gpu"].append(_index(gpu_table, gpu_ids, result["gpu"]))
+        columns["combination"].append(result["combination_number"])
+        columns["ms"].append(
+            round_float32(result["fastest_ms"]) if result["fastest_ms"] is not None else None
+        )
+        columns["unit"].append(_index(unit_table, unit_ids, unit) if unit else None)
+        columns["timings"].append(result["total_timings_found"])
+        columns["flags"].append(
+            (FLAG_FRAMEWORK_SELECTED if result["framework_selected"] else 0)
+            | (FLAG_GPU_SELECTED if result["gpu_selected"] else 0)
+        )
+        delta = stamp - time_base
+        columns["time_us"].append(
+            (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        )
+
+    return {
+        "format": FORMAT,
+        "collection_timestamp": collection_timestamp or datetime.now().isoformat(),
+        "time_base": time_base.isoformat(),
+        "challenges": challenge_table,
+        "frameworks": framework_table,
+        "gpus": gpu_table,
+        "units": unit_table,
+        "columns": columns,
+    }
+
+
+def from_compact(data):
+    """Rebuild the full results dict from the compact representation"""
+    challenges = data["challenges"]
+    frameworks = data["frameworks"]
+    gpus = data["gpus"]
+    units = data["units"]
+    time_base = datetime.fromisoformat(data["time_base"])
+    columns = data["columns"]
+
+    optional = [
+        (key, columns[column]) for column, key in OPTIONAL_COLUMNS.items() if column in columns
+    ]
+
+    results = []
+    for row, (c, f, g, combination, ms, unit, timings, flags, time_us) in enumerate(zip(
+        columns["challenge"],
+        columns["framework"],
+        columns["gpu"],
+        columns["combination"],
+        columns["ms"],
+        columns["unit"],
+        columns["timings"],
+        columns["flags"],
+        columns["time_us"],
+    )):
+        challenge = challenges[c]
+        fastest_time = None
+        if ms is not None and unit is not None:
+            unit_name = units[unit]
+            value = float("%.7g" % (ms / UNIT_TO_MS.get(unit_name, 1.0)))
+            fastest_time = f"{value} {unit_name}"
+        result = {
+            "challenge_name": challenge["name"],
+            "challenge_title": challenge["title"],
+            "challenge_url": challenge["url"],
+            "combination_number": combination,
+            "framework": frameworks[f],
+            "gpu": gpus[g],
+            "fastest_time": fastest_time,
+            "fastest_ms": ms,
+            "total_timings_found": timings,
+            "framework_selected": bool(flags & FLAG_FRAMEWORK_SELECTED),
+            "gpu_selected": bool(flags & FLAG_GPU_SELECTED),
+            "timestamp": (time_base + timedelta(microseconds=time_us)).isoformat(),
+        }
+        for key, values in optional:
+            if values[row] is not None:
+                result[key] = values[row]
+        results.append(result)
+
+    return {
+        "collection_timestamp": data["collection_timestamp"],
+        "total_challenges": len(challenges),
+        "total_combinations": len(results),
+        "challenges": challenges,
+        "results": results,
+    }
+
+
+def save_compact(path, challenges, results, collection_timestamp=None, frameworks=(), gpus=()):
+    """Write results in the compact format"""
+    data = to_compact(challenges, results, collection_timestamp, frameworks, gpus)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+
+def load_results(path):
+    """Load a full or compact results file as the full results dict"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("format") == FORMAT:
+        return from_compact(data)
+    return data
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python compact_results.py <results.json> [output.compact.json]")
+        sys.exit(1)
+
+    source = sys.argv[1]
+    target = sys.argv[2] if len(sys.argv) > 2 else compact_path(source)
+
+    data = load_results(source)
+    save_compact(
+        target, data["challenges"], data["results"], data.get("collection_timestamp")
+    )
+
+    before = os.path.getsize(source)
+    after = os.path.getsize(target)
+    print(f"💾 {source} ({before / 1024:.0f} KB) -> {target} ({after / 1024:.0f} KB)")
+    print(f"📉 {before / after:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Batched DOM snapshots for the LeetGPU scraper.
+
+Looking up the dropdowns one WebDriver call at a time (find_elements, then
+is_displayed and .text per button) costs dozens of round trips. SNAPSHOT_SCRIPT
+gathers the visible buttons, the framework/GPU dropdowns with their current
+selection, and the authentication state in a single execute_script call.
+"""
+
+GPU_MARKERS = ["NVIDIA", "Tesla", "T4", "RTX", "A100", "H100", "H200", "B200"]
+AUTH_PHRASES = ["Sign In To Continue", "Sign in with Github", "Login"]
+
+SNAPSHOT_SCRIPT = """
+const [frameworks, gpuMarkers, authPhrases] = arguments;
+const isVisible = el => {
+    const rect = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+};
+
+const buttons = [];
+let framework = null;
+let gpu = null;
+for (const el of document.getElementsByTagName('button')) {
+    const text = (el.innerText || '').trim();
+    if (!text || !isVisible(el)) continue;
+    buttons.push(text);
+    // The last matching button wins, as with the old per-element loop
+    if (frameworks.some(f => text.includes(f))) {
+        framework = {element: el, text: text};
+    } else if (gpuMarkers.some(g => text.includes(g))) {
+        gpu = {element: el, text: text};
+    }
+}
+
+const bodyText = document.body ? document.body.innerText : '';
+return {
+    buttons: buttons,
+    framework: framework,
+    gpu: gpu,
+    needsAuth: authPhrases.some(p => bodyText.includes(p))
+        || bodyText.toLowerCase().includes('authenticate')
+};
+"""
+
+
+def take_snapshot(driver, frameworks):
+    """Visible buttons, dropdowns and auth state in one round trip"""
+    try:
+        return driver.execute_script(SNAPSHOT_SCRIPT, frameworks, GPU_MARKERS, AUTH_PHRASES)
+    except Exception:
+        return {"buttons": [], "framework": None, "gpu": None, "needsAuth": True}
+
+
+class WebDriverCommandCounter:
+    """Count every command a driver (and its elements) sends to chromedriver"""
+
+    def __init__(self, driver):
+        self.count = 0
+        original_execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.count += 1
+            return original_execute(driver_command, params)
+
+        # WebElement commands go through their parent driver's execute()
+        driver.execute = counted_execute
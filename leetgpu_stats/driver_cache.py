@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Fast, offline-capable Chrome startup for the LeetGPU scraper.
+
+- The chromedriver path resolved by webdriver-manager is cached locally and
+  reused as long as its major version matches the installed Chrome; both
+  versions are read from the binaries, so no network access is needed.
+- A persistent user-data-dir keeps the GitHub/LeetGPU session between runs.
+- Session cookies are also saved to a file and loaded into fresh profiles, so
+  headless runs and worker drivers can skip the interactive login.
+"""
+
+import json
+import os
+import re
+import subprocess
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "leetgpu_stats")
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+DEFAULT_PROFILE_DIR = os.path.join(CACHE_DIR, "chrome-profile")
+DEFAULT_COOKIE_FILE = os.path.join(CACHE_DIR, "cookies.json")
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+# get_cookies() returns more keys (e.g. sameSite) than add_cookie() accepts
+COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry")
+
+
+def _binary_major_version(command):
+    """Major version printed by `<command> --version`, or None"""
+    try:
+        output = subprocess.run(
+            [command, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return int(match.group(1)) if match else None
+
+
+def local_chrome_major_version():
+    for binary in CHROME_BINARIES:
+        version = _binary_major_version(binary)
+        if version:
+            return version
+    return None
+
+
+def resolve_driver_path():
+    """Cached chromedriver path, falling back to webdriver-manager when stale"""
+    chrome_major = local_chrome_major_version()
+
+    try:
+        with open(DRIVER_CACHE_FILE) as f:
+            cached = json.load(f)
+        path = cached["path"]
+        if os.path.exists(path):
+            driver_major = _binary_major_version(path)
+            if chrome_major is None or driver_major == chrome_major:
+                return path
+            print(f"🔄 Cached chromedriver {driver_major} does not match Chrome {chrome_major}")
+    except (OSError, ValueError, KeyError):
+        pass
+
+    print("🌐 Resolving chromedriver (network)...")
+    path = ChromeDriverManager().install()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(DRIVER_CACHE_FILE, "w") as f:
+        json.dump({"path": path, "chrome_major": chrome_major}, f)
+    return path
+
+
+def save_cookies(driver, path=DEFAULT_COOKIE_FILE):
+    """Store the driver's cookies for later runs (readable by the owner only)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(driver.get_cookies(), f)
+
+
+def add_cookie(driver, cookie):
+    """Add an exported cookie to the driver's current page
+
+    Cookies can only be set for the domain that is currently loaded.
+    """
+    driver.add_cookie({k: v for k, v in cookie.items() if k in COOKIE_KEYS})
+
+
+def load_cookies(driver, origin, path=DEFAULT_COOKIE_FILE):
+    """Add saved cookies for origin's domain; returns how many were loaded"""
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        cookies = json.load(f)
+
+    driver.get(origin)
+    loaded = 0
+    for cookie in cookies:
+        try:
+            add_cookie(driver, cookie)
+            loaded += 1
+        except Exception:
+            continue
+    return loaded
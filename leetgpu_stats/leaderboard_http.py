@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Selenium-free leaderboard queries for LeetGPU.
+
+After the browser finishes the GitHub OAuth step its session cookies are handed
+to a pooled requests.Session, and every challenge x framework x GPU leaderboard
+is fetched directly with a bounded thread pool. Responses can be recorded to a
+directory and served back by RecordedLeaderboardServer for offline testing.
+
+    python leaderboard_http.py selfcheck
+
+runs the scraper's --http collection against a RecordedLeaderboardServer and
+checks the parsed results, without a browser or network access.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import quote, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from leaderboard_table import leaderboard_stats
+from local_server import LocalServer
+from network_capture import extract_entries
+
+DEFAULT_HTTP_WORKERS = 8
+
+# Only used by selfcheck; the real endpoint is not known and must be passed with
+# --endpoint-template after reading it from a --capture-network run
+EXAMPLE_ENDPOINT_TEMPLATE = (
+    "https://leetgpu.example/api/challenges/{challenge}/leaderboard"
+    "?language={framework}&gpu={gpu}"
+)
+
+
+def _request_key(url):
+    """Path and query of a URL, used to index recorded responses"""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class LeaderboardHttpClient:
+    """Fetch leaderboards over HTTP with the browser's authenticated cookies"""
+
+    def __init__(
+        self,
+        endpoint_template,
+        cookies=(),
+        max_workers=DEFAULT_HTTP_WORKERS,
+        timeout=15,
+        user_agent=None,
+        record_dir=None,
+    ):
+        self.endpoint_template = endpoint_template
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.record_dir = record_dir
+        self.record_lock = threading.Lock()
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+        if user_agent:
+            self.session.headers.update({"User-Agent": user_agent})
+
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def build_url(self, challenge_name, framework, gpu):
+        return self.endpoint_template.format(
+            challenge=quote(challenge_name, safe=""),
+            framework=quote(framework, safe=""),
+            gpu=quote(gpu, safe=""),
+        )
+
+    def fetch_cell(self, challenge, framework, gpu, combination_number):
+        """Fetch one leaderboard and return a result in the scraper's schema"""
+        url = self.build_url(challenge["name"], framework, gpu)
+        ok = False
+        entries = []
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            payload = response.json()
+            ok = True
+            entries = extract_entries(payload)
+            if self.record_dir:
+                self.save_recording(url, payload)
+        except (requests.RequestException, ValueError) as e:
+            print(f"  ❌ {challenge['name']} {framework} + {gpu}: {e}")
+
+        fastest = min(entries, key=lambda e: e["runtime_ms"]) if entries else None
+        return {
+            "challenge_name": challenge["name"],
+            "challenge_title": challenge["title"],
+            "challenge_url": challenge["url"],
+            "combination_number": combination_number,
+            "framework": framework,
+            "gpu": gpu,
+            "fastest_time": f"{fastest['runtime']} {fastest['unit']}" if fastest else None,
+            "fastest_ms": fastest["runtime_ms"] if fastest else None,
+            "total_timings_found": len(entries),
+            "framework_selected": ok,
+            "gpu_selected": ok,
+            "timestamp": datetime.now().isoformat(),
+            "leaderboard_entries": entries,
+            **leaderboard_stats(entries),
+        }
+
+    def fetch_all(self, challenges, frameworks, gpus, skip=(), on_result=None):
+        """Fetch every challenge x framework x GPU cell concurrently
+
+        Cells whose (challenge, framework, gpu) key is in skip are not fetched.
+        on_result is called with each result as soon as it arrives.
+        """
+        jobs = []
+        for challenge in challenges:
+            combination = 0
+            for framework in frameworks:
+                for gpu in gpus:
+                    combination += 1
+                    if (challenge["name"], framework, gpu) not in skip:
+                        jobs.append((challenge, framework, gpu, combination))
+
+        def run(job):
+            result = self.fetch_cell(*job)
+            if on_result:
+                on_result(result)
+            return result
+
+        print(f"🌐 Fetching {len(jobs)} leaderboards with {self.max_workers} threads...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # map() keeps results in job order
+            results = list(pool.map(run, jobs))
+
+        valid = sum(1 for r in results if r["fastest_ms"] is not None)
+        print(f"✅ HTTP fetch complete: {valid}/{len(results)} cells with data")
+        return results
+
+    def save_recording(self, url, payload):
+        """Store a response so RecordedLeaderboardServer can serve it later"""
+        key = _request_key(url)
+        with self.record_lock:
+            os.makedirs(self.record_dir, exist_ok=True)
+            index_path = os.path.join(self.record_dir, "index.json")
+            index = {}
+            if os.path.exists(index_path):
+                with open(index_path) as f:
+                    index = json.load(f)
+            filename = index.get(key, f"response_{len(index):05d}.json")
+            with open(os.path.join(self.record_dir, filename), "w") as f:
+                json.dump(payload, f)
+            index[key] = filename
+            with open(index_path, "w") as f:
+                json.dump(index, f, indent=2)
+
+
+class RecordedLeaderboardServer(LocalServer):
+    """Local HTTP stand-in that serves responses saved with record_dir"""
+
+    def __init__(self, record_dir, host="127.0.0.1", port=0):
+        with open(os.path.join(record_dir, "index.json")) as f:
+            index = json.load(f)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                filename = index.get(self.path)
+                if not filename:
+                    self.send_error(404)
+                    return
+                with open(os.path.join(record_dir, filename), "rb") as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        super().__init__(Handler, host, port)
+
+    def endpoint_template(self, template):
+        """Rewrite an endpoint template to point at this server"""
+        parts = urlsplit(template)
+        return self.base_url + template[len(f"{parts.scheme}://{parts.netloc}"):]
+
+
+class _RecordedSessionDriver:
+    """Stands in for the logged-in browser collect_http takes its cookies from"""
+
+    def get_cookies(self):
+        return [{"name": "session", "value": "recorded", "path": "/"}]
+
+    def execute_script(self, script):
+        return "leaderboard-http-selfcheck"
+
+    def quit(self):
+        pass
+
+
+def self_check():
+    """Run collect_http against recorded responses and check what it parsed"""
+    # Imported here: the scraper imports this module
+    from run_all_challenges_sequential import SequentialAllChallengesScraper
+
+    challenges = [
+        {"name": name, "title": name.replace("-", " ").title(), "url": f"/challenges/{name}"}
+        for name in ("vector-addition", "matrix-multiplication")
+    ]
+    payloads = {
+        ("vector-addition", "CUDA", "H100"): {
+            "data": [
+                {"rank": 1, "user": {"username": "ada"}, "runtime_ms": 0.0123},
+                {"rank": 2, "user": {"username": "grace"}, "runtime_ms": 0.05},
+                {"rank": 3, "user": {"username": "alan"}, "runtime_ms": 1.5},
+            ]
+        },
+        ("vector-addition", "Triton", "H100"): [{"username": "linus", "runtime": "850 μs"}],
+        ("matrix-multiplication", "CUDA", "H100"): {"entries": []},
+        # ("matrix-multiplication", "Triton", "H100") is not recorded -> HTTP 404
+    }
+    expected = {
+        ("vector-addition", "CUDA", "H100"): (0.0123, "0.0123 ms", 3, 0.05),
+        ("vector-addition", "Triton", "H100"): (0.85, "850.0 μs", 1, 0.85),
+        ("matrix-multiplication", "CUDA", "H100"): (None, None, 0, None),
+        ("matrix-multiplication", "Triton", "H100"): (None, None, 0, None),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        record_dir = os.path.join(directory, "recording")
+        recorder = LeaderboardHttpClient(EXAMPLE_ENDPOINT_TEMPLATE, record_dir=record_dir)
+        for (name, framework, gpu), payload in payloads.items():
+            recorder.save_recording(recorder.build_url(name, framework, gpu), payload)
+
+        with RecordedLeaderboardServer(record_dir) as server:
+            scraper = SequentialAllChallengesScraper(
+                http_mode=True,
+                endpoint_template=server.endpoint_template(EXAMPLE_ENDPOINT_TEMPLATE),
+                journal_path=os.path.join(directory, "selfcheck.jsonl"),
+                frameworks=["CUDA", "Triton"],
+                gpus=["H100"],
+                interactive=False,
+            )
+            scraper.challenges = challenges
+            scraper.driver = _RecordedSessionDriver()
+            scraper.collect_http()
+            scraper.journal.close()
+
+    got = {
+        (r["challenge_name"], r["framework"], r["gpu"]): (
+            r["fastest_ms"],
+            r["fastest_time"],
+            r["total_timings_found"],
+            r["median_ms"],
+        )
+        for r in scraper.all_results
+    }
+    failures = [
+        f"{' + '.join(cell)}: expected {want}, got {got.get(cell)}"
+        for cell, want in expected.items()
+        if got.get(cell) != want
+    ]
+    if len(scraper.all_results) != len(expected):
+        failures.append(f"expected {len(expected)} results, got {len(scraper.all_results)}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print(f"✅ HTTP mode parsed all {len(expected)} recorded cells correctly")
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Selenium-free LeetGPU leaderboard queries")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("selfcheck", help="check --http collection against recorded responses")
+    parser.parse_args()
+
+    if not self_check():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
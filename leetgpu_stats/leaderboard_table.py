@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Scoped, single-pass extraction of the LeetGPU leaderboard table.
+
+One execute_script call returns the cell texts of the leaderboard rows only,
+and one compiled pattern pulls the runtime and unit out of each row. Every
+entry is kept so distribution statistics can be computed, not just the
+fastest time.
+"""
+
+import re
+import statistics
+
+from network_capture import runtime_to_ms
+
+RUNTIME_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|μs|µs|us|ns)\b", re.IGNORECASE)
+RANK_PATTERN = re.compile(r"^#?(\d+)\.?$")
+
+# Sets `table` to the first table that holds runtimes. Falls back to ARIA
+# tables for leaderboards that are not rendered as a <table>.
+FIND_TABLE_SCRIPT = """
+const unit = /\\d\\s*(ms|μs|µs|us|ns)\\b/i;
+const tables = [...document.querySelectorAll('table, [role="table"], [role="grid"]')];
+const table = tables.find(t => unit.test(t.innerText));
+"""
+
+# Returns the cell texts of the leaderboard rows, or null
+TABLE_SCRIPT = FIND_TABLE_SCRIPT + """
+if (!table) return null;
+const rows = table.querySelectorAll('tr, [role="row"]');
+return [...rows].map(row =>
+    [...row.querySelectorAll('td, th, [role="cell"], [role="gridcell"]')]
+        .map(cell => cell.innerText.trim())
+);
+"""
+
+# outerHTML of the table TABLE_SCRIPT reads, or null
+TABLE_HTML_SCRIPT = FIND_TABLE_SCRIPT + """
+return table ? table.outerHTML : null;
+"""
+
+
+def parse_leaderboard_rows(rows):
+    """Parse table rows (lists of cell texts) into leaderboard entries"""
+    entries = []
+    for cells in rows or []:
+        runtime = None
+        rank = None
+        user = None
+        for cell in cells:
+            if runtime is None:
+                match = RUNTIME_PATTERN.search(cell)
+                if match:
+                    runtime = (float(match.group(1)), match.group(2).lower())
+                    continue
+            if rank is None:
+                rank_match = RANK_PATTERN.match(cell)
+                if rank_match:
+                    rank = int(rank_match.group(1))
+                    continue
+            if user is None and cell:
+                user = cell
+
+        # Header and placeholder rows carry no runtime
+        if runtime is None:
+            continue
+        value, unit = runtime
+        entries.append(
+            {
+                "rank": rank if rank is not None else len(entries) + 1,
+                "user": user,
+                "runtime": value,
+                "unit": unit,
+                "runtime_ms": runtime_to_ms(value, unit),
+            }
+        )
+    return entries
+
+
+def parse_page_text(text):
+    """Every runtime in free text, in one pass - fallback when no table is found"""
+    entries = []
+    for value, unit in RUNTIME_PATTERN.findall(text):
+        value, unit = float(value), unit.lower()
+        entries.append({"runtime": value, "unit": unit, "runtime_ms": runtime_to_ms(value, unit)})
+    return entries
+
+
+def leaderboard_stats(entries):
+    """Median and top-10 spread of a leaderboard, in milliseconds"""
+    times = sorted(e["runtime_ms"] for e in entries)
+    if not times:
+        return {"median_ms": None, "top10_spread_ms": None}
+    top = times[:10]
+    return {
+        "median_ms": statistics.median(times),
+        "top10_spread_ms": top[-1] - top[0],
+    }
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Lean page loads for the LeetGPU browser session.
+
+The scraper only reads the React-rendered buttons and the leaderboard table,
+yet every navigation also pulled in images, web fonts, media and analytics
+scripts. Lean mode:
+
+- sets the eager page-load strategy, so driver.get() returns at
+  DOMContentLoaded instead of waiting for every subresource
+- disables image loading in the Chrome profile preferences
+- blocks fonts, media and analytics hosts with DevTools Network.setBlockedURLs
+
+PageLoadStats records the wall time and Navigation Timing of every challenge
+load so runs with and without --lean can be compared. The CLI loads the same
+challenge pages in a normal and a lean browser and prints both side by side:
+
+    python lean_loading.py --pages 8
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from compact_results import load_results
+from driver_cache import resolve_driver_path
+from wait_engine import WaitEngine
+
+# Network.setBlockedURLs wildcard patterns; the page's own JS, CSS and API
+# calls are never matched
+BLOCKED_URL_PATTERNS = [
+    # Images (also disabled in the profile; this covers CSS backgrounds)
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    # Web fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    # Media
+    "*.mp4", "*.webm", "*.mp3",
+    # Analytics and tracking
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*plausible.io*", "*posthog.com*", "*segment.io*", "*hotjar.com*",
+    "*sentry.io*", "*clarity.ms*", "*vercel-insights.com*", "*/_vercel/insights/*",
+]
+
+LEAN_READY_STATES = ("interactive", "complete")
+
+PAGE_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+const resources = performance.getEntriesByType('resource');
+return {
+    domContentLoadedMs: nav.domContentLoadedEventEnd,
+    resources: resources.length,
+    transferBytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), nav.transferSize || 0)
+};
+"""
+
+
+def apply_lean_options(options):
+    """Eager page loads and no images"""
+    options.page_load_strategy = "eager"
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+
+
+def block_resources(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block URL patterns for every later request of this driver"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def page_timing(driver):
+    try:
+        return driver.execute_script(PAGE_TIMING_SCRIPT)
+    except Exception:
+        return None
+
+
+class PageLoadStats:
+    """Challenge page loads of a run, shared by every driver"""
+
+    def __init__(self, lean=False):
+        self.lean = lean
+        self.lock = threading.Lock()
+        self.samples = []
+
+    def record(self, wall_s, timing):
+        sample = {"wall_s": wall_s}
+        if timing:
+            sample.update(timing)
+        with self.lock:
+            self.samples.append(sample)
+
+    def as_dict(self):
+        with self.lock:
+            samples = list(self.samples)
+        if not samples:
+            return {}
+
+        def median(key):
+            values = [s[key] for s in samples if key in s]
+            return statistics.median(values) if values else None
+
+        return {
+            "lean": self.lean,
+            "pages": len(samples),
+            "median_wall_s": median("wall_s"),
+            "median_dom_content_loaded_ms": median("domContentLoadedMs"),
+            "median_resources": median("resources"),
+            "median_transfer_kb": (median("transferBytes") or 0) / 1024,
+        }
+
+    def report(self, label=None):
+        summary = self.as_dict()
+        if not summary:
+            return
+
+        label = label or ("lean" if self.lean else "normal")
+        print(f"\n🪶 Page loads ({label}): {summary['pages']} pages")
+        print(f"   Median load + render wait: {summary['median_wall_s']:.2f}s")
+        if summary["median_dom_content_loaded_ms"] is not None:
+            print(f"   Median DOMContentLoaded: {summary['median_dom_content_loaded_ms']:.0f} ms")
+            print(f"   Median resources: {summary['median_resources']:.0f}")
+            print(f"   Median transferred: {summary['median_transfer_kb']:.0f} KB")
+
+
+def create_driver(lean, headless=False):
+    options = Options()
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if headless:
+        options.add_argument("--headless=new")
+    if lean:
+        apply_lean_options(options)
+
+    driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    if lean:
+        block_resources(driver)
+    return driver
+
+
+def benchmark(urls, lean, headless=False):
+    """Load each URL like the scraper does and return the PageLoadStats"""
+    stats = PageLoadStats(lean)
+    driver = create_driver(lean, headless)
+    try:
+        waits = WaitEngine(driver, ready_states=LEAN_READY_STATES if lean else ("complete",))
+        for url in urls:
+            start = time.perf_counter()
+            driver.get(url)
+            waits.wait_for_page()
+            stats.record(time.perf_counter() - start, page_timing(driver))
+    finally:
+        driver.quit()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare normal and lean page loads")
+    parser.add_argument(
+        "--results",
+        default="all_challenges_results_20250707_045604.json",
+        help="results file to take challenge URLs from",
+    )
+    parser.add_argument("--pages", type=int, default=5, help="challenge pages to load")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    urls = [c["url"] for c in load_results(args.results)["challenges"][: args.pages]]
+    before = benchmark(urls, lean=False, headless=args.headless)
+    after = benchmark(urls, lean=True, headless=args.headless)
+    before.report("before")
+    after.report("after, lean")
+
+    before_s = before.as_dict()["median_wall_s"]
+    after_s = after.as_dict()["median_wall_s"]
+    print(f"\n📉 Median page load {before_s:.2f}s -> {after_s:.2f}s ({before_s / after_s:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
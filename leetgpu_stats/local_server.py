@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Background localhost HTTP server shared by the offline test stand-ins.
+
+RecordedLeaderboardServer (leaderboard_http.py), ReplayServer
+(session_replay.py) and wigglypaint's ImageStandInServer subclass LocalServer
+with their own request handler; the server runs on a daemon thread between
+__enter__ and __exit__.
+"""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+
+class LocalServer:
+    """ThreadingHTTPServer on a daemon thread, usable as a context manager"""
+
+    def __init__(self, handler, host="127.0.0.1", port=0):
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
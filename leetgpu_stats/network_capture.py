@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Read LeetGPU leaderboard data straight from network responses.
+
+Chrome's performance log records every XHR/fetch the page makes. After a
+framework/GPU selection we pick out the leaderboard responses, pull their JSON
+bodies over the DevTools protocol and turn them into structured entries, so the
+rendered page text never has to be scanned.
+"""
+
+import json
+import re
+
+LEADERBOARD_URL_PATTERN = re.compile(r"leaderboard", re.IGNORECASE)
+
+RUNTIME_KEYS = {
+    "runtime_ms": "ms",
+    "runtimeMs": "ms",
+    "time_ms": "ms",
+    "timeMs": "ms",
+    "duration_ms": "ms",
+    "runtime_us": "us",
+    "runtimeUs": "us",
+    "runtime": None,
+    "time": None,
+    "duration": None,
+    "executionTime": None,
+}
+USER_KEYS = ["username", "user_name", "userName", "login", "user", "name"]
+RUNTIME_TEXT = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|μs|us|ns|s)\b", re.IGNORECASE)
+
+UNIT_TO_MS = {
+    "s": 1000.0,
+    "ms": 1.0,
+    "μs": 0.001,
+    "µs": 0.001,
+    "us": 0.001,
+    "ns": 0.000001,
+}
+
+
+def runtime_to_ms(value, unit):
+    """Convert a runtime in the given unit to milliseconds"""
+    return value * UNIT_TO_MS.get(unit.lower(), 1.0)
+
+
+def enable_performance_logging(options):
+    """Turn on Chrome's network performance log for a set of driver options"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option(
+        "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+    )
+
+
+def _parse_runtime(row):
+    """Return (value, unit) for the first runtime-like field of a row"""
+    for key, unit in RUNTIME_KEYS.items():
+        if key not in row or row[key] is None:
+            continue
+        raw = row[key]
+        if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+            return float(raw), unit or "ms"
+        if isinstance(raw, str):
+            match = RUNTIME_TEXT.search(raw)
+            if match:
+                return float(match.group(1)), match.group(2)
+            try:
+                return float(raw), unit or "ms"
+            except ValueError:
+                continue
+    return None
+
+
+def _parse_user(row):
+    for key in USER_KEYS:
+        value = row.get(key)
+        if isinstance(value, dict):
+            value = next((value[k] for k in USER_KEYS if isinstance(value.get(k), str)), None)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _find_rows(payload):
+    """Find the first list of dicts in payload that carries runtimes"""
+    if isinstance(payload, list):
+        if payload and all(isinstance(row, dict) for row in payload):
+            if any(_parse_runtime(row) for row in payload):
+                return payload
+        for item in payload:
+            rows = _find_rows(item)
+            if rows:
+                return rows
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            rows = _find_rows(value)
+            if rows:
+                return rows
+    return None
+
+
+def extract_entries(payload):
+    """Turn a leaderboard JSON payload into a list of structured entries"""
+    entries = []
+    for index, row in enumerate(_find_rows(payload) or [], 1):
+        runtime = _parse_runtime(row)
+        if not runtime:
+            continue
+        value, unit = runtime
+        entries.append(
+            {
+                "rank": row.get("rank", index),
+                "user": _parse_user(row),
+                "runtime": value,
+                "unit": unit,
+                "runtime_ms": runtime_to_ms(value, unit),
+            }
+        )
+    return entries
+
+
+class LeaderboardNetworkCapture:
+    """Collect leaderboard JSON responses from a driver's performance log"""
+
+    def __init__(self, driver, url_pattern=LEADERBOARD_URL_PATTERN):
+        self.driver = driver
+        self.url_pattern = url_pattern
+        # What the latest drain() returned, for session recording
+        self.last_responses = []
+        self.driver.execute_cdp_cmd("Network.enable", {})
+
+    def drain(self):
+        """Return (url, payload) for leaderboard responses logged since last drain"""
+        pending = {}
+        finished = []
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.responseReceived":
+                response = params.get("response", {})
+                if params.get("type") in ("XHR", "Fetch") and self.url_pattern.search(
+                    response.get("url", "")
+                ):
+                    pending[params["requestId"]] = response["url"]
+            elif method == "Network.loadingFinished" and params.get("requestId") in pending:
+                finished.append(params["requestId"])
+
+        responses = []
+        for request_id in finished:
+            try:
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": request_id}
+                )
+                responses.append((pending[request_id], json.loads(body["body"])))
+            except Exception:
+                continue
+        self.last_responses = responses
+        return responses
+
+    def clear(self):
+        """Discard everything logged so far"""
+        self.driver.get_log("performance")
+
+    def collect_entries(self):
+        """Structured entries from the most recent leaderboard response"""
+        for url, payload in reversed(self.drain()):
+            entries = extract_entries(payload)
+            if entries:
+                return entries
+        return []
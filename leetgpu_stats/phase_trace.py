@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Per-phase timing trace for LeetGPU collection runs.
+
+Wrap each phase of a cell in `with tracer.phase("select_gpu", ...)`. When the
+tracer is enabled every phase is recorded as a Chrome trace event, so the run
+can be opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing, and a
+p50/p95 summary per phase is printed. When disabled, phase() returns a shared
+no-op context manager.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+NULL_PHASE = contextlib.nullcontext()
+
+
+class _Phase:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[round(fraction * (len(sorted_values) - 1))]
+
+
+class PhaseTracer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.events = []
+        self.thread_ids = {}
+        self.origin = time.perf_counter()
+
+    def phase(self, name, **args):
+        """Context manager that times one phase"""
+        if not self.enabled:
+            return NULL_PHASE
+        return _Phase(self, name, args)
+
+    def record(self, name, start, end, args):
+        thread = threading.get_ident()
+        with self.lock:
+            # Small, stable thread ids read better in the trace viewer
+            tid = self.thread_ids.setdefault(thread, len(self.thread_ids) + 1)
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": "leetgpu",
+                    "ph": "X",
+                    "ts": (start - self.origin) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+    def summary(self):
+        """Phase -> count, total, p50 and p95 in seconds"""
+        durations = {}
+        with self.lock:
+            for event in self.events:
+                durations.setdefault(event["name"], []).append(event["dur"] / 1e6)
+
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            summary[name] = {
+                "count": len(values),
+                "total_s": sum(values),
+                "p50_s": _percentile(values, 0.5),
+                "p95_s": _percentile(values, 0.95),
+            }
+        return summary
+
+    def write_trace(self, path):
+        """Write a Chrome trace-event JSON file"""
+        with self.lock:
+            events = list(self.events)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "traceEvents": events,
+                    "displayTimeUnit": "ms",
+                    "otherData": {"phase_summary": self.summary()},
+                },
+                f,
+            )
+        return path
+
+    def report(self):
+        summary = self.summary()
+        if not summary:
+            return
+
+        print(f"\n🔬 Phase timing summary:")
+        print(f"   {'phase':<20}{'count':>7}{'total':>10}{'p50':>9}{'p95':>9}")
+        for name, stats in sorted(summary.items(), key=lambda kv: -kv[1]["total_s"]):
+            print(
+                f"   {name:<20}{stats['count']:>7}{stats['total_s']:>9.1f}s"
+                f"{stats['p50_s']:>8.2f}s{stats['p95_s']:>8.2f}s"
+            )
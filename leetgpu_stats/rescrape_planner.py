@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Plan an incremental re-scrape of missing or stale LeetGPU cells.
+
+Reads one or more previous result files (full JSON, compact JSON or a .jsonl
+journal), merges them into the latest known value per (challenge, framework,
+gpu) cell, and lists the cells that need another visit, highest priority first:
+
+    0  not_selected  the framework or GPU dropdown selection failed
+    1  missing       no row for the cell at all
+    2  no_data       the cell was visited but no timing was found
+    3  stale         the timing is older than --max-age-days
+
+Usage:
+    python rescrape_planner.py all_challenges_results_*.json [--max-age-days 30]
+"""
+
+import argparse
+from collections import OrderedDict
+from datetime import datetime
+
+from compact_results import load_results
+from results_journal import DEFAULT_FRAMEWORKS, DEFAULT_GPUS, ResultsJournal, cell_key
+
+PRIORITIES = {"not_selected": 0, "missing": 1, "no_data": 2, "stale": 3}
+
+
+def load_snapshot(path):
+    """Return (challenges, results) from a results file or journal"""
+    if path.endswith(".jsonl"):
+        results = ResultsJournal(path).load()
+        challenges = OrderedDict()
+        for r in results:
+            challenges.setdefault(
+                r["challenge_name"],
+                {
+                    "name": r["challenge_name"],
+                    "url": r["challenge_url"],
+                    "title": r["challenge_title"],
+                },
+            )
+        return list(challenges.values()), results
+
+    data = load_results(path)
+    return data["challenges"], data["results"]
+
+
+def merge_results(existing, new):
+    """Merge result lists; newer timings win, missing data never hides a timing"""
+    merged = OrderedDict((cell_key(r), r) for r in existing)
+    for result in new:
+        key = cell_key(result)
+        previous = merged.get(key)
+        if previous and previous["fastest_ms"] is not None:
+            if result["fastest_ms"] is None or result["timestamp"] < previous["timestamp"]:
+                continue
+        merged[key] = result
+    return list(merged.values())
+
+
+def load_dataset(paths):
+    """Merge several snapshots into (challenges, results)"""
+    challenges = OrderedDict()
+    results = []
+    for path in paths:
+        snapshot_challenges, snapshot_results = load_snapshot(path)
+        for challenge in snapshot_challenges:
+            challenges.setdefault(challenge["name"], challenge)
+        results = merge_results(results, snapshot_results)
+    return list(challenges.values()), results
+
+
+def plan_rescrape(challenges, results, frameworks, gpus, max_age_days=None, now=None):
+    """Cells that need another visit, sorted by priority then age"""
+    now = now or datetime.now()
+    by_cell = {cell_key(r): r for r in results}
+
+    work = []
+    for challenge in challenges:
+        for framework in frameworks:
+            for gpu in gpus:
+                result = by_cell.get((challenge["name"], framework, gpu))
+                age_days = None
+                if result is None:
+                    reason = "missing"
+                else:
+                    age = now - datetime.fromisoformat(result["timestamp"])
+                    age_days = age.total_seconds() / 86400
+                    if not (result["framework_selected"] and result["gpu_selected"]):
+                        reason = "not_selected"
+                    elif result["fastest_ms"] is None:
+                        reason = "no_data"
+                    elif max_age_days is not None and age_days > max_age_days:
+                        reason = "stale"
+                    else:
+                        continue
+
+                work.append(
+                    {
+                        "challenge": challenge,
+                        "framework": framework,
+                        "gpu": gpu,
+                        "reason": reason,
+                        "priority": PRIORITIES[reason],
+                        "age_days": age_days,
+                    }
+                )
+
+    work.sort(key=lambda w: (w["priority"], -(w["age_days"] or 0)))
+    return work
+
+
+def group_by_challenge(work):
+    """Challenge -> set of (framework, gpu), most urgent challenges first"""
+    groups = OrderedDict()
+    for item in work:
+        name = item["challenge"]["name"]
+        if name not in groups:
+            groups[name] = (item["challenge"], set())
+        groups[name][1].add((item["framework"], item["gpu"]))
+    return list(groups.values())
+
+
+def print_plan(work):
+    counts = {}
+    for item in work:
+        counts[item["reason"]] = counts.get(item["reason"], 0) + 1
+
+    print(f"📋 Re-scrape plan: {len(work)} cells")
+    for reason in sorted(counts, key=PRIORITIES.get):
+        print(f"   {reason:<14}{counts[reason]:>5}")
+    groups = group_by_challenge(work)
+    print(f"   across {len(groups)} challenges")
+    for challenge, combinations in groups[:10]:
+        print(f"   • {challenge['name']}: {len(combinations)} cells")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a re-scrape of missing or stale cells")
+    parser.add_argument("files", nargs="+", help="previous results files or journals")
+    parser.add_argument("--max-age-days", type=float, help="re-scrape timings older than this")
+    args = parser.parse_args()
+
+    challenges, results = load_dataset(args.files)
+    work = plan_rescrape(
+        challenges, results, DEFAULT_FRAMEWORKS, DEFAULT_GPUS, args.max_age_days
+    )
+    print_plan(work)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal for LeetGPU collection runs.
+
+Every result is written and fsynced as one line as soon as it is produced, so a
+crash loses at most the cell in progress. A run can be resumed from the journal,
+and the final JSON/CSV outputs are built from it in a single pass.
+"""
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+
+# Known working configuration, shared by the scraper and the analytics axes.
+# GPUs are oldest generation first.
+DEFAULT_FRAMEWORKS = ["CUDA", "TRITON", "PYTORCH", "MOJO", "TINYGRAD"]
+DEFAULT_GPUS = [
+    "NVIDIA TESLA T4",
+    "NVIDIA A100-80GB",
+    "NVIDIA H100",
+    "NVIDIA H200",
+    "NVIDIA B200",
+]
+
+
+def cell_key(result):
+    return (result["challenge_name"], result["framework"], result["gpu"])
+
+
+class ResultsJournal:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    def append(self, result):
+        """Write one result and force it to disk"""
+        line = json.dumps(result, ensure_ascii=False) + "\n"
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(line)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def extend(self, results):
+        """Write many results and force them to disk once"""
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, "a", encoding="utf-8")
+            for result in results:
+                self.file.write(json.dumps(result, ensure_ascii=False) + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+    def load(self):
+        """Latest result per (challenge, framework, gpu) cell, in first-seen order"""
+        results = {}
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                key = cell_key(result)
+                previous = results.get(key)
+                # A retry without data must not hide an earlier valid timing
+                if previous and previous["fastest_ms"] is not None and result["fastest_ms"] is None:
+                    continue
+                results[key] = result
+        return list(results.values())
+
+    def completed_cells(self):
+        """Cells that already have a timing and can be skipped on resume"""
+        return {cell_key(r) for r in self.load() if r["fastest_ms"] is not None}
+
+    def build_outputs(self, challenges, json_file, csv_file, extra=None):
+        """Write the final JSON and CSV from the journal"""
+        results = self.load()
+        write_outputs(challenges, results, json_file, csv_file, extra)
+        return results
+
+
+def write_outputs(challenges, results, json_file, csv_file, extra=None):
+    """Write results as the standard JSON and CSV files"""
+    with open(json_file, "w") as f:
+        json.dump(
+            {
+                "collection_timestamp": datetime.now().isoformat(),
+                "total_challenges": len(challenges),
+                "total_combinations": len(results),
+                "challenges": challenges,
+                **(extra or {}),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+    if results:
+        fieldnames = list(dict.fromkeys(k for r in results for k in r))
+        with open(csv_file, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            for result in results:
+                writer.writerow(
+                    {
+                        k: json.dumps(v) if isinstance(v, (list, dict)) else v
+                        for k, v in result.items()
+                    }
+                )
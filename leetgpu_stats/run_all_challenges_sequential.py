@@ -2,8 +2,12 @@
 
 import time
 import json
-import csv
 import os
+import sys
+import queue
+import fnmatch
+import argparse
+import threading
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,26 +15,161 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import re
+
+from compact_results import compact_path, save_compact
+from driver_cache import (
+    DEFAULT_COOKIE_FILE,
+    DEFAULT_PROFILE_DIR,
+    add_cookie,
+    load_cookies,
+    resolve_driver_path,
+    save_cookies,
+)
+from dom_snapshot import WebDriverCommandCounter, take_snapshot
+from leaderboard_table import (
+    TABLE_HTML_SCRIPT,
+    TABLE_SCRIPT,
+    leaderboard_stats,
+    parse_leaderboard_rows,
+    parse_page_text,
+)
+from leaderboard_http import DEFAULT_HTTP_WORKERS, LeaderboardHttpClient
+from lean_loading import (
+    LEAN_READY_STATES,
+    PageLoadStats,
+    apply_lean_options,
+    block_resources,
+    page_timing,
+)
+from network_capture import LeaderboardNetworkCapture, enable_performance_logging
+from phase_trace import PhaseTracer
+from rescrape_planner import group_by_challenge, load_dataset, plan_rescrape, print_plan
+from results_journal import (
+    DEFAULT_FRAMEWORKS,
+    DEFAULT_GPUS,
+    ResultsJournal,
+    cell_key,
+    write_outputs,
+)
+from session_replay import SessionRecorder
+from tensor_analytics import ResultsTensor, print_report
+from wait_engine import WaitEngine
+
+
+LEETGPU_ORIGIN = "https://leetgpu.com"
+
+
+class NavigationThrottle:
+    """Enforce a minimum interval between page loads across all drivers"""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        self.last_navigation = 0.0
+
+    def wait(self):
+        with self.lock:
+            delay = self.last_navigation + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.last_navigation = time.monotonic()
 
 
 class SequentialAllChallengesScraper:
-    def __init__(self):
+    def __init__(
+        self,
+        workers=1,
+        min_navigation_interval=2.0,
+        capture_network=False,
+        http_mode=False,
+        http_workers=DEFAULT_HTTP_WORKERS,
+        endpoint_template=None,
+        record_dir=None,
+        journal_path=None,
+        rescrape_files=None,
+        max_age_days=None,
+        profile_dir=None,
+        headless=False,
+        cookie_file=DEFAULT_COOKIE_FILE,
+        lean=False,
+        trace_file=None,
+        frameworks=None,
+        gpus=None,
+        challenge_patterns=None,
+        shard=None,
+        interactive=True,
+        auth_timeout=600,
+        base_url=LEETGPU_ORIGIN,
+        record_session=None,
+    ):
         self.driver = None
         self.wait = None
+        self.waits = None
+        self.command_counter = None
+        self.capture_network = capture_network
+        self.network_capture = None
+        self.last_entries = []
+
+        # HTTP fast path - Selenium is only used for the OAuth step
+        self.http_mode = http_mode
+        self.http_workers = max(1, http_workers)
+        self.endpoint_template = endpoint_template
+        self.record_dir = record_dir
+
+        # Every result is journaled as soon as it exists; resuming skips
+        # cells the journal already has timings for
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        shard_suffix = f"_shard{shard[0]}of{shard[1]}" if shard else ""
+        self.journal = ResultsJournal(
+            journal_path
+            or f"all_challenges_results_{self.run_timestamp}{shard_suffix}.jsonl"
+        )
+        self.completed_cells = set()
+
+        # Incremental re-scrape: only visit cells planned from earlier runs
+        self.rescrape_files = rescrape_files
+        self.max_age_days = max_age_days
+        self.cell_filter = None
+
+        # Startup - persistent profile and saved cookies skip the manual login
+        self.profile_dir = profile_dir
+        self.headless = headless
+        self.cookie_file = cookie_file
+
+        # Lean page loads - eager strategy, no images, fonts or analytics
+        self.lean = lean
+        self.page_loads = PageLoadStats(lean)
+
+        # Per-phase timing, a no-op unless a trace file was requested
+        self.trace_file = trace_file
+        self.tracer = PhaseTracer(enabled=bool(trace_file))
         self.challenges = []
+        # Every challenge of a re-scraped dataset, not just those with work left
+        self.all_challenges = []
         self.all_results = []
 
-        # Known working configuration
-        self.frameworks = ["CUDA", "TRITON", "PYTORCH", "MOJO", "TINYGRAD"]
-        self.gpus = [
-            "NVIDIA TESLA T4",
-            "NVIDIA A100-80GB",
-            "NVIDIA H100",
-            "NVIDIA H200",
-            "NVIDIA B200",
-        ]
+        # Worker pool settings - every driver shares one throttle and result list
+        self.workers = max(1, workers)
+        self.navigation_throttle = NavigationThrottle(min_navigation_interval)
+        self.results_lock = threading.Lock()
+
+        self.frameworks = list(frameworks or DEFAULT_FRAMEWORKS)
+        self.gpus = list(gpus or DEFAULT_GPUS)
+
+        # Scripted runs: which challenges to visit, which slice of them this
+        # process owns, and whether anyone is at the keyboard
+        self.challenge_patterns = challenge_patterns
+        self.shard = shard
+        self.interactive = interactive
+        self.auth_timeout = auth_timeout
+
+        # Replay: point at a local server and/or record what the site served
+        self.origin = base_url.rstrip("/")
+        self.session_recorder = (
+            SessionRecorder(record_session, self.frameworks, self.gpus)
+            if record_session
+            else None
+        )
 
     def setup_driver(self):
         """Setup Chrome driver with optimal settings"""
@@ -38,19 +177,48 @@ class SequentialAllChallengesScraper:
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-
-        service = Service(ChromeDriverManager().install())
+        if self.headless:
+            options.add_argument("--headless=new")
+        fresh_profile = True
+        if self.profile_dir:
+            fresh_profile = not os.path.isdir(self.profile_dir)
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+        # Recording a session keeps the leaderboard responses too
+        if self.capture_network or self.session_recorder:
+            enable_performance_logging(options)
+        if self.lean:
+            apply_lean_options(options)
+
+        start = time.monotonic()
+        service = Service(resolve_driver_path())
         self.driver = webdriver.Chrome(service=service, options=options)
         self.wait = WebDriverWait(self.driver, 60)  # Increased timeout for 2FA
+        self.command_counter = WebDriverCommandCounter(self.driver)
+        if self.lean:
+            block_resources(self.driver)
+        self.waits = WaitEngine(
+            self.driver,
+            stats=self.waits.stats if self.waits else None,
+            ready_states=LEAN_READY_STATES if self.lean else ("complete",),
+        )
+        if self.capture_network or self.session_recorder:
+            self.network_capture = LeaderboardNetworkCapture(self.driver)
+
+        if fresh_profile and self.cookie_file:
+            loaded = load_cookies(self.driver, self.origin, self.cookie_file)
+            if loaded:
+                print(f"🍪 Loaded {loaded} saved cookies")
+        print(f"🚗 Browser ready in {time.monotonic() - start:.1f}s")
         return True
 
     def scrape_challenges_list(self):
         """Get list of all challenges from LeetGPU"""
-        print("📋 Scraping challenges list from https://leetgpu.com/challenges")
+        challenges_url = f"{self.origin}/challenges"
+        print(f"📋 Scraping challenges list from {challenges_url}")
 
-        self.driver.get("https://leetgpu.com/challenges")
+        self.driver.get(challenges_url)
         self.wait.until(EC.presence_of_element_located((By.ID, "root")))
-        time.sleep(10)  # Extra time for page to fully load
+        self.waits.wait_for_page()
 
         try:
             challenge_links = []
@@ -62,7 +230,7 @@ class SequentialAllChallengesScraper:
                 if (
                     href
                     and "/challenges/" in href
-                    and href != "https://leetgpu.com/challenges"
+                    and href != challenges_url
                 ):
                     challenge_name = href.split("/challenges/")[-1]
                     if challenge_name and challenge_name not in [
@@ -95,7 +263,7 @@ class SequentialAllChallengesScraper:
                     "attention",
                 ]
                 for known in known_challenges:
-                    url = f"https://leetgpu.com/challenges/{known}"
+                    url = f"{challenges_url}/{known}"
                     if known not in [c["name"] for c in challenge_links]:
                         challenge_links.append(
                             {
@@ -106,6 +274,10 @@ class SequentialAllChallengesScraper:
                         )
 
             self.challenges = challenge_links
+            if self.session_recorder:
+                self.session_recorder.record_challenges(
+                    self.challenges, self.driver.page_source
+                )
             print(f"✅ Found {len(self.challenges)} challenges to process")
             for i, challenge in enumerate(self.challenges, 1):
                 print(f"  {i}. {challenge['title']} ({challenge['name']})")
@@ -118,7 +290,7 @@ class SequentialAllChallengesScraper:
             self.challenges = [
                 {
                     "name": "vector-addition",
-                    "url": "https://leetgpu.com/challenges/vector-addition",
+                    "url": f"{challenges_url}/vector-addition",
                     "title": "Vector Addition",
                 }
             ]
@@ -134,10 +306,11 @@ class SequentialAllChallengesScraper:
             return False
 
         first_challenge_url = self.challenges[0]["url"]
+        self.navigation_throttle.wait()
         self.driver.get(first_challenge_url)
 
         self.wait.until(EC.presence_of_element_located((By.ID, "root")))
-        time.sleep(10)  # Extra time for authentication page to load
+        self.waits.wait_for_page()
 
         print("📋 Clicking Leaderboard (initial)...")
         try:
@@ -146,8 +319,9 @@ class SequentialAllChallengesScraper:
                     (By.XPATH, "//button[contains(text(), 'Leaderboard')]")
                 )
             )
+            baseline = self.waits.mark()
             self.driver.execute_script("arguments[0].click();", leaderboard_btn)
-            time.sleep(8)  # Extra time for leaderboard to load
+            self.waits.wait_for_dom_change("leaderboard_load", baseline)
         except:
             print(
                 "⚠️ Leaderboard button not found, checking if already authenticated..."
@@ -155,44 +329,38 @@ class SequentialAllChallengesScraper:
 
         # Always force authentication check - don't assume it's complete
         print("🔐 Checking authentication status...")
-        page_text = self.driver.find_element(By.TAG_NAME, "body").text
-
-        # Look for signs that authentication is needed
-        needs_auth = (
-            "Sign In To Continue" in page_text
-            or "Sign in with Github" in page_text
-            or "Login" in page_text
-            or "authenticate" in page_text.lower()
-        )
+        snapshot = self.snapshot()
 
-        # Also check if we can see dropdown elements (sign of successful auth)
-        has_dropdowns = False
-        try:
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            for button in buttons:
-                if button.is_displayed() and button.text:
-                    text = button.text.strip()
-                    if any(fw in text for fw in self.frameworks) or any(
-                        gpu in text for gpu in ["NVIDIA", "Tesla", "T4"]
-                    ):
-                        has_dropdowns = True
-                        break
-        except:
-            pass
+        # Look for signs that authentication is needed, and for the dropdown
+        # elements that only appear once it succeeded
+        needs_auth = snapshot["needsAuth"]
+        has_dropdowns = bool(snapshot["framework"] or snapshot["gpu"])
+
+        if (needs_auth or not has_dropdowns) and self.headless:
+            print("❌ Login required but running headless - run once with a window")
+            return False
 
         if needs_auth or not has_dropdowns:
             print("🔐 GitHub OAuth popup should have appeared automatically!")
 
+            if self.interactive:
+                title, take = "UNLIMITED TIME", " (take as long as you need)"
+            else:
+                title, take = f"{self.auth_timeout:g}s TIME LIMIT", ""
             print("\n" + "=" * 70)
-            print("🔑 GITHUB AUTHENTICATION - UNLIMITED TIME")
+            print(f"🔑 GITHUB AUTHENTICATION - {title}")
             print("   • GitHub OAuth popup appeared when you clicked Leaderboard")
             print("   • Enter your username/email and password")
-            print("   • Complete 2FA (take as long as you need)")
+            print(f"   • Complete 2FA{take}")
             print("   • Wait for redirect back to LeetGPU")
             print("   • Look for the framework/GPU dropdown interface")
-            print("   • NO TIME LIMITS - I'll wait forever!")
+            if self.interactive:
+                print("   • NO TIME LIMITS - I'll wait forever!")
             print("=" * 70)
 
+            if not self.interactive:
+                return self.wait_for_login()
+
             # Wait indefinitely - no timeouts
             while True:
                 response = input(
@@ -202,18 +370,9 @@ class SequentialAllChallengesScraper:
                     print("✅ Verifying authentication...")
 
                     # Verify authentication by checking for dropdowns
-                    time.sleep(3)  # Brief pause to let page settle
-                    buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                    auth_verified = False
-
-                    for button in buttons:
-                        if button.is_displayed() and button.text:
-                            text = button.text.strip()
-                            if any(fw in text for fw in self.frameworks) or any(
-                                gpu in text for gpu in ["NVIDIA", "Tesla", "T4"]
-                            ):
-                                auth_verified = True
-                                break
+                    self.waits.wait_for_network_idle("auth_verify")
+                    snapshot = self.snapshot()
+                    auth_verified = bool(snapshot["framework"] or snapshot["gpu"])
 
                     if auth_verified:
                         print("✅ Authentication verified! Dropdowns found.")
@@ -231,57 +390,304 @@ class SequentialAllChallengesScraper:
         else:
             print("✅ Authentication already complete - dropdowns detected!")
 
+        if self.cookie_file:
+            save_cookies(self.driver, self.cookie_file)
+
         print("✅ Authentication complete!")
         return True
 
+    def wait_for_login(self):
+        """Poll for the dropdowns while someone logs in, without prompting"""
+        print(f"⏳ Waiting up to {self.auth_timeout}s for the login to complete...")
+        deadline = time.monotonic() + self.auth_timeout
+        while time.monotonic() < deadline:
+            snapshot = self.snapshot()
+            if snapshot["framework"] or snapshot["gpu"]:
+                if self.cookie_file:
+                    save_cookies(self.driver, self.cookie_file)
+                print("✅ Authentication verified! Dropdowns found.")
+                return True
+            time.sleep(5)
+        print("❌ Login did not complete in time")
+        return False
+
+    def select_challenges(self):
+        """Apply --challenges patterns and the --shard slice"""
+        if self.challenge_patterns:
+            self.challenges = [
+                c
+                for c in self.challenges
+                if match_patterns(c["name"], self.challenge_patterns)
+            ]
+        if self.shard:
+            index, count = self.shard
+            # Round-robin over sorted names gives every shard the same slice
+            # regardless of the order the site lists challenges in
+            ordered = sorted(c["name"] for c in self.challenges)
+            owned = set(ordered[index::count])
+            self.challenges = [c for c in self.challenges if c["name"] in owned]
+            print(f"🧩 Shard {index}/{count}: {len(self.challenges)} challenges")
+        return len(self.challenges) > 0
+
+    def export_session_state(self):
+        """Export the authenticated cookies and web storage of this driver"""
+        return {
+            "cookies": self.driver.get_cookies(),
+            "local_storage": self.driver.execute_script(
+                "return Object.assign({}, window.localStorage);"
+            ),
+            "session_storage": self.driver.execute_script(
+                "return Object.assign({}, window.sessionStorage);"
+            ),
+        }
+
+    def seed_session_state(self, state):
+        """Load exported cookies and web storage into this driver"""
+        self.navigation_throttle.wait()
+        self.driver.get(self.origin)
+        self.wait.until(EC.presence_of_element_located((By.ID, "root")))
+
+        for cookie in state["cookies"]:
+            if "leetgpu" not in cookie.get("domain", ""):
+                continue
+            try:
+                add_cookie(self.driver, cookie)
+            except Exception as e:
+                print(f"⚠️ Could not seed cookie {cookie['name']}: {e}")
+
+        self.driver.execute_script(
+            """
+            for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);
+            for (const [k, v] of Object.entries(arguments[1])) sessionStorage.setItem(k, v);
+            """,
+            state["local_storage"],
+            state["session_storage"],
+        )
+
+    def spawn_worker(self, state):
+        """Create a worker scraper with its own driver seeded from state"""
+        # Workers get a temporary profile - Chrome locks a user-data-dir to one
+        # process - and are seeded with the session state below
+        worker = SequentialAllChallengesScraper(
+            capture_network=self.capture_network,
+            headless=self.headless,
+            cookie_file=None,
+            lean=self.lean,
+            base_url=self.origin,
+        )
+        worker.frameworks = self.frameworks
+        worker.gpus = self.gpus
+        worker.navigation_throttle = self.navigation_throttle
+        worker.results_lock = self.results_lock
+        worker.all_results = self.all_results
+        worker.journal = self.journal
+        worker.completed_cells = self.completed_cells
+        worker.tracer = self.tracer
+        worker.page_loads = self.page_loads
+        worker.session_recorder = self.session_recorder
+        worker.cell_filter = self.cell_filter
+        worker.waits = self.waits  # setup_driver() keeps the shared stats
+        worker.setup_driver()
+        worker.seed_session_state(state)
+        return worker
+
+    def collect_parallel(self):
+        """Process challenges from a shared queue with a pool of drivers"""
+        worker_count = min(self.workers, len(self.challenges))
+        print(f"\n🧵 Starting worker pool with {worker_count} drivers...")
+
+        state = self.export_session_state()
+
+        # This driver is already authenticated and acts as the first worker
+        workers = [self]
+        try:
+            for i in range(1, worker_count):
+                print(f"🔑 Seeding driver {i + 1}/{worker_count} with session...")
+                workers.append(self.spawn_worker(state))
+
+            work_queue = queue.Queue()
+            for i, challenge in enumerate(self.challenges, 1):
+                work_queue.put((i, challenge))
+
+            def worker_loop(worker):
+                while True:
+                    try:
+                        i, challenge = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    print(f"\n📋 Challenge {i}/{len(self.challenges)}: {challenge['title']}")
+                    try:
+                        worker.run_single_challenge(challenge)
+                    except Exception as e:
+                        print(f"❌ Error processing {challenge['name']}: {e}")
+
+            threads = [
+                threading.Thread(target=worker_loop, args=(worker,), daemon=True)
+                for worker in workers
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            for worker in workers[1:]:
+                if worker.driver:
+                    worker.driver.quit()
+
+        # Restore challenge order so output matches a sequential run
+        order = {c["name"]: i for i, c in enumerate(self.challenges)}
+        self.all_results.sort(
+            key=lambda r: (order.get(r["challenge_name"], 0), r["combination_number"])
+        )
+
+    def collect_http(self):
+        """Query every leaderboard over HTTP using the browser's session"""
+        client = LeaderboardHttpClient(
+            endpoint_template=self.endpoint_template,
+            cookies=self.driver.get_cookies(),
+            max_workers=self.http_workers,
+            user_agent=self.driver.execute_script("return navigator.userAgent;"),
+            record_dir=self.record_dir,
+        )
+
+        # The browser is no longer needed once its cookies are exported
+        self.driver.quit()
+        self.driver = None
+
+        skip = {
+            (c["name"], fw, gpu)
+            for c in self.challenges
+            for fw in self.frameworks
+            for gpu in self.gpus
+            if not self.wants_cell(c["name"], fw, gpu)
+        }
+        client.fetch_all(
+            self.challenges,
+            self.frameworks,
+            self.gpus,
+            skip=skip,
+            on_result=self.record_result,
+        )
+
+    def record_result(self, result):
+        """Journal a result and add it to all_results"""
+        self.journal.append(result)
+        with self.results_lock:
+            self.all_results.append(result)
+
+    def resume_from_journal(self):
+        """Load a previous journal so finished cells are skipped"""
+        self.all_results[:] = self.journal.load()
+        self.completed_cells.update(self.journal.completed_cells())
+        print(
+            f"♻️  Resuming from {self.journal.path}: "
+            f"{len(self.completed_cells)} cells already have data"
+        )
+
+    def plan_rescrape(self):
+        """Restrict the run to missing or stale cells from earlier result files"""
+        challenges, results = load_dataset(self.rescrape_files)
+        if os.path.exists(self.journal.path):
+            # A resumed re-scrape plans from its journal: the seeded dataset
+            # plus the cells it refreshed before it stopped
+            results = self.journal.load()
+        work = plan_rescrape(
+            challenges, results, self.frameworks, self.gpus, self.max_age_days
+        )
+        print_plan(work)
+
+        # Outputs keep every challenge; only those with work left are visited
+        self.all_challenges = challenges
+        groups = group_by_challenge(work)
+        self.challenges = [challenge for challenge, _ in groups]
+        self.cell_filter = {challenge["name"]: cells for challenge, cells in groups}
+
+        # Seed the journal with the existing dataset so new values merge into it
+        if not os.path.exists(self.journal.path):
+            self.journal.extend(results)
+        return len(work) > 0
+
+    def wants_cell(self, challenge_name, framework, gpu):
+        """Whether this run should (re)visit a cell"""
+        if self.cell_filter is not None:
+            # Planned cells are stale, even where the journal has a timing
+            return (framework, gpu) in self.cell_filter.get(challenge_name, ())
+        return (challenge_name, framework, gpu) not in self.completed_cells
+
     def run_single_challenge(self, challenge):
         """Run 25 combinations for a single challenge using the working approach"""
         print(f"\n🎯 Processing challenge: {challenge['title']}")
         print(f"   URL: {challenge['url']}")
 
+        if not any(
+            self.wants_cell(challenge["name"], fw, gpu)
+            for fw in self.frameworks
+            for gpu in self.gpus
+        ):
+            print("  ⏭️  No combinations left to collect")
+            return []
+
         # Navigate to challenge
-        self.driver.get(challenge["url"])
-        self.wait.until(EC.presence_of_element_located((By.ID, "root")))
-        time.sleep(10)  # Extra time for challenge page to fully load
+        with self.tracer.phase("throttle"):
+            self.navigation_throttle.wait()
+        with self.tracer.phase("navigate", challenge=challenge["name"]):
+            start = time.perf_counter()
+            self.driver.get(challenge["url"])
+            self.wait.until(EC.presence_of_element_located((By.ID, "root")))
+            self.waits.wait_for_page()
+            self.page_loads.record(time.perf_counter() - start, page_timing(self.driver))
 
         # Click leaderboard
         try:
-            leaderboard_btn = self.wait.until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//button[contains(text(), 'Leaderboard')]")
+            with self.tracer.phase("leaderboard_click", challenge=challenge["name"]):
+                leaderboard_btn = self.wait.until(
+                    EC.element_to_be_clickable(
+                        (By.XPATH, "//button[contains(text(), 'Leaderboard')]")
+                    )
                 )
-            )
-            self.driver.execute_script("arguments[0].click();", leaderboard_btn)
-            time.sleep(8)  # Extra time for leaderboard interface to load
+                baseline = self.waits.mark()
+                self.driver.execute_script("arguments[0].click();", leaderboard_btn)
+                self.waits.wait_for_dom_change("leaderboard_load", baseline)
         except:
             print("⚠️ Could not access leaderboard interface")
             return []
 
-        # Run all 25 combinations
+        # Run all combinations
         challenge_results = []
         combination_count = 0
+        combinations = len(self.frameworks) * len(self.gpus)
 
         for framework in self.frameworks:
             for gpu in self.gpus:
                 combination_count += 1
-                print(f"  ⏳ [{combination_count}/25] {framework} + {gpu}", end=" ")
+                if not self.wants_cell(challenge["name"], framework, gpu):
+                    continue
+                print(f"  ⏳ [{combination_count}/{combinations}] {framework} + {gpu}", end=" ")
+                commands_before = self.command_counter.count
+                cell = {"challenge": challenge["name"], "framework": framework, "gpu": gpu}
 
                 # Find dropdown buttons
-                framework_button, gpu_button = self.find_dropdown_buttons()
+                with self.tracer.phase("find_dropdowns", **cell):
+                    snapshot = self.snapshot()
 
-                if not framework_button or not gpu_button:
+                if not snapshot["framework"] or not snapshot["gpu"]:
                     print("❌ No buttons")
                     continue
 
+                # Only responses triggered by this selection should be read
+                if self.network_capture:
+                    self.network_capture.clear()
+
                 # Select framework and GPU
-                framework_success = self.select_framework(framework_button, framework)
-                framework_button, gpu_button = (
-                    self.find_dropdown_buttons()
-                )  # Re-find after selection
-                gpu_success = self.select_gpu(gpu_button, gpu)
+                with self.tracer.phase("select_framework", **cell):
+                    framework_success = self.select_framework(snapshot, framework)
+                    snapshot = self.snapshot()  # Re-find after selection
+                with self.tracer.phase("select_gpu", **cell):
+                    gpu_success = self.select_gpu(snapshot, gpu)
 
                 # Extract runtime
-                fastest_time, fastest_ms, total_timings = self.extract_current_runtime()
+                with self.tracer.phase("extract_runtime", **cell):
+                    fastest_time, fastest_ms, total_timings = self.extract_current_runtime()
 
                 result = {
                     "challenge_name": challenge["name"],
@@ -297,9 +703,29 @@ class SequentialAllChallengesScraper:
                     "gpu_selected": gpu_success,
                     "timestamp": datetime.now().isoformat(),
                 }
+                result["leaderboard_entries"] = self.last_entries
+                result.update(leaderboard_stats(self.last_entries))
+                result["webdriver_commands"] = self.command_counter.count - commands_before
+
+                if self.session_recorder:
+                    # Capture mode already drained this selection's responses
+                    responses = (
+                        self.network_capture.last_responses
+                        if self.capture_network
+                        else self.network_capture.drain()
+                    )
+                    self.session_recorder.record_cell(
+                        challenge["name"],
+                        framework,
+                        gpu,
+                        self.driver.execute_script(TABLE_HTML_SCRIPT),
+                        self.last_entries,
+                        fastest_ms,
+                        responses,
+                    )
 
                 challenge_results.append(result)
-                self.all_results.append(result)
+                self.record_result(result)
 
                 if fastest_time:
                     print(f"⚡ {fastest_time}")
@@ -313,147 +739,134 @@ class SequentialAllChallengesScraper:
             print(
                 f"  🏆 Challenge fastest: {fastest['framework']} on {fastest['gpu']} - {fastest['fastest_time']}"
             )
-            print(f"  📊 Valid results: {len(valid_results)}/25")
+            print(f"  📊 Valid results: {len(valid_results)}/{len(challenge_results)}")
         else:
             print(f"  ⚠️ No valid results for {challenge['name']}")
 
         return challenge_results
 
-    def find_dropdown_buttons(self):
-        """Find framework and GPU dropdown buttons"""
-        try:
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            framework_button = None
-            gpu_button = None
-
-            for button in buttons:
-                if button.is_displayed() and button.text:
-                    text = button.text.strip()
-                    if any(fw in text for fw in self.frameworks):
-                        framework_button = button
-                    elif any(
-                        gpu in text
-                        for gpu in [
-                            "NVIDIA",
-                            "Tesla",
-                            "T4",
-                            "RTX",
-                            "A100",
-                            "H100",
-                            "H200",
-                            "B200",
-                        ]
-                    ):
-                        gpu_button = button
-
-            return framework_button, gpu_button
-        except Exception:
-            return None, None
+    def snapshot(self):
+        """Buttons, dropdown selection and auth state in one WebDriver call"""
+        return take_snapshot(self.driver, self.frameworks)
 
-    def select_framework(self, framework_button, framework):
+    def select_framework(self, snapshot, framework):
         """Select a specific framework from dropdown"""
+        if not snapshot["framework"]:
+            return False
+        if snapshot["framework"]["text"] == framework:
+            return True  # Already selected
         try:
-            self.driver.execute_script("arguments[0].click();", framework_button)
-            time.sleep(2)
+            self.driver.execute_script(
+                "arguments[0].click();", snapshot["framework"]["element"]
+            )
             option_xpath = f"//div[contains(@class, 'cursor-pointer') and normalize-space(text())='{framework}']"
-            option = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, option_xpath))
+            option = self.waits.wait_for_clickable(
+                "dropdown_open", (By.XPATH, option_xpath)
             )
+            if not option:
+                return False
+            baseline = self.waits.mark()
             self.driver.execute_script("arguments[0].click();", option)
-            time.sleep(3)
+            self.waits.wait_for_dom_change("selection_settle", baseline)
             return True
         except Exception:
             return False
 
-    def select_gpu(self, gpu_button, gpu):
+    def select_gpu(self, snapshot, gpu):
         """Select a specific GPU from dropdown"""
+        if not snapshot["gpu"]:
+            return False
+        if snapshot["gpu"]["text"] == gpu:
+            return True  # Already selected
         try:
-            self.driver.execute_script("arguments[0].click();", gpu_button)
-            time.sleep(2)
+            self.driver.execute_script("arguments[0].click();", snapshot["gpu"]["element"])
             option_xpath = f"//div[contains(@class, 'cursor-pointer')]//span[contains(@class, 'truncate') and normalize-space(text())='{gpu}']"
-            option = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, option_xpath))
+            option = self.waits.wait_for_clickable(
+                "dropdown_open", (By.XPATH, option_xpath)
             )
+            if not option:
+                return False
+            baseline = self.waits.mark()
             self.driver.execute_script("arguments[0].click();", option)
-            time.sleep(3)
+            self.waits.wait_for_dom_change("selection_settle", baseline)
             return True
         except Exception:
             return False
 
     def extract_current_runtime(self):
         """Extract the fastest runtime from current leaderboard"""
+        self.last_entries = []
         try:
-            time.sleep(3)
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
-
-            timing_patterns = [
-                r"(\d+\.?\d*)\s*ms",
-                r"(\d+\.?\d*)\s*μs",
-                r"(\d+\.?\d*)\s*us",
-            ]
-
-            all_times = []
-            for pattern in timing_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        value = float(match)
-                        unit = re.search(r"(ms|μs|us)", pattern, re.IGNORECASE).group(1)
-                        all_times.append({"value": value, "unit": unit})
-                    except:
-                        continue
+            self.waits.wait_for_network_idle("extract_settle")
+
+            # Capture mode reads the leaderboard response instead of the page
+            entries = []
+            if self.capture_network:
+                entries = self.network_capture.collect_entries()
+
+            # Otherwise parse only the leaderboard table, every row in one pass
+            if not entries:
+                entries = parse_leaderboard_rows(self.driver.execute_script(TABLE_SCRIPT))
+
+            if entries:
+                self.last_entries = entries
+                fastest = min(entries, key=lambda e: e["runtime_ms"])
+                return (
+                    f"{fastest['runtime']} {fastest['unit']}",
+                    fastest["runtime_ms"],
+                    len(entries),
+                )
 
+            # Last resort: any runtime anywhere on the page
+            page_text = self.driver.find_element(By.TAG_NAME, "body").text
+            all_times = parse_page_text(page_text)
             if all_times:
-                fastest_ms = float("inf")
-                fastest_original = None
-
-                for t in all_times:
-                    if "ms" in t["unit"].lower():
-                        ms_val = t["value"]
-                    elif "μs" in t["unit"] or "us" in t["unit"]:
-                        ms_val = t["value"] / 1000
-                    else:
-                        ms_val = t["value"]
-
-                    if ms_val < fastest_ms:
-                        fastest_ms = ms_val
-                        fastest_original = f"{t['value']} {t['unit']}"
-
-                return fastest_original, fastest_ms, len(all_times)
+                fastest = min(all_times, key=lambda t: t["runtime_ms"])
+                return (
+                    f"{fastest['runtime']} {fastest['unit']}",
+                    fastest["runtime_ms"],
+                    len(all_times),
+                )
 
             return None, None, 0
         except Exception:
             return None, None, 0
 
     def save_results(self):
-        """Save all results to files"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Save comprehensive JSON
-        json_file = f"all_challenges_results_{timestamp}.json"
-        with open(json_file, "w") as f:
-            json.dump(
-                {
-                    "collection_timestamp": datetime.now().isoformat(),
-                    "total_challenges": len(self.challenges),
-                    "total_combinations": len(self.all_results),
-                    "challenges": self.challenges,
-                    "results": self.all_results,
-                },
-                f,
-                indent=2,
-            )
-
-        # Save CSV
-        csv_file = f"all_challenges_results_{timestamp}.csv"
-        if self.all_results:
-            with open(csv_file, "w", newline="") as f:
-                writer = csv.DictWriter(f, fieldnames=self.all_results[0].keys())
-                writer.writeheader()
-                writer.writerows(self.all_results)
+        """Build the final JSON and CSV from the journal"""
+        self.journal.close()
+        base = os.path.splitext(self.journal.path)[0]
+        json_file = f"{base}.json"
+        csv_file = f"{base}.csv"
+
+        challenges = self.all_challenges or self.challenges
+        results = self.journal.build_outputs(
+            challenges,
+            json_file,
+            csv_file,
+            extra={
+                "wait_stats": self.waits.stats.as_dict() if self.waits else {},
+                "page_load": self.page_loads.as_dict(),
+            },
+        )
+        # Keep the in-memory view in the journal's order, one row per cell
+        self.all_results[:] = results
+
+        if self.session_recorder:
+            print(f"🎞️  Session recorded to {self.session_recorder.save()}")
+
+        compact_file = save_compact(
+            compact_path(json_file),
+            challenges,
+            results,
+            frameworks=self.frameworks,
+            gpus=self.gpus,
+        )
 
         print(f"\n💾 Results saved:")
+        print(f"   Journal: {self.journal.path}")
         print(f"   JSON: {json_file}")
+        print(f"   Compact: {compact_file}")
         print(f"   CSV: {csv_file}")
 
         return json_file, csv_file
@@ -465,26 +878,45 @@ class SequentialAllChallengesScraper:
             print("=" * 60)
             print("🎯 Will collect data for ALL challenges:")
             print("   • 36 challenges from LeetGPU")
-            print("   • 25 combinations per challenge (5 frameworks × 5 GPUs)")
-            print("   • Total: ~900 combinations")
-            print("   • Uses proven single-challenge approach")
+            print(
+                f"   • {len(self.frameworks) * len(self.gpus)} combinations per challenge"
+                f" ({len(self.frameworks)} frameworks × {len(self.gpus)} GPUs)"
+            )
+            print(f"   • Frameworks: {', '.join(self.frameworks)}")
+            print(f"   • GPUs: {', '.join(self.gpus)}")
+            if self.shard:
+                print(f"   • Shard {self.shard[0]} of {self.shard[1]}")
             print()
             print("⚠️  Requires GitHub authentication")
-            print("⏰ Estimated time: 2-3 hours")
+            print(f"⏰ Estimated time: 2-3 hours / {self.workers} worker(s)")
             print("=" * 60)
 
-            if input("\nProceed with full collection? (y/n): ").lower() != "y":
-                print("❌ Collection cancelled")
+            if self.interactive:
+                if input("\nProceed with full collection? (y/n): ").lower() != "y":
+                    print("❌ Collection cancelled")
+                    return
+
+            # Plan a re-scrape before resuming so the journal cannot mark
+            # planned cells as done
+            resuming = os.path.exists(self.journal.path)
+            if self.rescrape_files and not self.plan_rescrape():
+                print("✅ Nothing to re-scrape")
                 return
+            if resuming:
+                self.resume_from_journal()
 
             # Setup
             self.setup_driver()
 
             # Get challenges
-            if not self.scrape_challenges_list():
+            if not self.rescrape_files and not self.scrape_challenges_list():
                 print("❌ Failed to get challenges list")
                 return
 
+            if not self.select_challenges():
+                print("❌ No challenges match the selection")
+                return
+
             # Authenticate once
             if not self.authenticate_once():
                 print("❌ Authentication failed")
@@ -493,19 +925,17 @@ class SequentialAllChallengesScraper:
             # Process each challenge
             print(f"\n🚀 Starting collection of {len(self.challenges)} challenges...")
 
-            for i, challenge in enumerate(self.challenges, 1):
-                print(f"\n{'='*60}")
-                print(f"📋 Challenge {i}/{len(self.challenges)}: {challenge['title']}")
-                print(f"{'='*60}")
-
-                challenge_results = self.run_single_challenge(challenge)
+            if self.http_mode:
+                self.collect_http()
+            elif self.workers > 1:
+                self.collect_parallel()
+            else:
+                for i, challenge in enumerate(self.challenges, 1):
+                    print(f"\n{'='*60}")
+                    print(f"📋 Challenge {i}/{len(self.challenges)}: {challenge['title']}")
+                    print(f"{'='*60}")
 
-                # Save intermediate results
-                if i % 5 == 0:  # Save every 5 challenges
-                    self.save_results()
-                    print(
-                        f"💾 Intermediate save completed ({i}/{len(self.challenges)} challenges)"
-                    )
+                    challenge_results = self.run_single_challenge(challenge)
 
             # Final save
             json_file, csv_file = self.save_results()
@@ -518,9 +948,10 @@ class SequentialAllChallengesScraper:
 
             valid_results = [r for r in self.all_results if r["fastest_ms"] is not None]
             print(f"📊 Valid results: {len(valid_results)}")
-            print(
-                f"📊 Success rate: {len(valid_results)/len(self.all_results)*100:.1f}%"
-            )
+            if self.all_results:
+                print(
+                    f"📊 Success rate: {len(valid_results)/len(self.all_results)*100:.1f}%"
+                )
 
             if valid_results:
                 fastest = min(valid_results, key=lambda x: x["fastest_ms"])
@@ -528,15 +959,263 @@ class SequentialAllChallengesScraper:
                     f"🏆 Overall fastest: {fastest['challenge_title']} - {fastest['framework']} on {fastest['gpu']} - {fastest['fastest_time']}"
                 )
 
-            input("\nPress Enter to close browser...")
+            if valid_results:
+                tensor = ResultsTensor.from_results(
+                    self.all_results, frameworks=self.frameworks, gpus=self.gpus
+                )
+                print_report(tensor)
+
+            commands = [
+                r["webdriver_commands"] for r in self.all_results if "webdriver_commands" in r
+            ]
+            if commands:
+                print(f"📊 WebDriver commands per cell: {sum(commands) / len(commands):.1f}")
+
+            if self.waits:
+                self.waits.stats.report()
+            self.page_loads.report()
+
+            if self.driver and self.interactive:
+                input("\nPress Enter to close browser...")
 
         finally:
+            # Written even when the run fails part way
+            if self.trace_file:
+                self.tracer.report()
+                self.tracer.write_trace(self.trace_file)
+                print(f"🔬 Trace written to {self.trace_file} (open in https://ui.perfetto.dev)")
+
             if self.driver:
                 self.driver.quit()
 
 
+def match_patterns(name, patterns):
+    """Case-insensitive glob match against any of the patterns"""
+    return any(fnmatch.fnmatch(name.lower(), p.lower()) for p in patterns)
+
+
+def parse_patterns(value):
+    return [p.strip() for p in value.split(",") if p.strip()]
+
+
+def select_names(names, patterns):
+    selected = [n for n in names if match_patterns(n, patterns)]
+    if not selected:
+        raise argparse.ArgumentTypeError(f"no match for {patterns} in {names}")
+    return selected
+
+
+def parse_shard(value):
+    """'i/n' -> (i, n) with 0 <= i < n"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("shard must look like i/n, e.g. 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError("shard index must satisfy 0 <= i < n")
+    return index, count
+
+
+def merge_outputs(files, output):
+    """Combine shard outputs into one dataset with the standard schema"""
+    challenges, results = load_dataset(files)
+
+    # Keep a stable challenge / combination order across shards
+    order = {c["name"]: i for i, c in enumerate(challenges)}
+    results.sort(key=lambda r: (order[r["challenge_name"]], r["combination_number"]))
+
+    base = os.path.splitext(output)[0]
+    json_file = f"{base}.json"
+    csv_file = f"{base}.csv"
+    write_outputs(challenges, results, json_file, csv_file)
+    save_compact(compact_path(json_file), challenges, results)
+
+    valid = sum(1 for r in results if r["fastest_ms"] is not None)
+    print(f"🔗 Merged {len(files)} files: {len(challenges)} challenges, {len(results)} cells")
+    print(f"📊 Valid results: {valid}")
+    print(f"💾 {json_file}, {csv_file}")
+
+
+def add_collect_arguments(parser):
+    parser.add_argument(
+        "--challenges",
+        type=parse_patterns,
+        metavar="PATTERNS",
+        help="comma-separated glob patterns of challenge names, e.g. 'matrix-*,softmax'",
+    )
+    parser.add_argument(
+        "--frameworks",
+        type=parse_patterns,
+        metavar="PATTERNS",
+        help=f"comma-separated glob patterns from {', '.join(DEFAULT_FRAMEWORKS)}",
+    )
+    parser.add_argument(
+        "--gpus",
+        type=parse_patterns,
+        metavar="PATTERNS",
+        help="comma-separated glob patterns of GPU names, e.g. '*H100*,*H200*'",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="i/n",
+        help="only process shard i of n (0-based) of the sorted challenge list",
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="never prompt; wait for the login in the browser window instead",
+    )
+    parser.add_argument(
+        "--auth-timeout",
+        type=float,
+        default=600,
+        help="with --yes, seconds to wait for the login to complete",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of browser drivers sharing the authenticated session",
+    )
+    parser.add_argument(
+        "--min-nav-interval",
+        type=float,
+        default=2.0,
+        help="minimum seconds between page loads across all drivers",
+    )
+    parser.add_argument(
+        "--capture-network",
+        action="store_true",
+        help="read leaderboard JSON responses instead of scanning page text",
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="query leaderboards over HTTP after login",
+    )
+    parser.add_argument(
+        "--http-workers",
+        type=int,
+        default=DEFAULT_HTTP_WORKERS,
+        help="concurrent leaderboard requests in --http mode",
+    )
+    parser.add_argument(
+        "--endpoint-template",
+        help=(
+            "leaderboard URL with {challenge}, {framework} and {gpu} placeholders, "
+            "as seen in a --capture-network run; required with --http"
+        ),
+    )
+    parser.add_argument(
+        "--record-dir",
+        help="save HTTP responses here for replay with RecordedLeaderboardServer",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="JOURNAL",
+        help="continue a run from its .jsonl journal, skipping cells with data",
+    )
+    parser.add_argument(
+        "--rescrape",
+        nargs="+",
+        metavar="FILE",
+        help="only visit cells missing or stale in these earlier result files",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        help="with --rescrape, also refresh timings older than this",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help="persistent Chrome profile that keeps the login between runs",
+    )
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="start from a blank temporary Chrome profile",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run Chrome without a window (needs a saved login)",
+    )
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="eager page loads without images, fonts, media or analytics",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=LEETGPU_ORIGIN,
+        help="site to scrape, e.g. a session_replay.py server",
+    )
+    parser.add_argument(
+        "--record-session",
+        metavar="DIR",
+        help="save the challenge list and every leaderboard table for replay",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="record per-phase timings as a Chrome trace-event JSON file",
+    )
+
+
 def main():
-    scraper = SequentialAllChallengesScraper()
+    parser = argparse.ArgumentParser(description="Collect LeetGPU leaderboard runtimes")
+    commands = parser.add_subparsers(dest="command")
+    add_collect_arguments(commands.add_parser("collect", help="collect leaderboard data"))
+    merge = commands.add_parser("merge", help="combine shard outputs into one dataset")
+    merge.add_argument("files", nargs="+", help="shard JSON, compact JSON or .jsonl files")
+    merge.add_argument(
+        "-o", "--output", default="all_challenges_results_merged.json", help="output JSON path"
+    )
+
+    # `collect` is the default so the plain invocation keeps working
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in ("collect", "merge", "-h", "--help"):
+        argv = ["collect"] + argv
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        merge_outputs(args.files, args.output)
+        return
+
+    try:
+        frameworks = select_names(DEFAULT_FRAMEWORKS, args.frameworks or ["*"])
+        gpus = select_names(DEFAULT_GPUS, args.gpus or ["*"])
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.http and not args.endpoint_template:
+        parser.error("--http needs --endpoint-template; the leaderboard API URL is not known")
+
+    scraper = SequentialAllChallengesScraper(
+        workers=args.workers,
+        min_navigation_interval=args.min_nav_interval,
+        capture_network=args.capture_network,
+        http_mode=args.http,
+        http_workers=args.http_workers,
+        endpoint_template=args.endpoint_template,
+        record_dir=args.record_dir,
+        journal_path=args.resume,
+        rescrape_files=args.rescrape,
+        max_age_days=args.max_age_days,
+        profile_dir=None if args.fresh_profile else args.profile_dir,
+        headless=args.headless,
+        lean=args.lean,
+        trace_file=args.trace,
+        frameworks=frameworks,
+        gpus=gpus,
+        challenge_patterns=args.challenges,
+        shard=args.shard,
+        interactive=not args.yes,
+        auth_timeout=args.auth_timeout,
+        base_url=args.base_url,
+        record_session=args.record_session,
+    )
     scraper.run()
 
 
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Record-and-replay harness for the LeetGPU browser scraper.
+
+Recording (`run_all_challenges_sequential.py --record-session DIR`) saves the
+challenge list page to DIR/challenges.html, and for every cell the leaderboard
+table as rendered (outerHTML), the parsed entries and the leaderboard JSON
+responses the page received to DIR/session.json.
+
+ReplayServer serves a recorded session on localhost with configurable latency:
+the recorded challenge list (scripts removed) and challenge pages that
+reproduce the DOM the scraper relies on (Leaderboard button, framework/GPU
+dropdown buttons, cursor-pointer menu options). Each selection fetches the
+recorded table and leaderboard payload from /api/leaderboard, so the unchanged
+scraper can run against it with --base-url, with or without --capture-network.
+Commands:
+
+    python session_replay.py synthesize all_challenges_results_<timestamp>.json replay_session
+    python session_replay.py serve replay_session --latency-ms 80
+    python session_replay.py benchmark replay_session --latency-ms 80 --output bench.json
+    python session_replay.py benchmark replay_session --compare bench.json
+
+`synthesize` builds a session from an existing results file (one leaderboard
+row per cell) so there is something to benchmark before any recording exists.
+`benchmark --compare` exits non-zero when throughput regressed.
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+from compact_results import load_results
+from local_server import LocalServer
+
+SESSION_FILE = "session.json"
+CHALLENGES_FILE = "challenges.html"
+SCRIPT_TAG = re.compile(r"<script\b.*?</script>", re.IGNORECASE | re.DOTALL)
+SITE_LINK = re.compile(r'href="https?://(?:www\.)?leetgpu\.com/', re.IGNORECASE)
+
+
+def _cell_id(challenge, framework, gpu):
+    return f"{challenge}|{framework}|{gpu}"
+
+
+class SessionRecorder:
+    """Collects what the scraper saw during a live run; shared by all drivers"""
+
+    def __init__(self, directory, frameworks, gpus):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.session = {
+            "recorded_at": None,
+            "frameworks": list(frameworks),
+            "gpus": list(gpus),
+            "challenges": [],
+            "cells": {},
+        }
+
+    def record_challenges(self, challenges, page_source=None):
+        with self.lock:
+            self.session["challenges"] = [
+                {"name": c["name"], "title": c["title"]} for c in challenges
+            ]
+        if page_source is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, CHALLENGES_FILE), "w", encoding="utf-8") as f:
+                f.write(page_source)
+
+    def record_cell(
+        self, challenge, framework, gpu, table_html, entries, fastest_ms, responses=()
+    ):
+        """responses are the (url, payload) leaderboard responses of the selection"""
+        with self.lock:
+            self.session["cells"][_cell_id(challenge, framework, gpu)] = {
+                "table_html": table_html,
+                "entries": entries,
+                "fastest_ms": fastest_ms,
+                "responses": [{"url": url, "payload": payload} for url, payload in responses],
+            }
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, SESSION_FILE)
+        with self.lock:
+            self.session["recorded_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.session, f, ensure_ascii=False)
+        return path
+
+
+def load_session(directory):
+    with open(os.path.join(directory, SESSION_FILE), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def fixed_point(value):
+    """Shortest decimal for value without an exponent, e.g. 0.0000123 for 1.23e-05
+
+    RUNTIME_PATTERN cannot read scientific notation, and the digits of repr()
+    parse back to exactly the same float.
+    """
+    return format(Decimal(repr(value)), "f")
+
+
+def synthesize_session(results_file, directory):
+    """Session with a one-row leaderboard per cell, built from a results file"""
+    data = load_results(results_file)
+    frameworks = list(dict.fromkeys(r["framework"] for r in data["results"]))
+    gpus = list(dict.fromkeys(r["gpu"] for r in data["results"]))
+    recorder = SessionRecorder(directory, frameworks, gpus)
+    recorder.record_challenges(data["challenges"])
+
+    for r in data["results"]:
+        table_html = None
+        entries = []
+        if r["fastest_ms"] is not None:
+            entries = [
+                {
+                    "rank": 1,
+                    "user": "recorded",
+                    "runtime": r["fastest_ms"],
+                    "unit": "ms",
+                    "runtime_ms": r["fastest_ms"],
+                }
+            ]
+            runtime = fixed_point(r["fastest_ms"])
+            table_html = (
+                "<table><thead><tr><th>Rank</th><th>User</th><th>Runtime</th></tr></thead>"
+                f"<tbody><tr><td>1</td><td>recorded</td><td>{runtime} ms</td></tr>"
+                "</tbody></table>"
+            )
+        recorder.record_cell(
+            r["challenge_name"], r["framework"], r["gpu"], table_html, entries, r["fastest_ms"]
+        )
+    return recorder.save()
+
+
+LIST_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Challenges</title></head>
+<body><div id="root"><h1>Challenges</h1>{links}</div></body></html>
+"""
+
+CHALLENGE_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{name}</title></head>
+<body>
+<div id="root">
+  <h1>{title}</h1>
+  <button id="leaderboard">Leaderboard</button>
+  <div id="board"></div>
+</div>
+<script>
+const [FRAMEWORKS, GPUS, CHALLENGE] = {config};
+let framework = FRAMEWORKS[0];
+let gpu = GPUS[0];
+let requestCount = 0;
+const board = document.getElementById('board');
+
+function closeMenus() {{
+    document.querySelectorAll('.menu').forEach(menu => menu.remove());
+}}
+
+// Options are div.cursor-pointer; GPU names sit in span.truncate, as on the site
+function openMenu(anchor, values, wrapInSpan, onPick) {{
+    closeMenus();
+    const menu = document.createElement('div');
+    menu.className = 'menu';
+    for (const value of values) {{
+        const option = document.createElement('div');
+        option.className = 'cursor-pointer';
+        if (wrapInSpan) {{
+            const span = document.createElement('span');
+            span.className = 'truncate';
+            span.textContent = value;
+            option.appendChild(span);
+        }} else {{
+            option.textContent = value;
+        }}
+        option.addEventListener('click', () => {{ closeMenus(); onPick(value); }});
+        menu.appendChild(option);
+    }}
+    anchor.after(menu);
+}}
+
+async function loadTable(container) {{
+    const token = ++requestCount;
+    const params = new URLSearchParams({{challenge: CHALLENGE, framework: framework, gpu: gpu}});
+    const response = await fetch('/api/leaderboard?' + params);
+    const data = await response.json();
+    // A newer selection superseded this request
+    if (token !== requestCount) return;
+    container.innerHTML = data.table_html || '<p>No submissions yet</p>';
+}}
+
+function renderBoard() {{
+    board.innerHTML = '';
+    const frameworkButton = document.createElement('button');
+    frameworkButton.textContent = framework;
+    frameworkButton.addEventListener('click', () =>
+        openMenu(frameworkButton, FRAMEWORKS, false, value => {{ framework = value; renderBoard(); }}));
+    const gpuButton = document.createElement('button');
+    gpuButton.textContent = gpu;
+    gpuButton.addEventListener('click', () =>
+        openMenu(gpuButton, GPUS, true, value => {{ gpu = value; renderBoard(); }}));
+    const table = document.createElement('div');
+    board.append(frameworkButton, gpuButton, table);
+    loadTable(table);
+}}
+
+document.getElementById('leaderboard').addEventListener('click', renderBoard);
+</script>
+</body></html>
+"""
+
+
+class ReplayServer(LocalServer):
+    """Local stand-in for leetgpu.com that serves a recorded session"""
+
+    def __init__(self, directory, latency_ms=0, host="127.0.0.1", port=0):
+        session = load_session(directory)
+        self.session = session
+        self.frameworks = session["frameworks"]
+        self.gpus = session["gpus"]
+        challenges = {c["name"]: c for c in session["challenges"]}
+        delay = latency_ms / 1000
+
+        recorded_list = os.path.join(directory, CHALLENGES_FILE)
+
+        def list_page():
+            if os.path.exists(recorded_list):
+                # The recorded DOM without the site's scripts, which would
+                # re-render it or call the real API, and with links kept local
+                with open(recorded_list, encoding="utf-8") as f:
+                    return SITE_LINK.sub('href="/', SCRIPT_TAG.sub("", f.read()))
+            links = "".join(
+                f'<a href="/challenges/{html.escape(c["name"])}">'
+                + "<br>".join(html.escape(line) for line in c["title"].split("\n")[:2])
+                + "</a>"
+                for c in session["challenges"]
+            )
+            return LIST_PAGE.format(links=links)
+
+        def challenge_page(name):
+            challenge = challenges[name]
+            config = json.dumps([self.frameworks, self.gpus, name]).replace("</", "<\\/")
+            title = challenge["title"].split("\n")
+            return CHALLENGE_PAGE.format(
+                name=html.escape(name),
+                title=html.escape(title[1] if len(title) > 1 else title[0]),
+                config=config,
+            )
+
+        class Handler(BaseHTTPRequestHandler):
+            def send_body(self, body, content_type):
+                body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if delay:
+                    time.sleep(delay)
+                url = urlsplit(self.path)
+                path = url.path.rstrip("/")
+
+                if path in ("", "/challenges"):
+                    self.send_body(list_page(), "text/html; charset=utf-8")
+                elif path.startswith("/challenges/") and path[12:] in challenges:
+                    self.send_body(challenge_page(path[12:]), "text/html; charset=utf-8")
+                elif path == "/api/leaderboard":
+                    query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                    cell = session["cells"].get(
+                        _cell_id(query.get("challenge"), query.get("framework"), query.get("gpu")),
+                        {},
+                    )
+                    # The recorded payload lets --capture-network runs read the
+                    # same response; synthesized cells carry their entries
+                    responses = cell.get("responses") or []
+                    payload = responses[-1]["payload"] if responses else cell.get("entries", [])
+                    self.send_body(
+                        json.dumps({"table_html": cell.get("table_html"), "leaderboard": payload}),
+                        "application/json",
+                    )
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                pass
+
+        super().__init__(Handler, host, port)
+
+
+def benchmark(directory, latency_ms=0, workers=1, headless=True):
+    """Run the scraper end to end against a replay server; returns the metrics"""
+    from run_all_challenges_sequential import SequentialAllChallengesScraper
+
+    work_dir = tempfile.mkdtemp(prefix="leetgpu_replay_")
+    with ReplayServer(directory, latency_ms) as server:
+        scraper = SequentialAllChallengesScraper(
+            workers=workers,
+            min_navigation_interval=0,
+            base_url=server.base_url,
+            journal_path=os.path.join(work_dir, "replay_results.jsonl"),
+            profile_dir=None,
+            cookie_file=None,
+            headless=headless,
+            trace_file=os.path.join(work_dir, "replay_trace.json"),
+            frameworks=server.frameworks,
+            gpus=server.gpus,
+            interactive=False,
+            auth_timeout=0,
+        )
+        start = time.perf_counter()
+        scraper.run()
+        elapsed = time.perf_counter() - start
+
+    recorded = server.session["cells"]
+    mismatches = [
+        _cell_id(r["challenge_name"], r["framework"], r["gpu"])
+        for r in scraper.all_results
+        if recorded.get(_cell_id(r["challenge_name"], r["framework"], r["gpu"]), {}).get(
+            "fastest_ms"
+        )
+        != r["fastest_ms"]
+    ]
+    cells = len(scraper.all_results)
+    return {
+        "latency_ms": latency_ms,
+        "workers": workers,
+        "elapsed_s": elapsed,
+        "cells": cells,
+        "cells_per_minute": cells / elapsed * 60 if elapsed else 0.0,
+        "mismatches": mismatches,
+        "phases": scraper.tracer.summary(),
+    }
+
+
+def print_benchmark(metrics, previous=None, tolerance=0.1):
+    """Print the metrics; returns False when throughput regressed past tolerance"""
+    print(f"\n🏁 Replay benchmark ({metrics['workers']} worker(s), {metrics['latency_ms']} ms latency)")
+    print(f"   Cells: {metrics['cells']} in {metrics['elapsed_s']:.1f}s")
+    print(f"   Throughput: {metrics['cells_per_minute']:.1f} cells/min")
+    print(f"   Mismatches vs recording: {len(metrics['mismatches'])}")
+    for name in ("extract_runtime", "select_framework", "select_gpu", "find_dropdowns"):
+        phase = metrics["phases"].get(name)
+        if phase:
+            print(f"   {name:<18} p50 {phase['p50_s'] * 1000:.0f} ms, p95 {phase['p95_s'] * 1000:.0f} ms")
+
+    if not previous:
+        return True
+    ratio = metrics["cells_per_minute"] / previous["cells_per_minute"]
+    print(f"   vs previous: {ratio:.2f}x throughput")
+    if ratio < 1 - tolerance:
+        print(f"❌ Throughput regressed by more than {tolerance:.0%}")
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record-and-replay harness for the LeetGPU scraper")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    synthesize = commands.add_parser("synthesize", help="build a session from a results file")
+    synthesize.add_argument("results")
+    synthesize.add_argument("directory")
+
+    serve = commands.add_parser("serve", help="serve a session until interrupted")
+    serve.add_argument("directory")
+    serve.add_argument("--latency-ms", type=float, default=0)
+    serve.add_argument("--port", type=int, default=8765)
+
+    bench = commands.add_parser("benchmark", help="run the scraper against a session")
+    bench.add_argument("directory")
+    bench.add_argument("--latency-ms", type=float, default=0)
+    bench.add_argument("--workers", type=int, default=1)
+    bench.add_argument("--window", action="store_true", help="show the browser")
+    bench.add_argument("--output", help="write the metrics to this JSON file")
+    bench.add_argument("--compare", help="metrics JSON of an earlier benchmark")
+    bench.add_argument(
+        "--tolerance", type=float, default=0.1, help="allowed throughput drop vs --compare"
+    )
+    args = parser.parse_args()
+
+    if args.command == "synthesize":
+        path = synthesize_session(args.results, args.directory)
+        print(f"🎞️  Session written to {path}")
+
+    elif args.command == "serve":
+        with ReplayServer(args.directory, args.latency_ms, port=args.port) as server:
+            print(f"🎞️  Replaying {args.directory} at {server.base_url} (Ctrl+C to stop)")
+            print(f"   python run_all_challenges_sequential.py --base-url {server.base_url} --fresh-profile --yes")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+
+    elif args.command == "benchmark":
+        metrics = benchmark(args.directory, args.latency_ms, args.workers, not args.window)
+        previous = None
+        if args.compare:
+            with open(args.compare) as f:
+                previous = json.load(f)
+        ok = print_benchmark(metrics, previous, args.tolerance)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(metrics, f, indent=2)
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
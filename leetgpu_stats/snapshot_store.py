@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Indexed time-series store across LeetGPU snapshots.
+
+Every collection run leaves another standalone results file. This module
+ingests any number of them (full JSON, compact JSON or .jsonl journals) into a
+local SQLite database indexed on (challenge, framework, gpu, collected_at), so
+trends and regressions across hundreds of snapshots are single indexed queries.
+
+Usage:
+    python snapshot_store.py ingest all_challenges_results_*.json
+    python snapshot_store.py trend vector-addition CUDA "NVIDIA H100"
+    python snapshot_store.py regressions --threshold 0.05
+    python snapshot_store.py snapshots
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from compact_results import round_float32
+from rescrape_planner import load_snapshot
+
+DEFAULT_DB = "leetgpu_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    content_key TEXT UNIQUE NOT NULL,
+    collected_at TEXT,
+    ingested_at TEXT NOT NULL,
+    cells INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS challenges (
+    name TEXT PRIMARY KEY,
+    title TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    challenge TEXT NOT NULL,
+    framework TEXT NOT NULL,
+    gpu TEXT NOT NULL,
+    collected_at TEXT NOT NULL,
+    fastest_ms REAL,
+    total_timings INTEGER,
+    selected INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, challenge, framework, gpu)
+);
+CREATE INDEX IF NOT EXISTS results_cell_time
+    ON results (challenge, framework, gpu, collected_at);
+"""
+
+TREND_QUERY = """
+SELECT collected_at, fastest_ms
+FROM results
+WHERE challenge = ? AND framework = ? AND gpu = ? AND fastest_ms IS NOT NULL
+ORDER BY collected_at
+"""
+
+# Latest two valid timings per cell, flagged when the newer one is slower
+REGRESSIONS_QUERY = """
+WITH ranked AS (
+    SELECT challenge, framework, gpu, collected_at, fastest_ms,
+           ROW_NUMBER() OVER (
+               PARTITION BY challenge, framework, gpu ORDER BY collected_at DESC
+           ) AS age
+    FROM results
+    WHERE fastest_ms IS NOT NULL
+)
+SELECT new.challenge, new.framework, new.gpu,
+       old.fastest_ms, new.fastest_ms, old.collected_at, new.collected_at
+FROM ranked AS new
+JOIN ranked AS old
+  ON old.challenge = new.challenge
+ AND old.framework = new.framework
+ AND old.gpu = new.gpu
+ AND old.age = 2
+WHERE new.age = 1 AND old.fastest_ms > 0 AND new.fastest_ms > old.fastest_ms * (1 + ?)
+ORDER BY new.fastest_ms / old.fastest_ms DESC
+"""
+
+
+def snapshot_key(collected_at, rows):
+    """collected_at plus a hash of the result rows, independent of row order
+
+    fastest_ms is hashed at float32 precision, as the compact format stores it,
+    so the compact copy of a run has the same key as its full JSON.
+    """
+    hashed = [
+        row[:4] + (None if row[4] is None else round_float32(row[4]),) + row[5:]
+        for row in rows
+    ]
+    digest = hashlib.sha256(json.dumps(sorted(hashed, key=repr)).encode("utf-8"))
+    return f"{collected_at}:{digest.hexdigest()}"
+
+
+class SnapshotStore:
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def ingest(self, path):
+        """Load one snapshot file; returns the number of cells, 0 if already ingested"""
+        challenges, results = load_snapshot(path)
+        collected_at = max((r["timestamp"] for r in results), default=None)
+        rows = [
+            (
+                r["challenge_name"],
+                r["framework"],
+                r["gpu"],
+                r["timestamp"],
+                r["fastest_ms"],
+                r["total_timings_found"],
+                int(bool(r["framework_selected"] and r["gpu_selected"])),
+            )
+            for r in results
+        ]
+
+        # The same run may arrive as a copy, a compact file or its journal
+        content_key = snapshot_key(collected_at, rows)
+        if self.conn.execute(
+            "SELECT 1 FROM snapshots WHERE content_key = ?", (content_key,)
+        ).fetchone():
+            return 0
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO snapshots (source, content_key, collected_at, ingested_at, cells)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(path),
+                    content_key,
+                    collected_at,
+                    datetime.now().isoformat(),
+                    len(results),
+                ),
+            )
+            snapshot_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO challenges (name, title, url) VALUES (?, ?, ?)",
+                ((c["name"], c["title"], c["url"]) for c in challenges),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((snapshot_id,) + row for row in rows),
+            )
+        return len(results)
+
+    def snapshots(self):
+        return self.conn.execute(
+            "SELECT id, source, collected_at, cells FROM snapshots ORDER BY collected_at"
+        ).fetchall()
+
+    def trend(self, challenge, framework, gpu):
+        """(collected_at, fastest_ms) for one cell, oldest first"""
+        return self.conn.execute(TREND_QUERY, (challenge, framework, gpu)).fetchall()
+
+    def regressions(self, threshold=0.0):
+        """Cells whose latest timing is slower than the previous one by > threshold"""
+        return self.conn.execute(REGRESSIONS_QUERY, (threshold,)).fetchall()
+
+
+def print_trend(rows, challenge, framework, gpu):
+    print(f"📈 {challenge} - {framework} on {gpu}")
+    if not rows:
+        print("   No timings")
+        return
+
+    for collected_at, fastest_ms in rows:
+        print(f"   {collected_at[:19]}  {fastest_ms:.4f} ms")
+
+    first_at, first_ms = rows[0]
+    last_at, last_ms = rows[-1]
+    days = (datetime.fromisoformat(last_at) - datetime.fromisoformat(first_at)).days
+    if not first_ms:
+        print(f"   {len(rows)} snapshots over {days} days (first timing is 0 ms)")
+        return
+    change = (last_ms - first_ms) / first_ms * 100
+    print(f"   {change:+.1f}% over {days} days ({len(rows)} snapshots)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query LeetGPU results across snapshots")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="load snapshot files")
+    ingest.add_argument("files", nargs="+")
+
+    trend = commands.add_parser("trend", help="fastest time of one cell over time")
+    trend.add_argument("challenge")
+    trend.add_argument("framework")
+    trend.add_argument("gpu")
+
+    regressions = commands.add_parser("regressions", help="cells that got slower")
+    regressions.add_argument(
+        "--threshold", type=float, default=0.0, help="minimum relative slowdown, e.g. 0.05"
+    )
+
+    commands.add_parser("snapshots", help="list ingested snapshots")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.db)
+    try:
+        if args.command == "ingest":
+            for path in args.files:
+                cells = store.ingest(path)
+                print(f"📥 {path}: {cells} cells" if cells else f"⏭️  {path}: already ingested")
+
+        elif args.command == "trend":
+            print_trend(
+                store.trend(args.challenge, args.framework, args.gpu),
+                args.challenge,
+                args.framework,
+                args.gpu,
+            )
+
+        elif args.command == "regressions":
+            rows = store.regressions(args.threshold)
+            print(f"📉 {len(rows)} regressed cells")
+            for challenge, framework, gpu, old_ms, new_ms, old_at, new_at in rows:
+                print(
+                    f"   {challenge} - {framework} on {gpu}: "
+                    f"{old_ms:.4f} → {new_ms:.4f} ms ({new_ms / old_ms:.2f}x)"
+                    f"  [{old_at[:10]} → {new_at[:10]}]"
+                )
+
+        elif args.command == "snapshots":
+            for snapshot_id, source, collected_at, cells in store.snapshots():
+                print(f"   #{snapshot_id}  {collected_at}  {cells:>5} cells  {source}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
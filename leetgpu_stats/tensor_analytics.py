@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+NumPy tensor analytics for LeetGPU results.
+
+A results file is loaded into a dense challenges x frameworks x GPUs float
+array (NaN where there is no timing) with a validity mask. Several snapshots
+stack into a snapshots x challenges x frameworks x GPUs array; every metric
+works on the trailing three axes, so it runs on one snapshot or on hundreds at
+once without Python loops over the cells:
+
+- geometric-mean speedup of every framework/GPU cell against a baseline cell
+- per-GPU generational scaling within each framework
+- rank of each framework per challenge and GPU, and win counts
+- Pareto fronts of runtime against GPU generation
+
+Usage:
+    python tensor_analytics.py all_challenges_results_<timestamp>.json
+    python tensor_analytics.py snapshot_a.json snapshot_b.json --baseline PYTORCH "NVIDIA H100"
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from rescrape_planner import load_snapshot
+from results_journal import DEFAULT_FRAMEWORKS, DEFAULT_GPUS
+
+CHALLENGE_AXIS, FRAMEWORK_AXIS, GPU_AXIS = -3, -2, -1
+
+
+def _masked_geomean(log_ratios, mask, axis):
+    """exp(mean(log_ratios)) over axis where mask holds; NaN where nothing is valid"""
+    counts = mask.sum(axis=axis)
+    totals = np.where(mask, log_ratios, 0.0).sum(axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.exp(totals / counts), counts
+
+
+class ResultsTensor:
+    def __init__(self, challenges, frameworks, gpus, times, titles=None):
+        self.challenges = list(challenges)
+        self.frameworks = list(frameworks)
+        self.gpus = list(gpus)
+        self.times = times
+        self.titles = titles or {}
+        self.valid = ~np.isnan(times)
+
+    @classmethod
+    def from_results(
+        cls, results, challenges=None, frameworks=DEFAULT_FRAMEWORKS, gpus=DEFAULT_GPUS
+    ):
+        """Build a (challenges, frameworks, gpus) tensor from result rows"""
+        if challenges is None:
+            challenges = list(dict.fromkeys(r["challenge_name"] for r in results))
+        c_index = {name: i for i, name in enumerate(challenges)}
+        f_index = {name: i for i, name in enumerate(frameworks)}
+        g_index = {name: i for i, name in enumerate(gpus)}
+
+        times = np.full((len(challenges), len(frameworks), len(gpus)), np.nan)
+        titles = {}
+        for r in results:
+            c = c_index.get(r["challenge_name"])
+            f = f_index.get(r["framework"])
+            g = g_index.get(r["gpu"])
+            if c is None or f is None or g is None:
+                continue
+            titles.setdefault(r["challenge_name"], r.get("challenge_title"))
+            if r["fastest_ms"] is not None:
+                times[c, f, g] = r["fastest_ms"]
+        return cls(challenges, frameworks, gpus, times, titles)
+
+    @classmethod
+    def load(cls, path, frameworks=DEFAULT_FRAMEWORKS, gpus=DEFAULT_GPUS):
+        """Tensor of one results file, compact file or journal"""
+        challenges, results = load_snapshot(path)
+        tensor = cls.from_results(
+            results, [c["name"] for c in challenges] or None, frameworks, gpus
+        )
+        tensor.titles.update((c["name"], c["title"]) for c in challenges)
+        return tensor
+
+    @classmethod
+    def stack(cls, paths, frameworks=DEFAULT_FRAMEWORKS, gpus=DEFAULT_GPUS):
+        """(snapshots, challenges, frameworks, gpus) tensor over the union of challenges"""
+        snapshots = [load_snapshot(path) for path in paths]
+        challenges = list(
+            dict.fromkeys(
+                r["challenge_name"] for _, results in snapshots for r in results
+            )
+        )
+        layers = [
+            cls.from_results(results, challenges, frameworks, gpus)
+            for _, results in snapshots
+        ]
+        titles = {}
+        for layer in layers:
+            titles.update(layer.titles)
+        return cls(
+            challenges, frameworks, gpus, np.stack([l.times for l in layers]), titles
+        )
+
+    def cell(self, framework, gpu):
+        return self.frameworks.index(framework), self.gpus.index(gpu)
+
+    def success_counts(self):
+        """Valid timings per framework/GPU: (..., frameworks, gpus)"""
+        return self.valid.sum(axis=CHALLENGE_AXIS)
+
+    def mean_times(self):
+        """Arithmetic mean of the valid timings per framework/GPU, NaN if none"""
+        # Summing along a non-contiguous axis adds challenges in order
+        totals = np.where(self.valid, self.times, 0.0).sum(axis=CHALLENGE_AXIS)
+        with np.errstate(invalid="ignore"):
+            return totals / self.success_counts()
+
+    def ranks(self):
+        """Rank of each framework per challenge and GPU (1 = fastest, 0 = no timing)"""
+        filled = np.where(self.valid, self.times, np.inf)
+        order = np.argsort(filled, axis=FRAMEWORK_AXIS, kind="stable")
+        positions = np.broadcast_to(
+            np.arange(1, len(self.frameworks) + 1)[:, None], order.shape
+        )
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, positions, axis=FRAMEWORK_AXIS)
+        return np.where(self.valid, ranks, 0)
+
+    def win_counts(self):
+        """Challenges each framework wins per GPU: (..., frameworks, gpus)
+
+        Ties go to the framework listed first, as in the dashboard.
+        """
+        filled = np.where(self.valid, self.times, np.inf)
+        winner = np.argmin(filled, axis=FRAMEWORK_AXIS)
+        contested = self.valid.any(axis=FRAMEWORK_AXIS)
+        wins = winner[..., None, :] == np.arange(len(self.frameworks))[:, None]
+        return (wins & contested[..., None, :]).sum(axis=CHALLENGE_AXIS)
+
+    def geomean_speedup(self, framework, gpu):
+        """Geometric-mean speedup of every cell over the baseline cell
+
+        Only challenges where both the cell and the baseline have a timing are
+        used. Returns (speedups, challenge counts), both (..., frameworks, gpus).
+        """
+        f, g = self.cell(framework, gpu)
+        baseline = self.times[..., f, g][..., None, None]
+        mask = self.valid & self.valid[..., f, g][..., None, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_ratios = np.log(baseline) - np.log(self.times)
+        return _masked_geomean(log_ratios, mask, CHALLENGE_AXIS)
+
+    def gpu_scaling(self, reference_gpu=None):
+        """Geometric-mean speedup of each GPU over reference_gpu within each framework"""
+        g = self.gpus.index(reference_gpu) if reference_gpu else 0
+        reference = self.times[..., g][..., None]
+        mask = self.valid & self.valid[..., g][..., None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            log_ratios = np.log(reference) - np.log(self.times)
+        return _masked_geomean(log_ratios, mask, CHALLENGE_AXIS)
+
+    def pareto_front(self, gpu_cost=None):
+        """Cells no other cell beats on both runtime and GPU cost, per challenge
+
+        gpu_cost defaults to the GPU order (oldest generation cheapest). Returns
+        a boolean (..., challenges, frameworks, gpus) mask.
+        """
+        cost = np.arange(len(self.gpus)) if gpu_cost is None else np.asarray(gpu_cost)
+        shape = self.times.shape
+        cells = shape[FRAMEWORK_AXIS] * shape[GPU_AXIS]
+        times = np.where(self.valid, self.times, np.inf).reshape(shape[:-2] + (cells,))
+        costs = np.broadcast_to(cost, shape[-2:]).reshape(cells)
+
+        # dominated[..., i] if some cell j is no worse on both and better on one
+        t_i, t_j = times[..., :, None], times[..., None, :]
+        c_i, c_j = costs[:, None], costs[None, :]
+        dominates = (t_j <= t_i) & (c_j <= c_i) & ((t_j < t_i) | (c_j < c_i))
+        dominated = (dominates & np.isfinite(t_j)).any(axis=-1)
+        return ~dominated.reshape(shape) & self.valid
+
+
+def _short(gpu):
+    return gpu.replace("NVIDIA ", "").replace("-80GB", "")
+
+
+def _print_matrix(title, tensor, values, fmt):
+    print(f"\n{title}")
+    print(f"   {'':<10}" + "".join(f"{_short(g):>10}" for g in tensor.gpus))
+    for f, framework in enumerate(tensor.frameworks):
+        cells = [
+            f"{fmt.format(v):>10}" if np.isfinite(v) else f"{'-':>10}" for v in values[f]
+        ]
+        print(f"   {framework:<10}" + "".join(cells))
+
+
+def print_report(tensor, baseline=None):
+    """Wins, geomean speedups, GPU scaling and Pareto fronts of a single snapshot
+
+    baseline defaults to the tensor's first framework on its first GPU.
+    """
+    baseline = baseline or (tensor.frameworks[0], tensor.gpus[0])
+    wins = tensor.win_counts()
+    speedups, _ = tensor.geomean_speedup(*baseline)
+    scaling, _ = tensor.gpu_scaling()
+    front = tensor.pareto_front()
+
+    print(f"\n📐 {len(tensor.challenges)} challenges, {int(tensor.valid.sum())} valid timings")
+    _print_matrix("🏆 Wins per GPU", tensor, wins.astype(float), "{:.0f}")
+    _print_matrix(
+        f"⚡ Geomean speedup vs {baseline[0]} on {_short(baseline[1])}", tensor, speedups, "{:.2f}x"
+    )
+    _print_matrix(f"📈 GPU scaling vs {_short(tensor.gpus[0])}", tensor, scaling, "{:.2f}x")
+    _print_matrix(
+        "🎯 Pareto-front appearances (runtime vs GPU generation)",
+        tensor,
+        front.sum(axis=CHALLENGE_AXIS).astype(float),
+        "{:.0f}",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized analytics over LeetGPU results")
+    parser.add_argument("files", nargs="+", help="results files, compact files or journals")
+    parser.add_argument(
+        "--baseline",
+        nargs=2,
+        metavar=("FRAMEWORK", "GPU"),
+        help="baseline cell for the geomean speedups (default: first framework and GPU)",
+    )
+    args = parser.parse_args()
+
+    tensor = ResultsTensor.stack(args.files)
+    baseline = tuple(args.baseline or (tensor.frameworks[0], tensor.gpus[0]))
+
+    start = time.perf_counter()
+    tensor.win_counts()
+    tensor.geomean_speedup(*baseline)
+    tensor.gpu_scaling()
+    tensor.ranks()
+    tensor.pareto_front()
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  All metrics over {len(args.files)} snapshot(s): {elapsed * 1000:.1f} ms")
+
+    # Report the last snapshot given
+    latest = ResultsTensor(
+        tensor.challenges, tensor.frameworks, tensor.gpus, tensor.times[-1], tensor.titles
+    )
+    print_report(latest, baseline)
+
+
+if __name__ == "__main__":
+    main()
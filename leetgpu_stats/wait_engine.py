@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Event-driven waits for the LeetGPU scraper.
+
+Replaces the fixed time.sleep() calls with polling for concrete page conditions
+(clickable options, leaderboard DOM mutations, network idle) and records how much
+time each step took compared to the sleep it replaced.
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Fixed sleeps the scraper used before, per step (seconds)
+LEGACY_SLEEPS = {
+    "page_load": 10,
+    "leaderboard_load": 8,
+    "auth_verify": 3,
+    "dropdown_open": 2,
+    "selection_settle": 3,
+    "extract_settle": 3,
+}
+
+# Upper bound for each condition before giving up (seconds)
+DEFAULT_TIMEOUTS = {
+    "page_load": 20,
+    "leaderboard_load": 15,
+    "auth_verify": 10,
+    "dropdown_open": 5,
+    "selection_settle": 6,
+    "extract_settle": 5,
+}
+
+POLL_INTERVAL = 0.1
+QUIET_MS = 300
+NETWORK_IDLE_MS = 500
+
+# Installs a MutationObserver and fetch/XHR counters once per page, then
+# returns the current counters. Safe to run repeatedly.
+PROBE_SCRIPT = """
+if (!window.__leetgpuWait) {
+    const state = {mutations: 0, lastMutation: Date.now(), inflight: 0, lastNetwork: Date.now()};
+    new MutationObserver(() => {
+        state.mutations++;
+        state.lastMutation = Date.now();
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+    const touch = () => { state.lastNetwork = Date.now(); };
+    const originalFetch = window.fetch;
+    window.fetch = function (...args) {
+        state.inflight++;
+        touch();
+        return originalFetch.apply(this, args).finally(() => { state.inflight--; touch(); });
+    };
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        state.inflight++;
+        touch();
+        this.addEventListener('loadend', () => { state.inflight--; touch(); });
+        return originalSend.apply(this, args);
+    };
+    window.__leetgpuWait = state;
+}
+const s = window.__leetgpuWait;
+return {
+    ready: document.readyState,
+    mutations: s.mutations,
+    msSinceMutation: Date.now() - s.lastMutation,
+    inflight: s.inflight,
+    msSinceNetwork: Date.now() - s.lastNetwork
+};
+"""
+
+
+class WaitStats:
+    """Per-step wait timings shared by every driver of a run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.steps = {}
+
+    def record(self, step, waited, timed_out):
+        with self.lock:
+            entry = self.steps.setdefault(
+                step, {"count": 0, "waited_s": 0.0, "legacy_s": 0.0, "timeouts": 0}
+            )
+            entry["count"] += 1
+            entry["waited_s"] += waited
+            entry["legacy_s"] += LEGACY_SLEEPS.get(step, 0)
+            entry["timeouts"] += int(timed_out)
+
+    def as_dict(self):
+        with self.lock:
+            return {
+                step: dict(entry, saved_s=entry["legacy_s"] - entry["waited_s"])
+                for step, entry in self.steps.items()
+            }
+
+    def report(self):
+        steps = self.as_dict()
+        if not steps:
+            return
+
+        print(f"\n⏱️  Wait engine summary:")
+        print(f"   {'step':<18}{'count':>7}{'waited':>10}{'sleeps':>10}{'saved':>10}{'timeouts':>10}")
+        total_saved = 0.0
+        for step, entry in steps.items():
+            total_saved += entry["saved_s"]
+            print(
+                f"   {step:<18}{entry['count']:>7}{entry['waited_s']:>9.1f}s"
+                f"{entry['legacy_s']:>9.1f}s{entry['saved_s']:>9.1f}s{entry['timeouts']:>10}"
+            )
+        print(f"   Total time saved vs fixed sleeps: {total_saved / 60:.1f} minutes")
+
+
+class WaitEngine:
+    """Poll the page for concrete conditions instead of sleeping"""
+
+    def __init__(self, driver, stats=None, timeouts=None, ready_states=("complete",)):
+        self.driver = driver
+        self.stats = stats or WaitStats()
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        # Eager page loads treat "interactive" as ready; the root, network and
+        # mutation checks below still have to pass
+        self.ready_states = ready_states
+
+    def probe(self):
+        """Return the page counters, installing the observers if needed"""
+        try:
+            return self.driver.execute_script(PROBE_SCRIPT)
+        except Exception:
+            return None
+
+    def mark(self):
+        """Mutation count to compare against after triggering a change"""
+        state = self.probe()
+        return state["mutations"] if state else 0
+
+    def wait_for(self, step, condition):
+        """Poll condition(driver) until truthy or the step timeout expires"""
+        start = time.monotonic()
+        result = None
+        timed_out = False
+        try:
+            result = WebDriverWait(
+                self.driver, self.timeouts.get(step, 10), poll_frequency=POLL_INTERVAL
+            ).until(condition)
+        except TimeoutException:
+            timed_out = True
+        self.stats.record(step, time.monotonic() - start, timed_out)
+        return result
+
+    def wait_for_clickable(self, step, locator):
+        """Wait until the element at locator can be clicked and return it"""
+        return self.wait_for(step, EC.element_to_be_clickable(locator))
+
+    def wait_for_page(self, step="page_load"):
+        """Wait for the React root to render and the network to go quiet"""
+
+        def page_ready(driver):
+            if not driver.find_elements(By.ID, "root"):
+                return False
+            state = self.probe()
+            return (
+                state is not None
+                and state["ready"] in self.ready_states
+                and state["inflight"] == 0
+                and state["msSinceNetwork"] >= NETWORK_IDLE_MS
+                and state["msSinceMutation"] >= QUIET_MS
+            )
+
+        return self.wait_for(step, page_ready)
+
+    def wait_for_dom_change(self, step, baseline):
+        """Wait until the DOM mutated after baseline and then stayed quiet"""
+
+        def changed(driver):
+            state = self.probe()
+            return (
+                state is not None
+                and state["mutations"] > baseline
+                and state["msSinceMutation"] >= QUIET_MS
+                and state["inflight"] == 0
+            )
+
+        return self.wait_for(step, changed)
+
+    def wait_for_network_idle(self, step):
+        """Wait until no fetch/XHR has been in flight for a short while"""
+
+        def idle(driver):
+            state = self.probe()
+            return (
+                state is not None
+                and state["inflight"] == 0
+                and state["msSinceNetwork"] >= NETWORK_IDLE_MS
+            )
+
+        return self.wait_for(step, idle)
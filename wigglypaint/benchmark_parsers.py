@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the html.parser and lxml post parsers on saved Wigglypaint pages.
+
+Both engines parse every page; the script checks that they return identical
+comments and reports posts per second for each.
+
+Usage:
+    python benchmark_parsers.py --fetch 10 --pages-dir saved_pages
+    python benchmark_parsers.py saved_pages/*.html --repeat 5
+"""
+
+import argparse
+import glob
+import logging
+import os
+import time
+from typing import List
+
+from scraper import PARSERS, FixedWigglypaintScraper
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_pages(count: int, directory: str) -> List[str]:
+    """Save the first `count` comment pages as page_NNN.html."""
+    os.makedirs(directory, exist_ok=True)
+    scraper = FixedWigglypaintScraper()
+    url = scraper.base_url
+    paths = []
+
+    for page_num in range(1, count + 1):
+        response = scraper.fetcher.get(url, timeout=15)
+        path = os.path.join(directory, f"page_{page_num:03d}.html")
+        with open(path, "wb") as f:
+            f.write(response.content)
+        paths.append(path)
+
+        next_url = scraper.find_next_page_url_raw(response.text)
+        if not next_url:
+            break
+        url = scraper.absolute_url(next_url)
+
+    logger.info(f"Saved {len(paths)} pages to {directory}")
+    return paths
+
+
+def benchmark(pages: List[bytes], repeat: int = 3) -> dict:
+    """Best-of-`repeat` parse time and posts/second per engine."""
+    results = {}
+    for parser in PARSERS:
+        scraper = FixedWigglypaintScraper(parser)
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            comments = [scraper.parse_page(page, i) for i, page in enumerate(pages, 1)]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        posts = sum(len(page_comments) for page_comments in comments)
+        results[parser] = {
+            "seconds": best,
+            "posts": posts,
+            "posts_per_second": posts / best if best else 0.0,
+            "comments": comments,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Wigglypaint post parsers")
+    parser.add_argument("pages", nargs="*", help="saved HTML pages")
+    parser.add_argument("--fetch", type=int, help="download this many pages first")
+    parser.add_argument("--pages-dir", default="saved_pages", help="where --fetch saves pages")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine, best is kept")
+    args = parser.parse_args()
+
+    paths = list(args.pages)
+    if args.fetch:
+        paths += fetch_pages(args.fetch, args.pages_dir)
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(args.pages_dir, "*.html")))
+    if not paths:
+        parser.error("no pages given; pass HTML files or use --fetch")
+
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read())
+
+    # Per-page "Found N posts" lines would drown the report
+    logging.getLogger("scraper").setLevel(logging.WARNING)
+    results = benchmark(pages, args.repeat)
+
+    print(f"\n⏱️  Parsed {len(pages)} pages (best of {args.repeat})")
+    for name, result in results.items():
+        print(
+            f"   {name:<12} {result['posts']:>6} posts in {result['seconds']:.3f}s"
+            f"  → {result['posts_per_second']:,.0f} posts/s"
+        )
+
+    baseline, fast = results["html.parser"], results["lxml"]
+    if baseline["seconds"] and fast["seconds"]:
+        print(f"   lxml speedup: {baseline['seconds'] / fast['seconds']:.1f}x")
+    identical = baseline["comments"] == fast["comments"]
+    print(f"   Identical results: {'✅ yes' if identical else '❌ NO'}")
+
+
+if __name__ == "__main__":
+    main()
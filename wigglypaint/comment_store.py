@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Columnar in-memory store for scraped Wigglypaint comments.
+
+A list of Comment namedtuples keeps a tuple, a list and several str objects per
+post, with every author name and "3 days ago" repeated. CommentStore keeps one
+array per field instead:
+
+    authors, timestamps     int32 codes into de-duplicated string tables
+    upvotes, downvotes,
+    page_num                int32
+    post_id                 int64, the number of "post-<n>" (other IDs are
+                            negative codes into a small table)
+    has_image               bool
+    content                 int64 offsets into one UTF-8 byte pool
+    image URLs              int64 offsets per comment into the URL list, and
+                            int64 offsets per URL into a second byte pool
+
+save() writes a JSON header followed by the raw column buffers, each aligned
+to 64 bytes. load() maps the file and hands out numpy views of it, so loading
+copies nothing and a store larger than memory can still be opened.
+
+Usage:
+    python comment_store.py build wigglypaint_all_comments.jsonl comments.store
+    python comment_store.py benchmark --rows 1000000
+"""
+
+import argparse
+import csv
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+from array import array
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+
+from scraper import Comment, TopImageComments
+
+FORMAT = "wigglypaint-comment-store-v1"
+MAGIC = b"WPCSTORE"
+ALIGNMENT = 64
+
+COLUMNS = {
+    "author": np.int32,
+    "timestamp": np.int32,
+    "upvotes": np.int32,
+    "downvotes": np.int32,
+    "page_num": np.int32,
+    "post_id": np.int64,
+    "has_image": np.bool_,
+    "content_offsets": np.int64,
+    "content_pool": np.uint8,
+    "image_offsets": np.int64,
+    "url_offsets": np.int64,
+    "url_pool": np.uint8,
+}
+
+
+class _Interner:
+    """String -> code, handing out codes in order of first appearance."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class CommentStoreBuilder:
+    """Append comments one at a time, then build() a CommentStore.
+
+    Columns grow in compact array.array buffers, so building from a streamed
+    crawl never holds the Comment objects.
+    """
+
+    def __init__(self):
+        self.authors = _Interner()
+        self.timestamps = _Interner()
+        self.other_post_ids = _Interner()
+        self.columns = {
+            "author": array("i"),
+            "timestamp": array("i"),
+            "upvotes": array("i"),
+            "downvotes": array("i"),
+            "page_num": array("i"),
+            "post_id": array("q"),
+            "has_image": bytearray(),
+            "content_offsets": array("q", [0]),
+            "image_offsets": array("q", [0]),
+            "url_offsets": array("q", [0]),
+        }
+        self.content_pool = bytearray()
+        self.url_pool = bytearray()
+
+    def append(self, comment: Comment):
+        c = self.columns
+        c["author"].append(self.authors.code(comment.author))
+        c["timestamp"].append(self.timestamps.code(comment.timestamp))
+        c["upvotes"].append(comment.upvotes)
+        c["downvotes"].append(comment.downvotes)
+        c["page_num"].append(comment.page_num)
+        c["post_id"].append(encode_post_id(comment.post_id, self.other_post_ids))
+        c["has_image"].append(bool(comment.has_image))
+
+        self.content_pool += comment.content.encode("utf-8")
+        c["content_offsets"].append(len(self.content_pool))
+        for url in comment.image_urls:
+            self.url_pool += url.encode("utf-8")
+            c["url_offsets"].append(len(self.url_pool))
+        c["image_offsets"].append(len(c["url_offsets"]) - 1)
+
+    def extend(self, comments: Iterable[Comment]):
+        for comment in comments:
+            self.append(comment)
+
+    def build(self) -> "CommentStore":
+        columns = {
+            name: np.frombuffer(buffer, dtype=COLUMNS[name]).copy()
+            for name, buffer in self.columns.items()
+        }
+        columns["content_pool"] = np.frombuffer(bytes(self.content_pool), dtype=np.uint8)
+        columns["url_pool"] = np.frombuffer(bytes(self.url_pool), dtype=np.uint8)
+        return CommentStore(
+            columns,
+            self.authors.values,
+            self.timestamps.values,
+            self.other_post_ids.values,
+        )
+
+
+def encode_post_id(post_id: str, others: _Interner) -> int:
+    """n for "post-n", otherwise -(code + 1) in the table of other IDs."""
+    prefix, _, digits = post_id.partition("-")
+    if prefix == "post" and digits.isdigit() and str(int(digits)) == digits:
+        return int(digits)
+    return -(others.code(post_id) + 1)
+
+
+class CommentStore:
+    """Comments as numpy columns; store[i] rebuilds the i-th Comment"""
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        authors: List[str],
+        timestamps: List[str],
+        other_post_ids: List[str],
+    ):
+        self.columns = columns
+        self.authors = authors
+        self.timestamps = timestamps
+        self.other_post_ids = other_post_ids
+        for name, values in columns.items():
+            setattr(self, name, values)
+
+    @classmethod
+    def from_comments(cls, comments: Iterable[Comment]) -> "CommentStore":
+        builder = CommentStoreBuilder()
+        builder.extend(comments)
+        return builder.build()
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "CommentStore":
+        """Store of a JSONL file written by CommentStreamWriter."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_comments(Comment(**json.loads(line)) for line in f)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "CommentStore":
+        """Store of a CSV written by save_results() (content is cut at 500 characters)."""
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            return cls.from_comments(
+                Comment(
+                    author=row["Author"],
+                    content=row["Content"],
+                    upvotes=int(row["Upvotes"]),
+                    downvotes=int(row["Downvotes"]),
+                    timestamp=row["Timestamp"],
+                    has_image=row["Has_Image"] == "True",
+                    image_urls=[url for url in row["Image_URLs"].split(";") if url],
+                    page_num=int(row["Page_Number"]),
+                    post_id=row["Post_ID"],
+                )
+                for row in csv.DictReader(f)
+            )
+
+    def __len__(self) -> int:
+        return len(self.upvotes)
+
+    def content(self, i: int) -> str:
+        start, end = self.content_offsets[i], self.content_offsets[i + 1]
+        return self.content_pool[start:end].tobytes().decode("utf-8")
+
+    def image_urls(self, i: int) -> List[str]:
+        first, last = self.image_offsets[i], self.image_offsets[i + 1]
+        offsets = self.url_offsets[first : last + 1]
+        return [
+            self.url_pool[start:end].tobytes().decode("utf-8")
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    def post_id_str(self, i: int) -> str:
+        value = int(self.post_id[i])
+        return f"post-{value}" if value >= 0 else self.other_post_ids[-value - 1]
+
+    def __getitem__(self, i: int) -> Comment:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("comment index out of range")
+        return Comment(
+            author=self.authors[self.author[i]],
+            content=self.content(i),
+            upvotes=int(self.upvotes[i]),
+            downvotes=int(self.downvotes[i]),
+            timestamp=self.timestamps[self.timestamp[i]],
+            has_image=bool(self.has_image[i]),
+            image_urls=self.image_urls(i),
+            page_num=int(self.page_num[i]),
+            post_id=self.post_id_str(i),
+        )
+
+    def __iter__(self) -> Iterator[Comment]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def image_counts(self) -> np.ndarray:
+        return np.diff(self.image_offsets)
+
+    def top_with_images(self, limit: int = 50) -> List[Comment]:
+        """Same comments and order as get_top_upvoted_with_images()."""
+        rows = np.flatnonzero(self.has_image)
+        # lexsort: last key first; ties keep row order like the stable sort
+        order = np.lexsort(
+            (
+                rows,
+                -self.image_counts()[rows],
+                self.downvotes[rows],
+                -self.upvotes[rows].astype(np.int64),
+            )
+        )
+        return [self[int(i)] for i in rows[order[:limit]]]
+
+    def posts_per_author(self) -> Dict[str, int]:
+        counts = np.bincount(self.author, minlength=len(self.authors))
+        return dict(zip(self.authors, counts.tolist()))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns (string tables not included)."""
+        return sum(values.nbytes for values in self.columns.values())
+
+    def save(self, path: str):
+        header = {
+            "format": FORMAT,
+            "rows": len(self),
+            "authors": self.authors,
+            "timestamps": self.timestamps,
+            "other_post_ids": self.other_post_ids,
+            "columns": {},
+        }
+        # Column offsets depend on the header size, which depends on the offsets
+        header_size = 0
+        while True:
+            offset = _align(len(MAGIC) + 8 + header_size)
+            for name in COLUMNS:
+                values = self.columns[name]
+                header["columns"][name] = {"offset": offset, "length": len(values)}
+                offset = _align(offset + values.nbytes)
+            encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+            if len(encoded) == header_size:
+                break
+            header_size = len(encoded)
+
+        with open(path, "wb") as f:
+            f.write(MAGIC + len(encoded).to_bytes(8, "little") + encoded)
+            for name in COLUMNS:
+                f.write(b"\0" * (header["columns"][name]["offset"] - f.tell()))
+                f.write(np.ascontiguousarray(self.columns[name]).data)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CommentStore":
+        """Columns are views of the mapped file, or of one read buffer with mmap=False."""
+        if mmap:
+            data = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            data = np.fromfile(path, dtype=np.uint8)
+        if data[: len(MAGIC)].tobytes() != MAGIC:
+            raise ValueError(f"{path} is not a comment store")
+
+        header_size = int.from_bytes(data[len(MAGIC) : len(MAGIC) + 8].tobytes(), "little")
+        start = len(MAGIC) + 8
+        header = json.loads(data[start : start + header_size].tobytes().decode("utf-8"))
+        if header.get("format") != FORMAT:
+            raise ValueError(f"Unsupported comment store format {header.get('format')!r}")
+
+        columns = {}
+        for name, dtype in COLUMNS.items():
+            spec = header["columns"][name]
+            nbytes = spec["length"] * np.dtype(dtype).itemsize
+            columns[name] = data[spec["offset"] : spec["offset"] + nbytes].view(dtype)
+        return cls(columns, header["authors"], header["timestamps"], header["other_post_ids"])
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def synthetic_comments(rows: int, seed: int = 0) -> Iterator[Comment]:
+    """Comments shaped like the real dataset, each with its own str objects.
+
+    Authors follow a long tail, timestamps come from a few hundred relative
+    times, 60% of posts have one or two image URLs.
+    """
+    rng = random.Random(seed)
+    words = ["wiggly", "paint", "love", "this", "so", "cute", "art", "frog", "lol", "omg"]
+    units = ["minute", "hour", "day", "week", "month", "year"]
+    for i in range(rows):
+        author_id = int(rng.paretovariate(1.2)) % max(1, rows // 4)
+        urls = [
+            f"https://img.itch.zone/aW1nLz{i:08d}{k}/original/{rng.getrandbits(32):08x}.gif"
+            for k in range(rng.choice((1, 1, 1, 2)) if rng.random() < 0.6 else 0)
+        ]
+        yield Comment(
+            author=f"artist_{author_id}",
+            content=" ".join(rng.choices(words, k=rng.randint(0, 12))),
+            upvotes=rng.randint(0, 30),
+            downvotes=rng.randint(0, 2),
+            timestamp=f"{rng.randint(1, 60)} {rng.choice(units)}s ago",
+            has_image=bool(urls),
+            image_urls=urls,
+            page_num=i // 40 + 1,
+            post_id=f"post-{20000000 - i}",
+        )
+
+
+def _traced_bytes(build):
+    """Bytes still allocated after build() returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def benchmark(rows: int, path: str) -> dict:
+    list_bytes, comments = _traced_bytes(lambda: list(synthetic_comments(rows)))
+    del comments
+    store_bytes, store = _traced_bytes(
+        lambda: CommentStore.from_comments(synthetic_comments(rows))
+    )
+
+    start = time.perf_counter()
+    store.save(path)
+    save_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = CommentStore.load(path)
+    load_s = time.perf_counter() - start
+
+    # Check against a fresh stream rather than a second list of every comment
+    sample = set(random.Random(1).sample(range(rows), min(rows, 1000))) | {rows - 1}
+    expected_top = TopImageComments(100)
+    identical = True
+    for i, comment in enumerate(synthetic_comments(rows)):
+        expected_top.add(comment)
+        if i in sample:
+            identical = identical and loaded[i] == comment
+
+    start = time.perf_counter()
+    top = loaded.top_with_images(100)
+    top_s = time.perf_counter() - start
+
+    return {
+        "rows": rows,
+        "list_bytes": list_bytes,
+        "store_bytes": store_bytes,
+        "file_bytes": os.path.getsize(path),
+        "save_s": save_s,
+        "load_s": load_s,
+        "top_s": top_s,
+        "top_matches": top == expected_top.comments(),
+        "identical": identical,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar Wigglypaint comment store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="convert a JSONL or CSV dataset")
+    build.add_argument("source", help="wigglypaint_all_comments.jsonl or .csv")
+    build.add_argument("output", help="store file to write")
+
+    bench = sub.add_parser("benchmark", help="memory of a Comment list vs CommentStore")
+    bench.add_argument("--rows", type=int, default=1_000_000)
+    bench.add_argument("--output", default="benchmark_comments.store")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.source.endswith(".csv"):
+            store = CommentStore.from_csv(args.source)
+        else:
+            store = CommentStore.from_jsonl(args.source)
+        store.save(args.output)
+        print(f"📦 {len(store)} comments, {len(store.authors)} authors -> {args.output}")
+        print(f"   {os.path.getsize(args.output) / 1024:.0f} KB")
+        return
+
+    results = benchmark(args.rows, args.output)
+    mb = 1024 * 1024
+    print(f"\n🧮 {results['rows']:,} comments")
+    print(f"   list of Comment: {results['list_bytes'] / mb:,.0f} MB")
+    print(
+        f"   CommentStore:    {results['store_bytes'] / mb:,.0f} MB "
+        f"({results['list_bytes'] / results['store_bytes']:.1f}x smaller)"
+    )
+    print(f"   File: {results['file_bytes'] / mb:,.0f} MB, saved in {results['save_s']:.2f}s")
+    print(f"   Load (memory-mapped): {results['load_s'] * 1000:.1f} ms")
+    print(f"   Top 100 with images: {results['top_s'] * 1000:.1f} ms")
+    print(f"   Identical comments: {'✅ yes' if results['identical'] else '❌ NO'}")
+    print(f"   Same top 100 as get_top_upvoted_with_images: {'✅ yes' if results['top_matches'] else '❌ NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,23 @@
 Generate HTML page with the top 10 most upvoted Wigglypaint posts with GIFs
 """
 
+import argparse
 import csv
+import json
+import os
 
 
-def generate_html():
+def local_images(manifest_path="images/manifest.json"):
+    """post_id -> first downloaded image, from image_downloader.py's manifest"""
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        posts = json.load(f)["posts"]
+    image_dir = os.path.dirname(manifest_path)
+    return {post_id: f"{image_dir}/{paths[0]}" for post_id, paths in posts.items()}
+
+
+def generate_html(use_local_images=False):
     # Read the corrected top results
     top_posts = []
     with open("wigglypaint_top_comments.csv", "r", encoding="utf-8") as f:
@@ -20,6 +33,9 @@ def generate_html():
         )
         top_posts = sorted_posts[:10]
 
+    # Serve downloaded copies instead of hotlinking img.itch.zone
+    local = local_images() if use_local_images else {}
+
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -283,7 +299,7 @@ def generate_html():
         elif len(content) > 120:
             content = content[:120] + "..."
 
-        image_url = post["Image_URLs"]
+        image_url = local.get(post["Post_ID"], post["Image_URLs"])
 
         html_content += f"""
             <div class="post-card">
@@ -334,4 +350,11 @@ def generate_html():
 
 
 if __name__ == "__main__":
-    generate_html()
+    parser = argparse.ArgumentParser(description="Generate the top 10 Wigglypaint posts page")
+    parser.add_argument(
+        "--local-images",
+        action="store_true",
+        help="link images downloaded by image_downloader.py instead of img.itch.zone",
+    )
+    args = parser.parse_args()
+    generate_html(use_local_images=args.local_images)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Delta sync for the Wigglypaint community posts.
+
+New posts only ever appear at the top of the topic, so a refresh does not need
+to walk all pages again. The sync state file records the highest post ID that
+is fully synced and, after an interrupted sync, the page it stopped at. A sync:
+
+- crawls from the first page and appends posts missing from
+  wigglypaint_all_comments.csv, flushing after every page
+- stops at the first page with no post newer than the synced post ID
+- only then advances the synced post ID; an interrupted sync keeps the old one
+  and saves the page it stopped at, so the next sync catches up on the top
+  pages and continues from that page
+
+Votes of posts that were already synced are not refreshed; run
+`python scraper.py --full` for that.
+
+Usage:
+    python delta_sync.py
+    python delta_sync.py --lxml --max-pages 50
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Optional, Set
+
+import requests
+
+from scraper import CSV_HEADER, FixedWigglypaintScraper, comment_to_row, make_scraper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CSV = "wigglypaint_all_comments.csv"
+DEFAULT_STATE = "wigglypaint_sync_state.json"
+
+
+def post_number(post_id: str) -> int:
+    """13259483 for "post-13259483"; 0 if there is no number."""
+    digits = post_id.rpartition("-")[2]
+    return int(digits) if digits.isdigit() else 0
+
+
+def read_post_ids(csv_path: str) -> Set[str]:
+    """Post IDs already in the CSV."""
+    if not os.path.exists(csv_path):
+        return set()
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        return {row["Post_ID"] for row in csv.DictReader(f)}
+
+
+def load_sync_state(state_path: str, post_ids: Set[str]) -> dict:
+    """Saved state, or one treating every post in the CSV as synced."""
+    if os.path.exists(state_path):
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {
+        "max_post_id": max((post_number(p) for p in post_ids), default=0),
+        "resume_url": None,
+    }
+
+
+def save_sync_state(state_path: str, state: dict):
+    # Replace atomically so a crash never leaves a half-written state
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def delta_sync(
+    scraper: FixedWigglypaintScraper,
+    csv_path: str = DEFAULT_CSV,
+    state_path: str = DEFAULT_STATE,
+    max_pages: int = 200,
+) -> dict:
+    """Append posts newer than the last sync to the CSV; returns the new state."""
+    known = read_post_ids(csv_path)
+    state = load_sync_state(state_path, known)
+    since = state["max_post_id"]
+    resume_url: Optional[str] = state.get("resume_url")
+    head = since
+
+    logger.info(f"Delta sync: {len(known)} posts known, synced up to post {since}")
+    start = time.monotonic()
+
+    new_file = not os.path.exists(csv_path)
+    url = scraper.base_url
+    pages = 0
+    added = 0
+    complete = False
+
+    with open(csv_path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(CSV_HEADER)
+
+        for page_num in range(1, max_pages + 1):
+            logger.info(f"Syncing page {page_num}: {url}")
+            try:
+                response = scraper.fetcher.get(url, timeout=15)
+                scraper.archive_page(url, response, page_num)
+                page_comments = scraper.parse_page(response.content, page_num)
+            except requests.RequestException as e:
+                logger.error(f"Giving up on page {page_num}: {e}")
+                break
+            except Exception as e:
+                logger.error(f"Error parsing page {page_num}: {e}")
+                break
+
+            if not page_comments:
+                logger.info(f"No comments found on page {page_num}, reached end")
+                complete = True
+                break
+            pages += 1
+
+            fresh = [c for c in page_comments if c.post_id not in known]
+            for comment in fresh:
+                writer.writerow(comment_to_row(comment))
+                known.add(comment.post_id)
+            f.flush()
+            added += len(fresh)
+
+            newest = max(post_number(c.post_id) for c in page_comments)
+            head = max(head, newest)
+            logger.info(f"Page {page_num}: {len(fresh)} new posts (total new: {added})")
+
+            if newest <= since:
+                logger.info("Reached a page of synced posts, stopping")
+                complete = True
+                break
+
+            if resume_url and not fresh:
+                # Caught up with the posts an interrupted sync appended
+                logger.info(f"Resuming interrupted sync at {resume_url}")
+                url, resume_url = resume_url, None
+            else:
+                next_url = scraper.find_next_page_url_raw(response.text)
+                if not next_url:
+                    logger.info("No next page link found, reached end")
+                    complete = True
+                    break
+                url = scraper.absolute_url(next_url)
+
+    state = {
+        # Only a sync that reached synced posts covers everything up to `head`
+        "max_post_id": head if complete else since,
+        # An earlier resume point still ahead of this sync stays the resume point
+        "resume_url": None if complete else (resume_url or url),
+        "last_sync": datetime.now().isoformat(timespec="seconds"),
+        "last_sync_new_posts": added,
+        "last_sync_pages": pages,
+        "last_sync_seconds": round(time.monotonic() - start, 1),
+        "complete": complete,
+    }
+    save_sync_state(state_path, state)
+    logger.info(
+        f"Delta sync {'complete' if complete else 'interrupted'}: {added} new posts "
+        f"from {pages} pages in {state['last_sync_seconds']}s"
+    )
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append new Wigglypaint posts to the CSV")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="all-comments CSV to update")
+    parser.add_argument("--state", default=DEFAULT_STATE, help="sync state file")
+    parser.add_argument("--max-pages", type=int, default=200)
+    parser.add_argument("--lxml", action="store_true", help="use the lxml post parser")
+    parser.add_argument(
+        "--no-archive", action="store_true", help="do not add fetched pages to the page archive"
+    )
+    args = parser.parse_args()
+
+    scraper = make_scraper(use_lxml=args.lxml, archive=not args.no_archive)
+    state = delta_sync(scraper, args.csv, args.state, args.max_pages)
+
+    print(f"\n🔄 **DELTA SYNC {'COMPLETE' if state['complete'] else 'INTERRUPTED'}:**")
+    print(f"New posts: {state['last_sync_new_posts']}")
+    print(f"Pages fetched: {state['last_sync_pages']}")
+    print(f"Time: {state['last_sync_seconds']}s")
+    print(f"Synced up to post: {state['max_post_id']}")
+    if not state["complete"]:
+        print(f"Next sync resumes at: {state['resume_url']}")
+    scraper.fetcher.stats.report(scraper.fetcher.limiter)
+
+
+if __name__ == "__main__":
+    main()
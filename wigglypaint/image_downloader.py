@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Download the artwork referenced by the Wigglypaint comment dataset.
+
+Every URL in the Image_URLs column of wigglypaint_all_comments.csv is fetched
+once by a bounded thread pool over a pooled requests.Session:
+
+- each host gets at most `per_host_rate` requests per second across all threads
+- 429 and 5xx responses are retried with backoff, honouring Retry-After
+- files are stored by SHA-256 as images/<2 hex>/<sha256><ext>, so the same
+  artwork posted twice is stored once
+- images/manifest.json maps every URL to its file and every post_id to its
+  files, and is saved as downloads finish. A rerun skips URLs already in the
+  manifest and retries the ones that failed.
+
+ImageStandInServer serves deterministic images for any path, so the whole
+pipeline can be run against localhost:
+
+    python image_downloader.py
+    python image_downloader.py --workers 16 --per-host-rate 20
+    python image_downloader.py --stand-in --output-dir /tmp/images
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The localhost server scaffolding is shared with the leaderboard stand-ins
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "leetgpu_stats"))
+from local_server import LocalServer  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CSV = "wigglypaint_all_comments.csv"
+DEFAULT_OUTPUT_DIR = "images"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = "wigglypaint-images-v1"
+CHUNK_SIZE = 64 * 1024
+# Manifest saves during a run, so an interrupted run loses at most this many
+SAVE_EVERY = 50
+
+IMAGE_EXTENSIONS = {".gif", ".png", ".jpg", ".jpeg", ".webp"}
+CONTENT_TYPE_EXTENSIONS = {
+    "image/gif": ".gif",
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+}
+
+
+def load_post_images(csv_path: str = DEFAULT_CSV) -> Dict[str, List[str]]:
+    """post_id -> image URLs, for the posts of the dataset that have images."""
+    posts = OrderedDict()
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            urls = [url for url in row["Image_URLs"].split(";") if url]
+            if urls:
+                posts[row["Post_ID"]] = urls
+    return posts
+
+
+def file_extension(url: str, content_type: str) -> str:
+    ext = os.path.splitext(urlsplit(url).path)[1].lower()
+    if ext in IMAGE_EXTENSIONS:
+        return ext
+    return CONTENT_TYPE_EXTENSIONS.get(content_type.split(";")[0].strip(), "")
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = defaultdict(float)
+
+    def wait(self, host: str):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot[host])
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ImageDownloader:
+    """Fetch image URLs concurrently into a content-addressed directory"""
+
+    def __init__(
+        self,
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        max_workers: int = 8,
+        per_host_rate: float = 10.0,
+        timeout: int = 30,
+        retries: int = 3,
+        redirect_to: Optional[str] = None,
+    ):
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # Send every request to this origin instead (e.g. an ImageStandInServer);
+        # the manifest still records the original URLs
+        self.redirect_to = redirect_to
+        self.limiter = HostRateLimiter(per_host_rate)
+        self.lock = threading.Lock()
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) wigglypaint-archiver"}
+        )
+
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        self.manifest = self.load_manifest()
+
+    def load_manifest(self) -> dict:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"format": MANIFEST_FORMAT, "files": {}, "posts": {}, "failed": {}}
+
+    def save_manifest(self):
+        with self.lock:
+            data = json.dumps(self.manifest, indent=2, ensure_ascii=False)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.manifest_path)
+
+    def is_downloaded(self, url: str) -> bool:
+        entry = self.manifest["files"].get(url)
+        return bool(entry) and os.path.exists(os.path.join(self.output_dir, entry["path"]))
+
+    def request_url(self, url: str) -> str:
+        if not self.redirect_to:
+            return url
+        parts = urlsplit(url)
+        return self.redirect_to.rstrip("/") + url[len(f"{parts.scheme}://{parts.netloc}"):]
+
+    def fetch(self, url: str) -> dict:
+        """Download one URL into the store and return its manifest entry."""
+        self.limiter.wait(urlsplit(url).netloc)
+        partial_dir = os.path.join(self.output_dir, ".partial")
+        digest = hashlib.sha256()
+        size = 0
+
+        with self.session.get(self.request_url(url), timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            ext = file_extension(url, response.headers.get("Content-Type", ""))
+            fd, tmp_path = tempfile.mkstemp(dir=partial_dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+        sha256 = digest.hexdigest()
+        path = f"{sha256[:2]}/{sha256}{ext}"
+        final_path = os.path.join(self.output_dir, path)
+        if os.path.exists(final_path):
+            # Same artwork under another URL
+            os.remove(tmp_path)
+            duplicate = True
+        else:
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(tmp_path, final_path)
+            duplicate = False
+        return {"sha256": sha256, "path": path, "bytes": size, "duplicate": duplicate}
+
+    def download_all(self, post_images: Dict[str, List[str]]) -> dict:
+        """Download every URL not in the manifest yet; returns run statistics."""
+        os.makedirs(os.path.join(self.output_dir, ".partial"), exist_ok=True)
+        urls = list(OrderedDict.fromkeys(u for urls in post_images.values() for u in urls))
+        pending = [url for url in urls if not self.is_downloaded(url)]
+        stats = {
+            "urls": len(urls),
+            "already_downloaded": len(urls) - len(pending),
+            "downloaded": 0,
+            "duplicates": 0,
+            "failed": 0,
+            "bytes": 0,
+        }
+        logger.info(
+            f"{len(urls)} image URLs, {len(pending)} to download with {self.max_workers} threads"
+        )
+        start = time.monotonic()
+
+        def run(url):
+            try:
+                entry = self.fetch(url)
+            except (requests.RequestException, OSError) as e:
+                logger.error(f"Failed {url}: {e}")
+                with self.lock:
+                    self.manifest["failed"][url] = str(e)
+                    stats["failed"] += 1
+                return
+
+            duplicate = entry.pop("duplicate")
+            with self.lock:
+                self.manifest["files"][url] = entry
+                self.manifest["failed"].pop(url, None)
+                stats["downloaded"] += 1
+                stats["duplicates"] += duplicate
+                stats["bytes"] += entry["bytes"]
+                done = stats["downloaded"]
+            if done % SAVE_EVERY == 0:
+                logger.info(f"Downloaded {done}/{len(pending)} images")
+                self.save_manifest()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(run, pending))
+
+        with self.lock:
+            files = self.manifest["files"]
+            for post_id, post_urls in post_images.items():
+                paths = [files[url]["path"] for url in post_urls if url in files]
+                if paths:
+                    self.manifest["posts"][post_id] = paths
+        self.save_manifest()
+
+        stats["seconds"] = time.monotonic() - start
+        stats["stored_files"] = len({entry["path"] for entry in files.values()})
+        return stats
+
+
+class ImageStandInServer(LocalServer):
+    """Local HTTP stand-in for img.itch.zone
+
+    Any path returns a GIF whose bytes depend only on the file name, so the
+    same name under two paths exercises de-duplication. With fail_first, the
+    first request for each path answers 503 with Retry-After to exercise retries.
+    """
+
+    def __init__(self, latency_ms=0, fail_first=False, host="127.0.0.1", port=0):
+        seen = set()
+        seen_lock = threading.Lock()
+        self.requests = 0
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with seen_lock:
+                    stand_in.requests += 1
+                    first = self.path not in seen
+                    seen.add(self.path)
+                if latency_ms:
+                    time.sleep(latency_ms / 1000)
+                if fail_first and first:
+                    self.send_response(503)
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                name = self.path.rsplit("/", 1)[-1]
+                rng = random.Random(name)
+                body = b"GIF89a" + rng.randbytes(rng.randint(2000, 60000))
+                self.send_response(200)
+                self.send_header("Content-Type", "image/gif")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        super().__init__(Handler, host, port)
+
+
+def print_stats(stats: dict, output_dir: str):
+    mb = stats["bytes"] / (1024 * 1024)
+    rate = mb / stats["seconds"] if stats["seconds"] else 0.0
+    print(f"\n🖼️  **IMAGE DOWNLOAD COMPLETE:**")
+    print(f"Image URLs: {stats['urls']}")
+    print(f"Already downloaded: {stats['already_downloaded']}")
+    print(f"Downloaded: {stats['downloaded']} ({mb:.1f} MB in {stats['seconds']:.1f}s, {rate:.1f} MB/s)")
+    print(f"Duplicate artwork stored once: {stats['duplicates']}")
+    print(f"Failed (retried next run): {stats['failed']}")
+    print(f"Files in {output_dir}: {stats['stored_files']}")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Download Wigglypaint artwork")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="comment dataset")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--workers", type=int, default=8, help="download threads")
+    parser.add_argument(
+        "--per-host-rate", type=float, default=10.0, help="max requests per second per host"
+    )
+    parser.add_argument(
+        "--stand-in", action="store_true", help="download from a local ImageStandInServer"
+    )
+    parser.add_argument(
+        "--latency-ms", type=int, default=50, help="stand-in response latency"
+    )
+    args = parser.parse_args()
+
+    post_images = load_post_images(args.csv)
+
+    if args.stand_in:
+        with ImageStandInServer(latency_ms=args.latency_ms) as server:
+            downloader = ImageDownloader(
+                args.output_dir, args.workers, args.per_host_rate, redirect_to=server.base_url
+            )
+            stats = downloader.download_all(post_images)
+    else:
+        downloader = ImageDownloader(args.output_dir, args.workers, args.per_host_rate)
+        stats = downloader.download_all(post_images)
+
+    print_stats(stats, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Append-only archive of raw Wigglypaint pages, and offline re-parsing.
+
+Every page the crawler fetches is appended to wigglypaint_pages.archive:
+
+    b"WPARCH1\\n"                                      once, at the start
+    >II header length, body length                    per page
+    header   JSON: url, cursor, page_num, fetched_at, crawl
+    body     zlib-compressed response bytes
+
+Each page is compressed on its own, so pool workers decompress and parse pages
+independently. A record cut short by a crash is ignored when reading.
+
+`reparse` rebuilds every crawl output from the archive without touching the
+network. Crawls are read newest first and the first copy of a post wins, so
+the newest fetch of every post is kept.
+
+Usage:
+    python page_archive.py stats
+    python page_archive.py reparse --lxml --workers 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from scraper import (
+    Comment,
+    CommentStreamWriter,
+    FixedWigglypaintScraper,
+    TopImageComments,
+    _parse_page_worker,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE = "wigglypaint_pages.archive"
+MAGIC = b"WPARCH1\n"
+RECORD_HEADER = struct.Struct(">II")
+COMPRESSION_LEVEL = 6
+
+
+class PageArchive:
+    """Append-only store of fetched pages, one compressed record per page."""
+
+    def __init__(self, path: str = DEFAULT_ARCHIVE, crawl: Optional[str] = None):
+        self.path = path
+        # Pages appended by this object belong to one crawl
+        self.crawl = crawl or datetime.now().isoformat(timespec="seconds")
+        self.file = None
+
+    def append(self, url: str, content: bytes, page_num: int):
+        if self.file is None:
+            self.file = open(self.path, "ab")
+            if self.file.tell() == 0:
+                self.file.write(MAGIC)
+
+        cursor = parse_qs(urlparse(url).query).get("before", [None])[0]
+        header = json.dumps(
+            {
+                "url": url,
+                "cursor": cursor,
+                "page_num": page_num,
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+                "crawl": self.crawl,
+            }
+        ).encode("utf-8")
+        body = zlib.compress(content, COMPRESSION_LEVEL)
+
+        self.file.write(RECORD_HEADER.pack(len(header), len(body)) + header + body)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def records(self) -> Iterator[Tuple[dict, bytes]]:
+        """(header, compressed body) of every complete record, in append order."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a page archive")
+            while True:
+                prefix = f.read(RECORD_HEADER.size)
+                if len(prefix) < RECORD_HEADER.size:
+                    break
+                header_len, body_len = RECORD_HEADER.unpack(prefix)
+                header = f.read(header_len)
+                body = f.read(body_len)
+                if len(header) < header_len or len(body) < body_len:
+                    logger.warning(f"Ignoring truncated record at the end of {self.path}")
+                    break
+                yield json.loads(header), body
+
+    def crawls(self) -> List[Tuple[str, List[Tuple[dict, bytes]]]]:
+        """Records grouped by crawl, newest crawl first, pages in fetch order."""
+        grouped = {}
+        for header, body in self.records():
+            grouped.setdefault(header["crawl"], []).append((header, body))
+        return sorted(grouped.items(), key=lambda item: item[0], reverse=True)
+
+
+def _reparse_worker(
+    base_url: str, parser: str, body: bytes, page_num: int
+) -> List[Comment]:
+    """Decompress and parse one archived page in a pool worker process."""
+    return _parse_page_worker(base_url, parser, zlib.decompress(body), page_num)
+
+
+def reparse(
+    archive: PageArchive,
+    scraper: FixedWigglypaintScraper,
+    csv_path: str = "wigglypaint_all_comments.csv",
+    jsonl_path: str = "wigglypaint_all_comments.jsonl",
+    workers: Optional[int] = None,
+    top_limit: int = 100,
+) -> dict:
+    """Rebuild the all-comments files from the archive; returns counts and top comments."""
+    start = time.monotonic()
+    records = [record for _, crawl in archive.crawls() for record in crawl]
+    logger.info(f"Re-parsing {len(records)} archived pages from {archive.path}")
+
+    seen = set()
+    top = TopImageComments(top_limit)
+    counts = {"pages": len(records), "total": 0, "unique": 0, "with_images": 0}
+
+    with CommentStreamWriter(csv_path, jsonl_path) as writer, ProcessPoolExecutor(
+        max_workers=workers
+    ) as pool:
+        pages = pool.map(
+            _reparse_worker,
+            [scraper.base_url] * len(records),
+            [scraper.parser] * len(records),
+            [body for _, body in records],
+            [header["page_num"] for header, _ in records],
+            chunksize=4,
+        )
+        for page_comments in pages:
+            unique = [c for c in page_comments if c.post_id not in seen]
+            seen.update(c.post_id for c in unique)
+            writer.write_page(unique)
+            for comment in unique:
+                top.add(comment)
+
+            counts["total"] += len(page_comments)
+            counts["unique"] += len(unique)
+            counts["with_images"] += sum(1 for c in unique if c.has_image)
+        writer.commit()
+
+    counts["seconds"] = time.monotonic() - start
+    counts["top"] = top.comments()
+    return counts
+
+
+def print_stats(archive: PageArchive):
+    crawls = archive.crawls()
+    if not crawls:
+        print(f"📭 {archive.path} has no pages")
+        return
+
+    size = os.path.getsize(archive.path)
+    raw = sum(len(zlib.decompress(body)) for _, pages in crawls for _, body in pages)
+    pages = sum(len(records) for _, records in crawls)
+    print(f"🗄️  {archive.path}: {pages} pages in {len(crawls)} crawls")
+    print(f"   {size / 1024:.0f} KB on disk, {raw / 1024:.0f} KB raw ({raw / size:.1f}x)")
+    for crawl, records in crawls:
+        print(f"   {crawl}: {len(records)} pages")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wigglypaint raw page archive")
+    parser.add_argument("command", choices=["stats", "reparse"])
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE, help="archive file")
+    parser.add_argument("--lxml", action="store_true", help="use the lxml post parser")
+    parser.add_argument("--workers", type=int, help="parse processes (default: all cores)")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive)
+    if args.command == "stats":
+        print_stats(archive)
+        return
+
+    scraper = FixedWigglypaintScraper(parser="lxml" if args.lxml else "html.parser")
+    results = reparse(archive, scraper, workers=args.workers)
+
+    print(f"\n♻️  **RE-PARSED {results['pages']} PAGES in {results['seconds']:.1f}s:**")
+    print(f"Total comments parsed: {results['total']}")
+    print(f"Unique comments: {results['unique']}")
+    print(f"Comments with images: {results['with_images']}")
+
+    top_comments = results["top"]
+    scraper.save_results(top_comments, "wigglypaint_top_comments.csv")
+    scraper.save_json_results(top_comments, "wigglypaint_top_comments.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Adaptive rate limiting and retries for polite crawling.
+
+AdaptiveRateLimiter is a token bucket whose rate moves with the server's
+answers:
+
+- every healthy response adds `increase` requests/second, up to `max_rate`
+- a 429 or 503 multiplies the rate by `decrease`, down to `min_rate`, and a
+  Retry-After header blocks every request until it has passed
+
+AdaptiveFetcher wraps a requests.Session with the limiter. Throttling, 5xx
+answers, timeouts and connection errors are retried on the same URL with
+jittered exponential backoff. Only a request that fails `max_retries` times,
+or gets another 4xx, raises. FetchStats records the latency and outcome of
+every attempt.
+"""
+
+import logging
+import random
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# The crawler's original fixed delay, used as the starting rate
+CRAWL_DELAY = 1.5
+
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """Token bucket that slows down on throttling and speeds up when healthy."""
+
+    def __init__(
+        self,
+        rate: float = 1 / CRAWL_DELAY,
+        burst: float = 1.0,
+        min_rate: float = 0.05,
+        max_rate: float = 2.0,
+        increase: float = 0.02,
+        decrease: float = 0.5,
+        slow_latency: float = 5.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        # Responses slower than this are not a reason to speed up
+        self.slow_latency = slow_latency
+
+        self.lock = threading.Lock()
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may start."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def on_success(self, latency: float):
+        if latency > self.slow_latency:
+            return
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class FetchStats:
+    """Latency and outcome of every request attempt"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.requests = 0
+        self.retries = 0
+        self.max_retries_used = 0
+        self.throttled = 0
+        self.errors = 0
+        self.failed = 0
+
+    def record_attempt(self, latency: Optional[float], throttled=False, error=False):
+        with self.lock:
+            if latency is not None:
+                self.latencies.append(latency)
+            self.throttled += throttled
+            self.errors += error
+
+    def record_request(self, retries: int, failed=False):
+        with self.lock:
+            self.requests += 1
+            self.retries += retries
+            self.max_retries_used = max(self.max_retries_used, retries)
+            self.failed += failed
+
+    def as_dict(self) -> dict:
+        with self.lock:
+            latencies = sorted(self.latencies)
+            summary = {
+                "requests": self.requests,
+                "attempts": len(latencies) + self.errors,
+                "retries": self.retries,
+                "max_retries_per_request": self.max_retries_used,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "failed": self.failed,
+            }
+        if latencies:
+            summary["median_latency_s"] = statistics.median(latencies)
+            summary["p95_latency_s"] = latencies[int(0.95 * (len(latencies) - 1))]
+            summary["max_latency_s"] = latencies[-1]
+        return summary
+
+    def report(self, limiter: Optional[AdaptiveRateLimiter] = None):
+        summary = self.as_dict()
+        if not summary["requests"]:
+            return
+        print(f"\n🚦 Requests: {summary['requests']} ({summary['attempts']} attempts)")
+        if "median_latency_s" in summary:
+            print(
+                f"   Latency: median {summary['median_latency_s']:.2f}s, "
+                f"p95 {summary['p95_latency_s']:.2f}s, max {summary['max_latency_s']:.2f}s"
+            )
+        print(
+            f"   Retries: {summary['retries']} (max {summary['max_retries_per_request']} "
+            f"for one request), throttled {summary['throttled']}, "
+            f"connection errors {summary['errors']}, gave up {summary['failed']}"
+        )
+        if limiter is not None:
+            print(f"   Final rate: {limiter.rate:.2f} requests/s")
+
+
+class AdaptiveFetcher:
+    """GET through an AdaptiveRateLimiter, retrying the same URL on transient failures"""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+    ):
+        self.session = session
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = FetchStats()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def get(self, url: str, timeout: float = 15) -> requests.Response:
+        """Successful response for url; raises once retries are exhausted."""
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.stats.record_attempt(None, error=True)
+                problem, retry_after, failure = str(e), None, e
+            else:
+                latency = time.monotonic() - start
+                status = response.status_code
+                throttled = status in THROTTLE_STATUSES
+                self.stats.record_attempt(latency, throttled=throttled)
+
+                if status not in RETRY_STATUSES:
+                    self.stats.record_request(attempt, failed=not response.ok)
+                    # Other 4xx answers will not change on a retry
+                    response.raise_for_status()
+                    self.limiter.on_success(latency)
+                    return response
+
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                if throttled:
+                    self.limiter.on_throttle(retry_after)
+                problem = f"HTTP {status}"
+                failure = requests.HTTPError(f"{status} for url: {url}", response=response)
+
+            if attempt >= self.max_retries:
+                self.stats.record_request(attempt, failed=True)
+                raise failure
+
+            attempt += 1
+            delay = self.backoff(attempt)
+            if retry_after is not None:
+                # Never retry early; on 429/503 the limiter also holds other requests
+                delay = max(delay, retry_after)
+            logger.warning(
+                f"{problem} for {url}, retry {attempt}/{self.max_retries} in {delay:.1f}s"
+            )
+            time.sleep(delay)
@@ -3,17 +3,26 @@
 Fixed Wigglypaint Comment Scraper with correct cursor-based pagination
 """
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
+from lxml import etree
 import time
 import re
 import json
+import html
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urljoin, urlparse, parse_qs
-from collections import namedtuple
+from collections import OrderedDict, deque, namedtuple
 import csv
-from typing import List, Optional
+import heapq
+from typing import Iterator, List, Optional, Tuple
 import logging
 
+from rate_limiter import AdaptiveFetcher
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -35,8 +44,152 @@ Comment = namedtuple(
 )
 
 
+# Cheap scans of the raw page, so the next request can start before parsing
+NEXT_PAGE_PATTERN = re.compile(r"<a\b([^>]*)>([^<]*)</a>", re.IGNORECASE)
+HREF_PATTERN = re.compile(r"""href\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+COMMUNITY_POST_PATTERN = re.compile(
+    r"""class\s*=\s*["'][^"']*\bcommunity_post\b""", re.IGNORECASE
+)
+
+# lxml engine: the patterns of the BeautifulSoup extractors, compiled once
+COMMUNITY_POST_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' community_post ')]"
+)
+VOTE_PATTERN = re.compile(r"\(([+-]?\d+)\)")
+VOTE_ONLY_PATTERN = re.compile(r"^\([+-]?\d+\)$")
+TIMESTAMP_PATTERNS = [
+    re.compile(r"\d+\s+(minute|hour|day|week|month)s?\s+ago", re.IGNORECASE),
+    re.compile(r"\d+[mhd]\s+ago", re.IGNORECASE),
+]
+VOTE_ARROWS = {"↑", "↓", "▲", "▼"}
+# BeautifulSoup's get_text() skips strings inside these tags
+HIDDEN_TEXT_TAGS = {"script", "style", "template"}
+
+PARSERS = ("html.parser", "lxml")
+
+_worker_scraper = None
+
+
+def _parse_page_worker(
+    base_url: str, parser: str, content: bytes, page_num: int
+) -> List[Comment]:
+    """Parse one page in a pool worker process."""
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = FixedWigglypaintScraper(parser)
+    # Image URLs are resolved against the crawling scraper's base URL
+    _worker_scraper.base_url = base_url
+    _worker_scraper.parser = parser
+    return _worker_scraper.parse_page(content, page_num)
+
+
+class _PostWalk:
+    """Single pass over a community_post subtree for the lxml engine.
+
+    Collects what the BeautifulSoup extractors find with separate searches: the
+    get_text() strings (for the timestamp and link/vote texts), every string of
+    the first post_body, the first profile link, images and vote spans.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.texts = []
+        self.body = []
+        self.in_body = False
+        self.body_done = False
+        self.links = 0
+        self.author = None
+        self.author_order = None
+        self.image_urls = []
+        self.upvotes = 0
+        self.downvotes = 0
+
+    def add(self, text: Optional[str], hidden: bool):
+        if text:
+            if not hidden:
+                self.texts.append(text)
+            if self.in_body:
+                self.body.append(text)
+
+    def visit(self, node, hidden: bool = False):
+        tag = node.tag
+        if not isinstance(tag, str):
+            # Comments: only find_all(string=True) in the post body sees them
+            if self.in_body and node.text:
+                self.body.append(node.text)
+            return
+
+        hidden = hidden or tag in HIDDEN_TEXT_TAGS
+        start = len(self.texts)
+        classes = node.get("class", "").split() if tag in ("div", "span") else ()
+
+        opened_body = False
+        if tag == "div" and not self.body_done and not self.in_body and "post_body" in classes:
+            self.in_body = opened_body = True
+        elif tag == "a":
+            order = self.links
+            self.links += 1
+        elif tag == "img":
+            src = node.get("src")
+            if src and "itch.zone" in src:
+                full_url = urljoin(self.base_url, src)
+                if full_url not in self.image_urls:
+                    self.image_urls.append(full_url)
+
+        self.add(node.text, hidden)
+        for child in node:
+            self.visit(child, hidden)
+            self.add(child.tail, hidden)
+
+        if opened_body:
+            self.in_body = False
+            self.body_done = True
+        elif tag == "a":
+            # The first profile link in document order wins
+            if self.author_order is None or order < self.author_order:
+                if "/profile/" in node.get("href", ""):
+                    text = "".join(t.strip() for t in self.texts[start:])
+                    if text:
+                        self.author = text
+                        self.author_order = order
+        elif tag == "span" and ("upvotes" in classes or "downvotes" in classes):
+            vote_match = VOTE_PATTERN.search("".join(t.strip() for t in self.texts[start:]))
+            if vote_match:
+                count = int(vote_match.group(1))
+                if "upvotes" in classes:
+                    self.upvotes = max(self.upvotes, count)
+                else:
+                    self.downvotes = max(self.downvotes, abs(count))
+
+    def content(self) -> str:
+        content_parts = []
+        for text in self.body:
+            text = text.strip()
+            if (
+                text
+                and len(text) > 2
+                and not VOTE_ONLY_PATTERN.match(text)
+                and "Reply" not in text
+                and "ago" not in text
+                and text not in VOTE_ARROWS
+            ):
+                content_parts.append(text)
+        return " ".join(content_parts).strip()
+
+    def timestamp(self) -> str:
+        post_text = "".join(self.texts)
+        for pattern in TIMESTAMP_PATTERNS:
+            match = pattern.search(post_text)
+            if match:
+                return match.group(0)
+        return ""
+
+
 class FixedWigglypaintScraper:
-    def __init__(self):
+    def __init__(self, parser: str = "html.parser"):
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser {parser!r}, expected one of {PARSERS}")
+        self.parser = parser
         self.base_url = "https://internet-janitor.itch.io/wigglypaint"
         self.session = requests.Session()
         self.session.headers.update(
@@ -44,6 +197,17 @@ class FixedWigglypaintScraper:
                 "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
         )
+        # Token-bucket rate limiting and retries for every page request
+        self.fetcher = AdaptiveFetcher(self.session)
+        # page_archive.PageArchive that keeps every fetched page, if set
+        self.archive = None
+        # Why the last crawl gave up before its natural end, if it did
+        self.crawl_error: Optional[str] = None
+
+    def archive_page(self, url: str, response, page_num: int):
+        """Append a fetched page to the archive, if one is set."""
+        if self.archive is not None:
+            self.archive.append(url, response.content, page_num)
 
     def extract_author_from_post(self, post_element) -> str:
         """Extract author from a community post."""
@@ -176,6 +340,69 @@ class FixedWigglypaintScraper:
 
         return comments
 
+    def parse_community_posts_lxml(self, root, page_num: int) -> List[Comment]:
+        """Parse community posts from an lxml tree, same results as parse_community_posts."""
+        comments = []
+
+        community_posts = COMMUNITY_POST_XPATH(root) if root is not None else []
+
+        logger.info(f"Found {len(community_posts)} community posts on page {page_num}")
+
+        for post in community_posts:
+            try:
+                walk = _PostWalk(self.base_url)
+                walk.visit(post)
+
+                comments.append(
+                    Comment(
+                        author=walk.author or "Anonymous",
+                        content=walk.content(),
+                        upvotes=walk.upvotes,
+                        downvotes=walk.downvotes,
+                        timestamp=walk.timestamp(),
+                        has_image=len(walk.image_urls) > 0,
+                        image_urls=walk.image_urls,
+                        page_num=page_num,
+                        post_id=post.get("id", "unknown"),
+                    )
+                )
+
+            except Exception as e:
+                logger.warning(f"Error parsing community post: {e}")
+                continue
+
+        return comments
+
+    def parse_page(self, content, page_num: int) -> List[Comment]:
+        """Parse the posts of a fetched page with the configured engine."""
+        if self.parser == "lxml":
+            # Decode exactly as BeautifulSoup would, then let libxml2 build the tree
+            if isinstance(content, bytes):
+                content = UnicodeDammit(content, is_html=True).unicode_markup
+            root = etree.fromstring(content, etree.HTMLParser()) if content else None
+            return self.parse_community_posts_lxml(root, page_num)
+
+        soup = BeautifulSoup(content, "html.parser")
+        return self.parse_community_posts(soup, page_num)
+
+    def find_next_page_url_raw(self, page_html: str) -> Optional[str]:
+        """Find the "Next page" cursor link in raw HTML without building a soup."""
+        for attributes, text in NEXT_PAGE_PATTERN.findall(page_html):
+            if "Next page" not in text:
+                continue
+            href = HREF_PATTERN.search(attributes)
+            if href and "before=" in href.group(1):
+                return html.unescape(href.group(1))
+        return None
+
+    def absolute_url(self, url: str) -> str:
+        """Resolve a pagination link against the site."""
+        if url.startswith("/"):
+            return f"https://internet-janitor.itch.io{url}"
+        if not url.startswith("http"):
+            return urljoin(self.base_url, url)
+        return url
+
     def find_next_page_url(self, soup) -> Optional[str]:
         """Find the URL for the next page using cursor-based pagination."""
         # Look for "Next page" link
@@ -190,11 +417,14 @@ class FixedWigglypaintScraper:
 
         return None
 
-    def scrape_all_comments_cursor(self, max_pages: int = 100) -> List[Comment]:
-        """Scrape comments using cursor-based pagination."""
+    def iter_comment_pages(
+        self, max_pages: int = 100
+    ) -> Iterator[Tuple[int, List[Comment]]]:
+        """Yield (page_num, comments) while following the cursor-based pagination."""
         logger.info(f"Starting cursor-based scraping (max {max_pages} pages)...")
 
-        all_comments = []
+        self.crawl_error = None
+        total = 0
         current_url = self.base_url
         page_num = 1
 
@@ -202,51 +432,165 @@ class FixedWigglypaintScraper:
             logger.info(f"Scraping page {page_num}: {current_url}")
 
             try:
-                response = self.session.get(current_url, timeout=15)
-                response.raise_for_status()
+                response = self.fetcher.get(current_url, timeout=15)
+                self.archive_page(current_url, response, page_num)
 
-                soup = BeautifulSoup(response.content, "html.parser")
-                page_comments = self.parse_community_posts(soup, page_num)
+                if self.parser == "lxml":
+                    soup = None
+                    page_comments = self.parse_page(response.content, page_num)
+                else:
+                    soup = BeautifulSoup(response.content, "html.parser")
+                    page_comments = self.parse_community_posts(soup, page_num)
 
                 if not page_comments:
                     logger.info(f"No comments found on page {page_num}, stopping")
                     break
 
-                all_comments.extend(page_comments)
+                total += len(page_comments)
                 logger.info(
-                    f"Page {page_num}: Found {len(page_comments)} comments (total: {len(all_comments)})"
+                    f"Page {page_num}: Found {len(page_comments)} comments (total: {total})"
                 )
+                yield page_num, page_comments
 
                 # Find next page URL
-                next_url = self.find_next_page_url(soup)
+                if soup is not None:
+                    next_url = self.find_next_page_url(soup)
+                else:
+                    next_url = self.find_next_page_url_raw(response.text)
 
                 if next_url:
-                    # Convert relative URL to absolute if needed
-                    if next_url.startswith("/"):
-                        current_url = f"https://internet-janitor.itch.io{next_url}"
-                    elif not next_url.startswith("http"):
-                        current_url = urljoin(self.base_url, next_url)
-                    else:
-                        current_url = next_url
-
+                    current_url = self.absolute_url(next_url)
                     page_num += 1
-
-                    # Rate limiting
-                    time.sleep(1.5)
                 else:
                     logger.info("No next page link found, reached end")
                     break
 
             except requests.RequestException as e:
-                logger.error(f"Error fetching page {page_num}: {e}")
+                logger.error(f"Giving up on page {page_num}: {e}")
+                self.crawl_error = f"page {page_num}: {e}"
                 break
             except Exception as e:
                 logger.error(f"Error parsing page {page_num}: {e}")
+                self.crawl_error = f"page {page_num}: {e}"
                 break
 
         logger.info(
-            f"Cursor-based scraping complete! Found {len(all_comments)} total comments across {page_num} pages"
+            f"Cursor-based scraping complete! Found {total} total comments across {page_num} pages"
         )
+
+    def scrape_all_comments_cursor(self, max_pages: int = 100) -> List[Comment]:
+        """Scrape comments using cursor-based pagination."""
+        all_comments = []
+        for _, page_comments in self.iter_comment_pages(max_pages):
+            all_comments.extend(page_comments)
+        return all_comments
+
+    def _submit_pages(self, pool, max_pages: int):
+        """Fetch pages at the polite rate and yield (page_num, parse future)."""
+        current_url = self.base_url
+        page_num = 1
+
+        while current_url and page_num <= max_pages:
+            logger.info(f"Fetching page {page_num}: {current_url}")
+            try:
+                response = self.fetcher.get(current_url, timeout=15)
+            except requests.RequestException as e:
+                logger.error(f"Giving up on page {page_num}: {e}")
+                self.crawl_error = f"page {page_num}: {e}"
+                return
+            self.archive_page(current_url, response, page_num)
+
+            page_html = response.text
+            if not COMMUNITY_POST_PATTERN.search(page_html):
+                logger.info(f"No comments found on page {page_num}, stopping")
+                return
+            yield page_num, pool.submit(
+                _parse_page_worker,
+                self.base_url,
+                self.parser,
+                response.content,
+                page_num,
+            )
+
+            next_url = self.find_next_page_url_raw(page_html)
+            if not next_url:
+                logger.info("No next page link found, reached end")
+                return
+            current_url = self.absolute_url(next_url)
+            page_num += 1
+
+    def iter_comment_pages_pipelined(
+        self, max_pages: int = 100, workers: int = 4
+    ) -> Iterator[Tuple[int, List[Comment]]]:
+        """Yield (page_num, comments) with fetching and parsing overlapped.
+
+        The next cursor is read from the raw HTML as soon as a page arrives and
+        the next request starts as soon as the rate limiter allows, while a
+        process pool parses the posts. Pages are
+        yielded in order as soon as they are parsed, and at most `workers`
+        pages wait in the pool. Results are the same, in the same order, as
+        iter_comment_pages().
+        """
+        logger.info(
+            f"Starting pipelined scraping (max {max_pages} pages, {workers} parse workers)..."
+        )
+        start = time.monotonic()
+        self.crawl_error = None
+        total = 0
+        pages = 0
+
+        def result(page_num, future) -> Optional[List[Comment]]:
+            # None where the sequential crawl would have stopped
+            try:
+                page_comments = future.result()
+            except Exception as e:
+                logger.error(f"Error parsing page {page_num}: {e}")
+                self.crawl_error = f"page {page_num}: {e}"
+                return None
+            if not page_comments:
+                logger.info(f"No comments found on page {page_num}, stopping")
+                return None
+            return page_comments
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            submitted = self._submit_pages(pool, max_pages)
+            while True:
+                page = next(submitted, None)
+                if page is not None:
+                    pending.append(page)
+                # Hand over parsed pages in order; wait once the pool is full
+                while pending and (
+                    page is None or pending[0][1].done() or len(pending) > workers
+                ):
+                    page_num, future = pending.popleft()
+                    page_comments = result(page_num, future)
+                    if page_comments is None:
+                        submitted.close()
+                        for _, queued in pending:
+                            queued.cancel()
+                        pending.clear()
+                        page = None
+                        break
+                    total += len(page_comments)
+                    pages += 1
+                    yield page_num, page_comments
+                if page is None:
+                    break
+
+        elapsed = time.monotonic() - start
+        logger.info(
+            f"Pipelined scraping complete! Found {total} total comments across "
+            f"{pages} pages in {elapsed:.1f}s"
+        )
+
+    def scrape_all_comments_pipelined(
+        self, max_pages: int = 100, workers: int = 4
+    ) -> List[Comment]:
+        """Scrape with fetching and parsing overlapped; see iter_comment_pages_pipelined()."""
+        all_comments = []
+        for _, page_comments in self.iter_comment_pages_pipelined(max_pages, workers):
+            all_comments.extend(page_comments)
         return all_comments
 
     def get_top_upvoted_with_images(
@@ -271,60 +615,16 @@ class FixedWigglypaintScraper:
         """Save results to CSV."""
         with open(filename, "w", newline="", encoding="utf-8") as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(
-                [
-                    "Author",
-                    "Content",
-                    "Upvotes",
-                    "Downvotes",
-                    "Timestamp",
-                    "Has_Image",
-                    "Image_Count",
-                    "Image_URLs",
-                    "Page_Number",
-                    "Post_ID",
-                ]
-            )
+            writer.writerow(CSV_HEADER)
 
             for comment in comments:
-                writer.writerow(
-                    [
-                        comment.author,
-                        (
-                            comment.content[:500] + "..."
-                            if len(comment.content) > 500
-                            else comment.content
-                        ),
-                        comment.upvotes,
-                        comment.downvotes,
-                        comment.timestamp,
-                        comment.has_image,
-                        len(comment.image_urls),
-                        ";".join(comment.image_urls),
-                        comment.page_num,
-                        comment.post_id,
-                    ]
-                )
+                writer.writerow(comment_to_row(comment))
 
         logger.info(f"Results saved to {filename}")
 
     def save_json_results(self, comments: List[Comment], filename: str):
         """Save results to JSON."""
-        data = []
-        for comment in comments:
-            data.append(
-                {
-                    "author": comment.author,
-                    "content": comment.content,
-                    "upvotes": comment.upvotes,
-                    "downvotes": comment.downvotes,
-                    "timestamp": comment.timestamp,
-                    "has_image": comment.has_image,
-                    "image_urls": comment.image_urls,
-                    "page_num": comment.page_num,
-                    "post_id": comment.post_id,
-                }
-            )
+        data = [comment_to_dict(comment) for comment in comments]
 
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
@@ -332,12 +632,233 @@ class FixedWigglypaintScraper:
         logger.info(f"JSON results saved to {filename}")
 
 
-def main():
-    scraper = FixedWigglypaintScraper()
+CSV_HEADER = [
+    "Author",
+    "Content",
+    "Upvotes",
+    "Downvotes",
+    "Timestamp",
+    "Has_Image",
+    "Image_Count",
+    "Image_URLs",
+    "Page_Number",
+    "Post_ID",
+]
+
+
+def comment_to_row(comment: Comment) -> list:
+    """CSV row of a comment, with the content cut at 500 characters."""
+    return [
+        comment.author,
+        (
+            comment.content[:500] + "..."
+            if len(comment.content) > 500
+            else comment.content
+        ),
+        comment.upvotes,
+        comment.downvotes,
+        comment.timestamp,
+        comment.has_image,
+        len(comment.image_urls),
+        ";".join(comment.image_urls),
+        comment.page_num,
+        comment.post_id,
+    ]
+
+
+def comment_to_dict(comment: Comment) -> dict:
+    """JSON object of a comment."""
+    return comment._asdict()
+
+
+class SeenPosts:
+    """The most recent `limit` post IDs, for deduplicating a crawl on the fly.
+
+    Duplicates come from neighbouring pages overlapping at the cursor, so a
+    window of recent IDs catches them without keeping every ID of the crawl.
+    """
+
+    def __init__(self, limit: int = 10000):
+        self.limit = limit
+        self.ids = OrderedDict()
+
+    def add(self, post_id: str) -> bool:
+        """Remember post_id; False if it was already seen."""
+        if post_id in self.ids:
+            self.ids.move_to_end(post_id)
+            return False
+        self.ids[post_id] = None
+        if len(self.ids) > self.limit:
+            self.ids.popitem(last=False)
+        return True
+
+
+class TopImageComments:
+    """Running top `limit` of comments with images.
+
+    Same order as get_top_upvoted_with_images(), including ties, but only
+    `limit` comments are held.
+    """
+
+    def __init__(self, limit: int = 100):
+        self.limit = limit
+        self.heap = []
+        self.count = 0
+
+    def add(self, comment: Comment):
+        if not comment.has_image:
+            return
+        self.count += 1
+        # -count keeps the earlier comment ahead on equal keys
+        entry = (
+            (comment.upvotes, -comment.downvotes, len(comment.image_urls), -self.count),
+            comment,
+        )
+        if len(self.heap) < self.limit:
+            heapq.heappush(self.heap, entry)
+        elif entry[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def comments(self) -> List[Comment]:
+        return [comment for _, comment in sorted(self.heap, reverse=True)]
+
+
+class CommentStreamWriter:
+    """Append pages of comments to CSV and/or JSONL files as they are scraped.
+
+    Pages go to "<path>.partial" files and are flushed once written, so an
+    interrupted crawl keeps every page before the failure without touching
+    the existing files. commit() moves the finished files into place.
+    """
+
+    def __init__(self, csv_path: Optional[str] = None, jsonl_path: Optional[str] = None):
+        self.files = []
+        self.paths = [path for path in (csv_path, jsonl_path) if path]
+        self.csv_writer = None
+        self.jsonl_file = None
+        self.written = 0
+        if csv_path:
+            csv_file = open(csv_path + ".partial", "w", newline="", encoding="utf-8")
+            self.files.append(csv_file)
+            self.csv_writer = csv.writer(csv_file)
+            self.csv_writer.writerow(CSV_HEADER)
+        if jsonl_path:
+            self.jsonl_file = open(jsonl_path + ".partial", "w", encoding="utf-8")
+            self.files.append(self.jsonl_file)
+
+    def write_page(self, comments: List[Comment]):
+        for comment in comments:
+            if self.csv_writer:
+                self.csv_writer.writerow(comment_to_row(comment))
+            if self.jsonl_file:
+                self.jsonl_file.write(
+                    json.dumps(comment_to_dict(comment), ensure_ascii=False) + "\n"
+                )
+        for f in self.files:
+            f.flush()
+        self.written += len(comments)
+
+    def close(self):
+        for f in self.files:
+            f.close()
+
+    def commit(self):
+        """Close the files and replace the previous outputs with them."""
+        self.close()
+        for path in self.paths:
+            os.replace(path + ".partial", path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def make_scraper(use_lxml: bool = False, archive: bool = True) -> FixedWigglypaintScraper:
+    """Scraper with the given parser engine, adding fetched pages to the page archive."""
+    scraper = FixedWigglypaintScraper(parser="lxml" if use_lxml else "html.parser")
+    if archive:
+        from page_archive import PageArchive
+
+        scraper.archive = PageArchive()
+    return scraper
+
+
+def iter_crawl(
+    scraper: FixedWigglypaintScraper, max_pages: int, pipelined: bool = False
+) -> Iterator[Tuple[int, List[Comment]]]:
+    """Pages of a sequential or pipelined crawl."""
+    if pipelined:
+        return scraper.iter_comment_pages_pipelined(max_pages=max_pages)
+    return scraper.iter_comment_pages(max_pages=max_pages)
+
+
+def crawl(
+    scraper: FixedWigglypaintScraper, max_pages: int, pipelined: bool = False
+) -> List[Comment]:
+    """Run a sequential or pipelined crawl."""
+    return [
+        comment for _, page in iter_crawl(scraper, max_pages, pipelined) for comment in page
+    ]
+
+
+def stream_full_scrape(
+    scraper: FixedWigglypaintScraper,
+    max_pages: int = 200,
+    csv_path: str = "wigglypaint_all_comments.csv",
+    jsonl_path: str = "wigglypaint_all_comments.jsonl",
+    top_limit: int = 100,
+    pipelined: bool = False,
+) -> dict:
+    """Crawl and write unique comments page by page; returns the counts.
+
+    Only the current page, the recent post IDs and the top comments are held
+    in memory, however many pages are crawled. The files are only replaced
+    when the crawl finishes; otherwise the pages it got stay in "*.partial".
+    """
+    seen = SeenPosts()
+    top = TopImageComments(top_limit)
+    counts = {"total": 0, "unique": 0, "with_images": 0}
+
+    with CommentStreamWriter(csv_path, jsonl_path) as writer:
+        for _, page_comments in iter_crawl(scraper, max_pages, pipelined):
+            unique = [c for c in page_comments if seen.add(c.post_id)]
+            writer.write_page(unique)
+            for comment in unique:
+                top.add(comment)
+
+            counts["total"] += len(page_comments)
+            counts["unique"] += len(unique)
+            counts["with_images"] += sum(1 for c in unique if c.has_image)
+
+        counts["complete"] = scraper.crawl_error is None
+        if counts["complete"]:
+            writer.commit()
+
+    counts["top"] = top.comments()
+    return counts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape the Wigglypaint community posts")
+    parser.add_argument("--full", action="store_true", help="crawl every page, not a 5-page test")
+    parser.add_argument(
+        "--pipelined", action="store_true", help="overlap fetching with parsing"
+    )
+    parser.add_argument("--lxml", action="store_true", help="use the lxml post parser")
+    parser.add_argument(
+        "--no-archive", action="store_true", help="do not add fetched pages to the page archive"
+    )
+    return parser.parse_args()
+
+
+def main(args):
+    scraper = make_scraper(use_lxml=args.lxml, archive=not args.no_archive)
 
     # Test with a few pages first
     print("🔧 Testing fixed scraper with cursor-based pagination...")
-    test_comments = scraper.scrape_all_comments_cursor(max_pages=5)
+    test_comments = crawl(scraper, max_pages=5, pipelined=args.pipelined)
 
     if not test_comments:
         logger.error("No comments found. Check the scraper logic.")
@@ -387,36 +908,27 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-
-    if "--full" in sys.argv:
-        scraper = FixedWigglypaintScraper()
+    args = parse_args()
+    if args.full:
+        scraper = make_scraper(use_lxml=args.lxml, archive=not args.no_archive)
         print("🚀 Running full scrape with corrected pagination...")
-        all_comments = scraper.scrape_all_comments_cursor(max_pages=200)
-
-        # Remove duplicates
-        unique_posts = {}
-        for comment in all_comments:
-            if comment.post_id not in unique_posts:
-                unique_posts[comment.post_id] = comment
+        results = stream_full_scrape(scraper, max_pages=200, pipelined=args.pipelined)
 
         print(f"\n📊 **FINAL RESULTS:**")
-        print(f"Total comments scraped: {len(all_comments)}")
-        print(f"Unique comments: {len(unique_posts)}")
-        print(
-            f"Comments with images: {len([c for c in unique_posts.values() if c.has_image])}"
-        )
+        print(f"Total comments scraped: {results['total']}")
+        print(f"Unique comments: {results['unique']}")
+        print(f"Comments with images: {results['with_images']}")
+        scraper.fetcher.stats.report(scraper.fetcher.limiter)
 
-        top_comments = scraper.get_top_upvoted_with_images(
-            list(unique_posts.values()), limit=100
-        )
+        if not results["complete"]:
+            print(f"❌ Crawl stopped early at {scraper.crawl_error}")
+            print("Previous files kept; the pages fetched are in *.partial")
+            sys.exit(1)
 
-        scraper.save_results(
-            list(unique_posts.values()), "wigglypaint_all_comments.csv"
-        )
+        top_comments = results["top"]
         scraper.save_results(top_comments, "wigglypaint_top_comments.csv")
         scraper.save_json_results(top_comments, "wigglypaint_top_comments.json")
 
         print(f"🎉 Fixed scraping complete!")
     else:
-        main()
+        main(args)